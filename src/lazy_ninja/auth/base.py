@@ -3,7 +3,10 @@
 import logging
 from typing import Any, Dict, Optional, cast
 
+from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+from django.contrib.auth.signals import user_login_failed
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, transaction
@@ -12,22 +15,9 @@ from django.utils import timezone as dj_timezone
 from ninja import NinjaAPI, Schema
 from ninja.errors import HttpError
 
-from .config import (
-    cookie_secure_flag,
-    get_login_fields,
-    get_token_lifetimes,
-    should_log_auth_events,
-    should_rotate_refresh,
-    should_set_cookies,
-    should_validate_password,
-    is_stateful,
-)
-from .hooks import (
-    on_login_hook,
-    on_register_hook,
-    on_refresh_hook,
-    on_logout_hook,
-)
+from .config import get_auth_settings
+from .hashing import get_hashing_executor
+from .throttling import get_rate_limiter
 from .tokens import (
     generate_token,
     decode_token,
@@ -41,6 +31,8 @@ from ..utils.type_guards import (
 
 logger = logging.getLogger(__name__)
 
+MODEL_BACKEND = "django.contrib.auth.backends.ModelBackend"
+
 
 def register_auth_routes(
     api: NinjaAPI,
@@ -53,6 +45,15 @@ def register_auth_routes(
     """
     Registers a full JWT-based authentication flow on the given NinjaAPI.
 
+    Password hashing done by login and register runs on the executor returned
+    by ``get_hashing_executor`` (inline unless ``HASHING_MAX_WORKERS`` is set).
+    With the pool enabled, login looks users up itself (``ModelBackend`` rules)
+    and only sends the password check to the pool; register saves the pooled
+    hash itself. Both fall back to inline hashing when other authentication
+    backends or a custom ``create_user`` are configured.
+    Login, register and refresh are throttled by ``RATE_LIMITS`` before any
+    hashing or user lookup happens.
+
     Endpoints added:
         POST /auth/login
         POST /auth/register
@@ -63,7 +64,6 @@ def register_auth_routes(
     auth_tags = tags or ["Auth"]
 
     User = get_user_model()
-    lifetimes = get_token_lifetimes()
 
     def _has_username_field() -> bool:
         return has_user_field(User, "username")
@@ -103,13 +103,14 @@ def register_auth_routes(
         return cast(dict, schema_instance.model_dump())
 
     def _apply_auth_cookies(response: HttpResponse, access: str, refresh: Optional[str]) -> None:
-        if not should_set_cookies():
+        cfg = get_auth_settings()
+        if not cfg.set_cookies:
             return
-        secure_flag = cookie_secure_flag()
+        secure_flag = cfg.cookie_secure
         response.set_cookie(
             access_cookie_name,
             access,
-            max_age=lifetimes["access"],
+            max_age=cfg.access_lifetime,
             httponly=True,
             secure=secure_flag,
             samesite="Lax",
@@ -119,22 +120,23 @@ def register_auth_routes(
             response.set_cookie(
                 refresh_cookie_name,
                 refresh,
-                max_age=lifetimes["refresh"],
+                max_age=cfg.refresh_lifetime,
                 httponly=True,
                 secure=secure_flag,
                 samesite="Lax",
             )
 
     def _clear_auth_cookies(response: HttpResponse) -> None:
-        if not should_set_cookies():
+        if not get_auth_settings().set_cookies:
             return
         response.delete_cookie(access_cookie_name, path=cookie_path)
         response.delete_cookie(refresh_cookie_name, path=cookie_path)
 
     def _build_auth_payload(user: Any, *, rotate_refresh: bool = True) -> dict:
-        access = generate_token(user, expires_in=lifetimes["access"], token_type="access")
+        cfg = get_auth_settings()
+        access = generate_token(user, expires_in=cfg.access_lifetime, token_type="access")
         refresh = (
-            generate_token(user, expires_in=lifetimes["refresh"], token_type="refresh")
+            generate_token(user, expires_in=cfg.refresh_lifetime, token_type="refresh")
             if rotate_refresh else None
         )
         return {
@@ -147,7 +149,7 @@ def register_auth_routes(
         return str(getattr(User, "USERNAME_FIELD", "username"))
 
     def _resolve_login_identifier(payload: LoginSchema) -> str:
-        login_fields = get_login_fields()
+        login_fields = get_auth_settings().login_fields
         if "login" in login_fields and payload.login:
             return payload.login
         if "email" in login_fields and payload.email:
@@ -165,7 +167,7 @@ def register_auth_routes(
         return identifier
 
     def _authenticate_user(request, identifier: str, password: str):
-        login_fields = get_login_fields()
+        login_fields = get_auth_settings().login_fields
         username_field = _get_username_field_name()
         user = authenticate(request, **{username_field: identifier}, password=password)
         if user or not has_user_field(User, "email"):
@@ -178,6 +180,72 @@ def register_auth_routes(
             return authenticate(request, email=identifier, password=password)
         return user
 
+    def _find_login_user(identifier: str) -> Optional[Any]:
+        login_fields = get_auth_settings().login_fields
+        username_field = _get_username_field_name()
+        try:
+            return User._default_manager.get_by_natural_key(identifier)  # type: ignore[attr-defined]
+        except User.DoesNotExist:  # type: ignore[attr-defined]
+            pass
+        if (
+            has_user_field(User, "email")
+            and "email" in login_fields
+            and username_field != "email"
+            and "@" in identifier
+        ):
+            return User.objects.filter(email__iexact=identifier).first()
+        return None
+
+    def _password_needs_upgrade(encoded: str) -> bool:
+        preferred = get_hasher("default")
+        try:
+            hasher = identify_hasher(encoded)
+        except ValueError:
+            return False
+        return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+    def _can_pool_login() -> bool:
+        """Only ``ModelBackend`` semantics are reimplemented by the pooled login."""
+        from django.contrib.auth.base_user import AbstractBaseUser
+
+        return (
+            list(settings.AUTHENTICATION_BACKENDS) == [MODEL_BACKEND]
+            and getattr(User, "check_password", None) is AbstractBaseUser.check_password
+        )
+
+    def _can_pool_register() -> bool:
+        """The pooled register mirrors the stock ``UserManager.create_user`` only."""
+        from django.contrib.auth.models import UserManager
+
+        manager = type(User.objects)
+        return all(
+            getattr(manager, name, None) is getattr(UserManager, name)
+            for name in ("create_user", "_create_user", "_create_user_object")
+        )
+
+    def _authenticate_user_pooled(request, identifier: str, password: str, hashing: Any):
+        """
+        Authenticate like ``ModelBackend`` with only the hashing on the pool.
+
+        User lookups stay on the request thread, inside the request's
+        connection and transaction; the pool threads never touch the database.
+        """
+        user = _find_login_user(identifier)
+        if user is None:
+            # Hash anyway so unknown identifiers take as long as wrong passwords.
+            hashing.run(make_password, password)
+        elif hashing.run(check_password, password, user.password) and getattr(user, "is_active", True):
+            if _password_needs_upgrade(user.password):
+                user.password = hashing.run(make_password, password)
+                user._lazy_ninja_password_upgraded = True
+            return user
+        user_login_failed.send(
+            sender=__name__,
+            credentials={_get_username_field_name(): identifier},
+            request=request,
+        )
+        return None
+
     def _token_from_request(request, expected_type: str) -> Optional[str]:
         cookie_val = (
             request.COOKIES.get(access_cookie_name)
@@ -205,6 +273,15 @@ def register_auth_routes(
             raise HttpError(401, "User not found.") from exc
         return user
 
+    def _throttled_response(request, retry_after: int) -> HttpResponse:
+        response = api.create_response(
+            request,
+            {"detail": "Too many requests. Try again later."},
+            status=429,
+        )
+        response["Retry-After"] = str(retry_after)
+        return response
+
     def _build_response(request, payload: dict, *, status: int = 200) -> HttpResponse:
         response = api.create_response(request, payload, status=status)
         _apply_auth_cookies(response, payload["access"], payload.get("refresh"))
@@ -212,10 +289,27 @@ def register_auth_routes(
 
     @api.post("/auth/login", response=AuthResponseSchema, tags=auth_tags, auth=None)
     def login(request, payload: LoginSchema):
+        cfg = get_auth_settings()
         identifier = _resolve_login_identifier(payload)
-        user = _authenticate_user(request, identifier, payload.password)
+
+        limiter = get_rate_limiter()
+        if limiter:
+            retry_after = (
+                limiter.check_failures(request, identifier)
+                or limiter.check(request, "login", identifier)
+            )
+            if retry_after:
+                return _throttled_response(request, retry_after)
+
+        hashing = get_hashing_executor()
+        if hashing.enabled and _can_pool_login():
+            user = _authenticate_user_pooled(request, identifier, payload.password, hashing)
+        else:
+            user = _authenticate_user(request, identifier, payload.password)
         if not user:
-            if should_log_auth_events():
+            if limiter:
+                limiter.record_failure(request, identifier)
+            if cfg.log_auth_events:
                 logger.warning(
                     "Failed login attempt for email: %s from IP: %s",
                     identifier,
@@ -223,10 +317,16 @@ def register_auth_routes(
                 )
             raise HttpError(401, "Invalid credentials.")
 
+        if limiter:
+            limiter.reset_failures(request, identifier)
+
         user.last_login = dj_timezone.now()  # type: ignore[attr-defined]
-        user.save(update_fields=["last_login"])
+        update_fields = ["last_login"]
+        if getattr(user, "_lazy_ninja_password_upgraded", False):
+            update_fields.append("password")
+        user.save(update_fields=update_fields)
 
-        if should_log_auth_events():
+        if cfg.log_auth_events:
             user_identifier = (
                 getattr(user, "email", None) or
                 getattr(user, "username", "unknown")
@@ -238,17 +338,23 @@ def register_auth_routes(
                 request.META.get("REMOTE_ADDR", "unknown")
             )
 
-        on_login = on_login_hook()
-        if on_login:
-            on_login(user=user, request=request)
+        if cfg.on_login:
+            cfg.on_login(user=user, request=request)
 
         return _build_response(request, _build_auth_payload(user))
 
     @api.post("/auth/register", response=AuthResponseSchema, tags=auth_tags, auth=None)
     def register(request, payload: RegisterSchema):
+        cfg = get_auth_settings()
         username_field = _get_username_field_name()
         identifier = _resolve_register_identifier(payload, username_field)
 
+        limiter = get_rate_limiter()
+        if limiter:
+            retry_after = limiter.check(request, "register")
+            if retry_after:
+                return _throttled_response(request, retry_after)
+
         normalized_email = ""
         if has_user_field(User, "email"):
             email_value = payload.email or (identifier if username_field == "email" else None)
@@ -263,18 +369,23 @@ def register_auth_routes(
         if _has_username_field() and User.objects.filter(username__iexact=username).exists():  # type: ignore
             raise HttpError(400, "Username already taken.")
 
-        if should_validate_password():
+        if cfg.validate_password:
             try:
                 validate_password(payload.password)
             except ValidationError as exc:
                 error_msg = "; ".join(exc.messages) if exc.messages else "Invalid password"
                 raise HttpError(400, f"Password validation failed: {error_msg}")
 
+        hashing = get_hashing_executor()
+        password_hash = (
+            hashing.run(make_password, payload.password)
+            if hashing.enabled and _can_pool_register()
+            else None
+        )
+
         try:
             with transaction.atomic():
-                user_kwargs: Dict[str, Any] = {
-                    "password": payload.password,
-                }
+                user_kwargs: Dict[str, Any] = {}
 
                 if has_user_field(User, "email"):
                     user_kwargs["email"] = normalized_email
@@ -288,18 +399,28 @@ def register_auth_routes(
                 if payload.last_name is not None and hasattr(User, "last_name"):
                     user_kwargs["last_name"] = payload.last_name
 
-                user = User.objects.create_user(**user_kwargs)  # type: ignore[misc]
+                if password_hash:
+                    # Already hashed on the pool: save once instead of letting
+                    # create_user hash again or follow up with an UPDATE.
+                    if _has_username_field():
+                        user_kwargs["username"] = User.normalize_username(username)  # type: ignore[attr-defined]
+                    user = User(**user_kwargs)
+                    user.password = password_hash
+                    user.save(using=User.objects.db)
+                else:
+                    user = User.objects.create_user(  # type: ignore[misc]
+                        password=payload.password, **user_kwargs
+                    )
 
-                if should_log_auth_events():
+                if cfg.log_auth_events:
                     logger.info(
                         "New user registered: %s from IP: %s",
                         get_user_identifier(user),
                         request.META.get("REMOTE_ADDR", "unknown")
                     )
 
-                on_register = on_register_hook()
-                if on_register:
-                    on_register(user=user, request=request)
+                if cfg.on_register:
+                    cfg.on_register(user=user, request=request)
 
         except IntegrityError as exc:
             logger.error("Registration integrity error: %s", str(exc))
@@ -309,6 +430,13 @@ def register_auth_routes(
 
     @api.post("/auth/refresh", response=TokenPairSchema, tags=auth_tags, auth=None)
     def refresh_token(request, payload: RefreshSchema):
+        cfg = get_auth_settings()
+        limiter = get_rate_limiter()
+        if limiter:
+            retry_after = limiter.check(request, "refresh")
+            if retry_after:
+                return _throttled_response(request, retry_after)
+
         token_source = payload.refresh or _token_from_request(request, expected_type="refresh")
         if not token_source:
             raise HttpError(401, "Renewal token missing.")
@@ -321,27 +449,26 @@ def register_auth_routes(
         except User.DoesNotExist as exc:  # type: ignore[attr-defined]
             raise HttpError(401, "User not found.") from exc
 
-        if is_stateful():
+        if cfg.stateful:
             blacklist_token_payload(data)
 
         token_pair = {
-            "access": generate_token(user, expires_in=lifetimes["access"], token_type="access"),
+            "access": generate_token(user, expires_in=cfg.access_lifetime, token_type="access"),
             "refresh": generate_token(
                 user,
-                expires_in=lifetimes["refresh"],
+                expires_in=cfg.refresh_lifetime,
                 token_type="refresh",
-            ) if should_rotate_refresh() else "",
+            ) if cfg.rotate_refresh else "",
         }
 
-        if should_log_auth_events():
+        if cfg.log_auth_events:
             logger.debug("Token refreshed for user ID: %s", user.id)  # type: ignore[attr-defined]
 
         response = api.create_response(request, token_pair, status=200)
         _apply_auth_cookies(response, token_pair["access"], token_pair["refresh"])
 
-        on_refresh = on_refresh_hook()
-        if on_refresh:
-            on_refresh(user=user, request=request)
+        if cfg.on_refresh:
+            cfg.on_refresh(user=user, request=request)
         return response
 
     @api.get("/auth/me", response=MeResponseSchema, tags=auth_tags)
@@ -351,8 +478,9 @@ def register_auth_routes(
 
     @api.post("/auth/logout", tags=auth_tags)
     def logout(request):
+        cfg = get_auth_settings()
         try:
-            if should_log_auth_events():
+            if cfg.log_auth_events:
                 token = _token_from_request(request, "access")
                 if token:
                     payload = decode_token(token, "access")
@@ -362,10 +490,10 @@ def register_auth_routes(
                         user_id,
                         request.META.get("REMOTE_ADDR", "unknown")
                     )
-                    if is_stateful():
+                    if cfg.stateful:
                         blacklist_token_payload(payload)
 
-            if is_stateful():
+            if cfg.stateful:
                 refresh_token_value = _token_from_request(request, "refresh")
                 if refresh_token_value:
                     refresh_payload = decode_token(refresh_token_value, "refresh")
@@ -376,7 +504,6 @@ def register_auth_routes(
         response = api.create_response(request, {"detail": "Logged out"}, status=200)
         _clear_auth_cookies(response)
 
-        on_logout = on_logout_hook()
-        if on_logout:
-            on_logout(request=request)
+        if cfg.on_logout:
+            cfg.on_logout(request=request)
         return response
\ No newline at end of file
@@ -1,8 +1,12 @@
 """Auth configuration helpers."""
 
-from typing import Any, Dict, Optional, Callable
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 
 def _auth_cfg() -> Dict[str, Any]:
@@ -21,74 +25,227 @@ def get_setting(keys: list[str], default: Any = None) -> Any:
     return default
 
 
+def _callable_setting(keys: list[str]) -> Optional[Callable[..., Any]]:
+    hook = get_setting(keys)
+    return hook if callable(hook) else None
+
+
+def _login_fields_setting() -> Tuple[str, ...]:
+    login_fields_setting = get_setting(["LOGIN_FIELDS"], ["username"])
+    if isinstance(login_fields_setting, (list, tuple, set)):
+        return tuple(str(field) for field in login_fields_setting)
+    return (str(login_fields_setting),)
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+@dataclass(frozen=True)
+class AuthSettings:
+    """
+    Immutable snapshot of the auth configuration.
+
+    Built once from ``LAZY_NINJA_AUTH`` and the Django settings fallbacks, and
+    rebuilt when Django sends ``setting_changed`` (``override_settings`` in
+    tests). Token and route code read attributes from it instead of resolving
+    every setting on each call.
+    """
+
+    jwt_secret: str
+    jwt_algorithm: str
+    jwt_issuer: str
+    jwt_audience: str
+    access_lifetime: int
+    refresh_lifetime: int
+    cookie_secure: bool
+    validate_password: bool
+    log_auth_events: bool
+    stateful: bool
+    blacklist_prefix: str
+    set_cookies: bool
+    rotate_refresh: bool
+    login_fields: Tuple[str, ...]
+    on_login: Optional[Callable[..., Any]] = None
+    on_register: Optional[Callable[..., Any]] = None
+    on_refresh: Optional[Callable[..., Any]] = None
+    on_logout: Optional[Callable[..., Any]] = None
+    hashing_max_workers: int = 0
+    hashing_queue_size: Optional[int] = None
+    hashing_timeout: Optional[float] = 30
+    rate_limits: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    rate_limit_backend: Any = "memory"
+    rate_limit_cache_alias: str = "default"
+    rate_limit_ip_header: Optional[str] = None
+    rate_limit_trusted_proxies: int = 1
+
+    @classmethod
+    def from_settings(cls) -> "AuthSettings":
+        rates = get_setting(["RATE_LIMITS"], {}) or {}
+        return cls(
+            jwt_secret=str(get_setting(["JWT_SECRET", "SECRET_KEY"]) or ""),
+            jwt_algorithm=get_setting(["JWT_ALGORITHM"], "HS256"),
+            jwt_issuer=str(get_setting(["JWT_ISS", "JWT_ISSUER"], "lazy-ninja")),
+            jwt_audience=str(get_setting(["JWT_AUD", "JWT_AUDIENCE"], "lazy-ninja-api")),
+            access_lifetime=int(get_setting(["JWT_ACCESS_EXP"], 60 * 60 * 24)),
+            refresh_lifetime=int(get_setting(["JWT_REFRESH_EXP"], 60 * 60 * 24 * 30)),
+            cookie_secure=bool(get_setting(["COOKIE_SECURE"], not getattr(settings, "DEBUG", False))),
+            validate_password=bool(get_setting(["VALIDATE_PASSWORD"], True)),
+            log_auth_events=bool(get_setting(["LOG_AUTH_EVENTS"], True)),
+            stateful=bool(get_setting(["STATEFUL"], False)),
+            blacklist_prefix=str(get_setting(["BLACKLIST_PREFIX"], "lazy_ninja:bl")),
+            set_cookies=bool(get_setting(["SET_COOKIES"], True)),
+            rotate_refresh=bool(get_setting(["ROTATE_REFRESH"], True)),
+            login_fields=_login_fields_setting(),
+            on_login=_callable_setting(["ON_LOGIN", "LOGIN_HOOK"]),
+            on_register=_callable_setting(["ON_REGISTER", "REGISTER_HOOK"]),
+            on_refresh=_callable_setting(["ON_REFRESH", "REFRESH_HOOK"]),
+            on_logout=_callable_setting(["ON_LOGOUT", "LOGOUT_HOOK"]),
+            hashing_max_workers=int(get_setting(["HASHING_MAX_WORKERS"], 0) or 0),
+            hashing_queue_size=_optional_int(get_setting(["HASHING_QUEUE_SIZE"])),
+            hashing_timeout=_optional_float(get_setting(["HASHING_TIMEOUT"], 30)),
+            rate_limits=MappingProxyType(
+                {str(scope): str(rate) for scope, rate in dict(rates).items()}
+            ),
+            rate_limit_backend=get_setting(["RATE_LIMIT_BACKEND"], "memory"),
+            rate_limit_cache_alias=str(get_setting(["RATE_LIMIT_CACHE_ALIAS"], "default")),
+            rate_limit_ip_header=get_setting(["RATE_LIMIT_IP_HEADER"]),
+            rate_limit_trusted_proxies=int(get_setting(["RATE_LIMIT_TRUSTED_PROXIES"], 1)),
+        )
+
+    @property
+    def token_lifetimes(self) -> Dict[str, int]:
+        return {"access": self.access_lifetime, "refresh": self.refresh_lifetime}
+
+
+_auth_settings: Optional[AuthSettings] = None
+
+
+def get_auth_settings() -> AuthSettings:
+    """Return the cached auth settings snapshot, building it on first use."""
+    global _auth_settings
+    snapshot = _auth_settings
+    if snapshot is None:
+        snapshot = _auth_settings = AuthSettings.from_settings()
+    return snapshot
+
+
+def reset_auth_settings() -> None:
+    """Drop the cached snapshot so the next read reflects current settings."""
+    global _auth_settings
+    _auth_settings = None
+
+
+@receiver(setting_changed)
+def _reset_auth_settings_on_change(**kwargs: Any) -> None:
+    # Any setting may be a fallback (SECRET_KEY, DEBUG, JWT_*), so reset on all.
+    reset_auth_settings()
+
+
 def get_jwt_secret() -> str:
     """Return the secret key used to sign JWTs."""
-    secret = get_setting(["JWT_SECRET", "SECRET_KEY"])
+    secret = get_auth_settings().jwt_secret
     if not secret:
         raise RuntimeError("JWT secret is not configured.")
-    return str(secret)
+    return secret
 
 
 def get_jwt_algorithm() -> str:
-    return get_setting(["JWT_ALGORITHM"], "HS256")
+    return get_auth_settings().jwt_algorithm
 
 
 def get_jwt_issuer() -> str:
-    return str(get_setting(["JWT_ISS", "JWT_ISSUER"], "lazy-ninja"))
+    return get_auth_settings().jwt_issuer
 
 
 def get_jwt_audience() -> str:
-    return str(get_setting(["JWT_AUD", "JWT_AUDIENCE"], "lazy-ninja-api"))
+    return get_auth_settings().jwt_audience
 
 
 def get_token_lifetimes() -> Dict[str, int]:
     """Return access and refresh token lifetimes in seconds."""
-    return {
-        "access": int(get_setting(["JWT_ACCESS_EXP"], 60 * 60 * 24)),
-        "refresh": int(get_setting(["JWT_REFRESH_EXP"], 60 * 60 * 24 * 30)),
-    }
+    return get_auth_settings().token_lifetimes
 
 
 def cookie_secure_flag() -> bool:
-    return bool(get_setting(["COOKIE_SECURE"], not getattr(settings, "DEBUG", False)))
+    return get_auth_settings().cookie_secure
 
 
 def should_validate_password() -> bool:
     """Check if password validation is enabled (default: True)."""
-    return bool(get_setting(["VALIDATE_PASSWORD"], True))
+    return get_auth_settings().validate_password
 
 
 def should_log_auth_events() -> bool:
     """Check if authentication events should be logged (default: True)."""
-    return bool(get_setting(["LOG_AUTH_EVENTS"], True))
+    return get_auth_settings().log_auth_events
 
 
 def is_stateful() -> bool:
     """Check if stateful token mode is enabled (default: False)."""
-    return bool(get_setting(["STATEFUL"], False))
+    return get_auth_settings().stateful
 
 
 def get_blacklist_prefix() -> str:
-    return str(get_setting(["BLACKLIST_PREFIX"], "lazy_ninja:bl"))
+    return get_auth_settings().blacklist_prefix
 
 
 def should_set_cookies() -> bool:
     """Check if auth endpoints should set cookies (default: True)."""
-    return bool(get_setting(["SET_COOKIES"], True))
+    return get_auth_settings().set_cookies
 
 
 def should_rotate_refresh() -> bool:
     """Check if refresh tokens should be rotated (default: True)."""
-    return bool(get_setting(["ROTATE_REFRESH"], True))
+    return get_auth_settings().rotate_refresh
 
 
 def get_auth_hook(keys: list[str]) -> Optional[Callable[..., Any]]:
-    hook = get_setting(keys)
-    return hook if callable(hook) else None
+    return _callable_setting(keys)
 
 
 def get_login_fields() -> list[str]:
-    login_fields_setting = get_setting(["LOGIN_FIELDS"], ["username"])
-    if isinstance(login_fields_setting, (list, tuple, set)):
-        return [str(field) for field in login_fields_setting]
-    return [str(login_fields_setting)]
+    return list(get_auth_settings().login_fields)
+
+
+def get_hashing_max_workers() -> int:
+    """Return the size of the password hashing pool (default: 0, hash inline)."""
+    return get_auth_settings().hashing_max_workers
+
+
+def get_hashing_queue_size() -> Optional[int]:
+    """Return how many hashing jobs may wait for a worker (default: pool size)."""
+    return get_auth_settings().hashing_queue_size
+
+
+def get_hashing_timeout() -> Optional[float]:
+    """Return how long a request waits for its hashing job (default: 30s)."""
+    return get_auth_settings().hashing_timeout
+
+
+def get_rate_limits() -> Dict[str, str]:
+    """Return auth rate limits by scope, e.g. {"login": "5/min"} (default: none)."""
+    return dict(get_auth_settings().rate_limits)
+
+
+def get_rate_limit_backend() -> Any:
+    """Return the rate limit backend: "memory", "cache", a dotted path or an instance."""
+    return get_auth_settings().rate_limit_backend
+
+
+def get_rate_limit_cache_alias() -> str:
+    return get_auth_settings().rate_limit_cache_alias
+
+
+def get_rate_limit_ip_header() -> Optional[str]:
+    """Return the META key holding the client IP (default: REMOTE_ADDR)."""
+    return get_auth_settings().rate_limit_ip_header
+
+
+def get_rate_limit_trusted_proxies() -> int:
+    """Return how many proxies append to the IP header (default: 1)."""
+    return get_auth_settings().rate_limit_trusted_proxies
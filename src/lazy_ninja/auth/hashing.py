@@ -0,0 +1,122 @@
+"""Bounded executor for password hashing done by the auth routes."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional, Tuple, Union
+
+from ninja.errors import HttpError
+
+from .config import AuthSettings, get_auth_settings
+
+
+class InlineHashingExecutor:
+    """Runs hashing work directly on the request worker (the default)."""
+
+    enabled = False
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+class PasswordHashingExecutor:
+    """
+    Runs password hashing on a bounded thread pool.
+
+    Django's PBKDF2 and Argon2 hashers release the GIL while hashing, so a
+    thread pool is enough to cap how much CPU concurrent logins can take.
+    At most ``max_workers`` jobs run at once and ``queue_size`` more may wait
+    for a worker; anything beyond that is rejected with HTTP 429 instead of
+    piling up on the workers that also serve the CRUD routes.
+    """
+
+    enabled = True
+
+    def __init__(self, max_workers: int, queue_size: int = 0, timeout: Optional[float] = None):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.queue_size = max(queue_size, 0)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.queue_size)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="lazy-ninja-hashing",
+        )
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run ``func`` on the pool and wait for its result.
+
+        Raises:
+            HttpError: 429 when the pool and its queue are full, 503 when the
+                job does not finish within the configured timeout.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise HttpError(429, "Too many authentication requests. Try again later.")
+
+        try:
+            future = self._pool.submit(func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError as exc:
+            raise HttpError(503, "Authentication is temporarily unavailable.") from exc
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+HashingExecutor = Union[InlineHashingExecutor, PasswordHashingExecutor]
+
+_executor_lock = threading.Lock()
+_executor: Optional[HashingExecutor] = None
+_executor_settings: Optional[AuthSettings] = None
+_executor_config: Optional[Tuple[Any, ...]] = None
+
+
+def _hashing_config(cfg: AuthSettings) -> Tuple[int, Optional[int], Optional[float]]:
+    return (cfg.hashing_max_workers, cfg.hashing_queue_size, cfg.hashing_timeout)
+
+
+def _build_executor(config: Tuple[int, Optional[int], Optional[float]]) -> HashingExecutor:
+    max_workers, queue_size, timeout = config
+    if max_workers <= 0:
+        return InlineHashingExecutor()
+    return PasswordHashingExecutor(
+        max_workers=max_workers,
+        queue_size=max_workers if queue_size is None else queue_size,
+        timeout=timeout,
+    )
+
+
+def get_hashing_executor() -> HashingExecutor:
+    """
+    Return the process-wide hashing executor for the current settings.
+
+    The executor is rebuilt when the hashing settings change, so tests using
+    ``override_settings`` get a pool matching their configuration.
+    """
+    global _executor, _executor_settings, _executor_config
+
+    cfg = get_auth_settings()
+    executor = _executor
+    if executor is not None and _executor_settings is cfg:
+        return executor
+
+    with _executor_lock:
+        config = _hashing_config(cfg)
+        if _executor is None or _executor_config != config:
+            previous = _executor
+            _executor = _build_executor(config)
+            _executor_config = config
+            if previous is not None:
+                previous.shutdown(wait=False)
+        _executor_settings = cfg
+        return _executor
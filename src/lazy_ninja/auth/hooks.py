@@ -2,20 +2,20 @@
 
 from typing import Any, Callable, Optional
 
-from .config import get_auth_hook
+from .config import get_auth_settings
 
 
 def on_login_hook() -> Optional[Callable[..., Any]]:
-    return get_auth_hook(["ON_LOGIN", "LOGIN_HOOK"])
+    return get_auth_settings().on_login
 
 
 def on_register_hook() -> Optional[Callable[..., Any]]:
-    return get_auth_hook(["ON_REGISTER", "REGISTER_HOOK"])
+    return get_auth_settings().on_register
 
 
 def on_refresh_hook() -> Optional[Callable[..., Any]]:
-    return get_auth_hook(["ON_REFRESH", "REFRESH_HOOK"])
+    return get_auth_settings().on_refresh
 
 
 def on_logout_hook() -> Optional[Callable[..., Any]]:
-    return get_auth_hook(["ON_LOGOUT", "LOGOUT_HOOK"])
+    return get_auth_settings().on_logout
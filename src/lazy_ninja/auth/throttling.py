@@ -0,0 +1,338 @@
+"""Rate limiting for the auth routes with pluggable counter backends."""
+
+import hashlib
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+from .config import AuthSettings, get_auth_settings
+
+RATE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*([a-z]+)\s*$")
+PERIODS = {
+    "s": 1, "sec": 1, "second": 1,
+    "m": 60, "min": 60, "minute": 60,
+    "h": 3600, "hour": 3600,
+    "d": 86400, "day": 86400,
+}
+KEY_PREFIX = "lazy_ninja:rl"
+
+
+def _key_part(value: str) -> str:
+    """Hash client-supplied key parts so keys stay short and memcached-safe."""
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """
+    Parse a rate string into ``(limit, window_seconds)``.
+
+    Examples:
+        "5/min" -> (5, 60)
+        "100/hour" -> (100, 3600)
+        "5/15m" -> (5, 900)
+    """
+    match = RATE_PATTERN.match(rate.lower())
+    if not match or match.group(3) not in PERIODS:
+        raise ValueError(f"Invalid rate limit: {rate!r}")
+    limit, multiplier, period = match.groups()
+    return int(limit), int(multiplier or 1) * PERIODS[period]
+
+
+class BaseRateLimitBackend(ABC):
+    """Counter storage used by ``AuthRateLimiter``."""
+
+    @abstractmethod
+    def count(self, key: str, window: int) -> int:
+        """Return the number of hits recorded for ``key`` within ``window`` seconds."""
+
+    @abstractmethod
+    def incr(self, key: str, window: int) -> None:
+        """Record a hit for ``key``."""
+
+    @abstractmethod
+    def reset(self, key: str, window: int) -> None:
+        """Forget all hits recorded for ``key``."""
+
+    def hit(self, key: str, limit: int, window: int) -> Optional[int]:
+        """
+        Record a hit unless ``key`` already reached ``limit``.
+
+        Returns:
+            None when the hit is allowed, otherwise seconds until retrying.
+        """
+        if self.count(key, window) >= limit:
+            return window
+        self.incr(key, window)
+        return None
+
+
+class InMemoryRateLimitBackend(BaseRateLimitBackend):
+    """
+    Sliding-window log kept in process memory.
+
+    Exact and cheap, but each process counts on its own; use the cache
+    backend when several processes or hosts serve the API.
+    """
+
+    sweep_every = 1000
+
+    def __init__(self):
+        self._hits: Dict[str, Tuple[int, Deque[float]]] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def _prune(self, hits: Deque[float], window: int, now: float) -> None:
+        cutoff = now - window
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+
+    def _sweep(self, now: float) -> None:
+        for key in list(self._hits):
+            window, hits = self._hits[key]
+            self._prune(hits, window, now)
+            if not hits:
+                del self._hits[key]
+
+    def count(self, key: str, window: int) -> int:
+        with self._lock:
+            entry = self._hits.get(key)
+            if entry is None:
+                return 0
+            self._prune(entry[1], window, time.monotonic())
+            return len(entry[1])
+
+    def incr(self, key: str, window: int) -> None:
+        with self._lock:
+            self._incr(key, window, time.monotonic())
+
+    def _incr(self, key: str, window: int, now: float) -> None:
+        entry = self._hits.get(key)
+        if entry is None:
+            entry = self._hits[key] = (window, deque())
+        entry[1].append(now)
+        self._calls += 1
+        if self._calls % self.sweep_every == 0:
+            self._sweep(now)
+
+    def reset(self, key: str, window: int) -> None:
+        with self._lock:
+            self._hits.pop(key, None)
+
+    def hit(self, key: str, limit: int, window: int) -> Optional[int]:
+        with self._lock:
+            now = time.monotonic()
+            entry = self._hits.get(key)
+            if entry is not None:
+                hits = entry[1]
+                self._prune(hits, window, now)
+                if len(hits) >= limit:
+                    return max(int(hits[0] + window - now) + 1, 1)
+            self._incr(key, window, now)
+            return None
+
+
+class CacheRateLimitBackend(BaseRateLimitBackend):
+    """
+    Sliding-window counter stored in a Django cache.
+
+    Keeps one counter per fixed window and weights the previous window by how
+    much of it still overlaps the sliding window, so memory per key is constant
+    and counters are shared by every process using the same cache.
+    """
+
+    def __init__(self, alias: str = "default"):
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def _bucket_keys(self, key: str, window: int, now: float) -> Tuple[str, str, float]:
+        bucket = int(now // window)
+        elapsed = (now - bucket * window) / window
+        return f"{key}:{bucket}", f"{key}:{bucket - 1}", elapsed
+
+    def count(self, key: str, window: int) -> int:
+        current_key, previous_key, elapsed = self._bucket_keys(key, window, time.time())
+        values = self.cache.get_many([current_key, previous_key])
+        previous = values.get(previous_key, 0) * (1 - elapsed)
+        return int(values.get(current_key, 0) + previous)
+
+    def incr(self, key: str, window: int) -> None:
+        current_key, _, _ = self._bucket_keys(key, window, time.time())
+        if not self.cache.add(current_key, 1, timeout=window * 2):
+            try:
+                self.cache.incr(current_key)
+            except ValueError:
+                self.cache.set(current_key, 1, timeout=window * 2)
+
+    def reset(self, key: str, window: int) -> None:
+        current_key, previous_key, _ = self._bucket_keys(key, window, time.time())
+        self.cache.delete_many([current_key, previous_key])
+
+    def hit(self, key: str, limit: int, window: int) -> Optional[int]:
+        # Increment first so concurrent hits each see their own count; a
+        # separate read followed by incr would let them all pass together.
+        now = time.time()
+        current_key, previous_key, elapsed = self._bucket_keys(key, window, now)
+        current = 1
+        if not self.cache.add(current_key, 1, timeout=window * 2):
+            try:
+                current = self.cache.incr(current_key)
+            except ValueError:
+                self.cache.set(current_key, 1, timeout=window * 2)
+        previous = self.cache.get(previous_key, 0) * (1 - elapsed)
+        if int(current - 1 + previous) < limit:
+            return None
+        try:
+            self.cache.decr(current_key)
+        except ValueError:
+            pass
+        return max(int((1 - elapsed) * window) + 1, 1)
+
+
+class AuthRateLimiter:
+    """
+    Applies the configured ``RATE_LIMITS`` to auth requests.
+
+    Every scope is counted per client IP and, when an identifier is given,
+    per identifier as well. The ``login_failures`` scope only counts failed
+    logins, which throttles password guessing against a single account.
+    """
+
+    def __init__(
+        self,
+        backend: BaseRateLimitBackend,
+        rates: Dict[str, Tuple[int, int]],
+        ip_header: Optional[str] = None,
+        trusted_proxies: int = 1,
+    ):
+        self.backend = backend
+        self.rates = rates
+        self.ip_header = ip_header
+        self.trusted_proxies = max(trusted_proxies, 1)
+
+    def get_client_ip(self, request: Any) -> str:
+        """
+        Return the client address used for per-IP limits.
+
+        Uses ``REMOTE_ADDR`` unless ``ip_header`` is set. Clients can prepend
+        anything to a forwarded header, so the address is taken from the right:
+        each of the ``trusted_proxies`` proxies appends one entry, and the
+        entry appended by the outermost one is the client it saw.
+        """
+        if self.ip_header:
+            forwarded = request.META.get(self.ip_header)
+            if forwarded:
+                addresses = [part.strip() for part in str(forwarded).split(",") if part.strip()]
+                if addresses:
+                    return addresses[-min(self.trusted_proxies, len(addresses))]
+        return str(request.META.get("REMOTE_ADDR", "unknown"))
+
+    def _keys(self, request: Any, scope: str, identifier: Optional[str]) -> list[str]:
+        keys = [f"{KEY_PREFIX}:{scope}:ip:{_key_part(self.get_client_ip(request))}"]
+        if identifier:
+            keys.append(f"{KEY_PREFIX}:{scope}:id:{_key_part(identifier.strip().lower())}")
+        return keys
+
+    def check(self, request: Any, scope: str, identifier: Optional[str] = None) -> Optional[int]:
+        """Count a request against ``scope``; return seconds to wait if throttled."""
+        rate = self.rates.get(scope)
+        if rate is None:
+            return None
+        limit, window = rate
+        for key in self._keys(request, scope, identifier):
+            retry_after = self.backend.hit(key, limit, window)
+            if retry_after is not None:
+                return retry_after
+        return None
+
+    def check_failures(self, request: Any, identifier: Optional[str]) -> Optional[int]:
+        """Return seconds to wait if too many logins failed recently, without counting."""
+        rate = self.rates.get("login_failures")
+        if rate is None:
+            return None
+        limit, window = rate
+        for key in self._keys(request, "login_failures", identifier):
+            if self.backend.count(key, window) >= limit:
+                return window
+        return None
+
+    def record_failure(self, request: Any, identifier: Optional[str]) -> None:
+        rate = self.rates.get("login_failures")
+        if rate is None:
+            return
+        for key in self._keys(request, "login_failures", identifier):
+            self.backend.incr(key, rate[1])
+
+    def reset_failures(self, request: Any, identifier: Optional[str]) -> None:
+        rate = self.rates.get("login_failures")
+        if rate is None or not identifier:
+            return
+        self.backend.reset(self._keys(request, "login_failures", identifier)[-1], rate[1])
+
+
+def build_rate_limit_backend(backend: Any, cache_alias: str = "default") -> BaseRateLimitBackend:
+    """Resolve the ``RATE_LIMIT_BACKEND`` setting into a backend instance."""
+    if isinstance(backend, BaseRateLimitBackend):
+        return backend
+    if backend in (None, "memory"):
+        return InMemoryRateLimitBackend()
+    if backend == "cache":
+        return CacheRateLimitBackend(cache_alias)
+    backend_cls = import_string(backend) if isinstance(backend, str) else backend
+    return backend_cls()
+
+
+_limiter_lock = threading.Lock()
+_limiter: Optional[AuthRateLimiter] = None
+_limiter_settings: Optional[AuthSettings] = None
+_limiter_config: Optional[Tuple[Any, ...]] = None
+
+
+def _rate_limit_config(cfg: AuthSettings) -> Tuple[Any, ...]:
+    backend = cfg.rate_limit_backend
+    return (
+        tuple(sorted(cfg.rate_limits.items())),
+        backend if isinstance(backend, str) else id(backend),
+        cfg.rate_limit_cache_alias,
+        cfg.rate_limit_ip_header,
+        cfg.rate_limit_trusted_proxies,
+    )
+
+
+def get_rate_limiter() -> Optional[AuthRateLimiter]:
+    """
+    Return the process-wide rate limiter, or None when no rates are configured.
+
+    Like the hashing executor, the limiter (and its in-memory counters) is
+    rebuilt only when the rate limit settings change.
+    """
+    global _limiter, _limiter_settings, _limiter_config
+
+    cfg = get_auth_settings()
+    if not cfg.rate_limits:
+        return None
+
+    limiter = _limiter
+    if limiter is not None and _limiter_settings is cfg:
+        return limiter
+
+    with _limiter_lock:
+        config = _rate_limit_config(cfg)
+        if _limiter is None or _limiter_config != config:
+            _limiter = AuthRateLimiter(
+                backend=build_rate_limit_backend(cfg.rate_limit_backend, cfg.rate_limit_cache_alias),
+                rates={scope: parse_rate(rate) for scope, rate in cfg.rate_limits.items()},
+                ip_header=cfg.rate_limit_ip_header,
+                trusted_proxies=cfg.rate_limit_trusted_proxies,
+            )
+            _limiter_config = config
+        _limiter_settings = cfg
+        return _limiter
@@ -9,39 +9,40 @@ from django.core.cache import cache
 from jwt import ExpiredSignatureError, PyJWTError
 from ninja.errors import HttpError
 
-from .config import (
-    get_jwt_secret,
-    get_jwt_algorithm,
-    get_jwt_issuer,
-    get_jwt_audience,
-    get_blacklist_prefix,
-    is_stateful,
-)
+from .config import AuthSettings, get_auth_settings
+
+
+def _signing_secret(cfg: AuthSettings) -> str:
+    if not cfg.jwt_secret:
+        raise RuntimeError("JWT secret is not configured.")
+    return cfg.jwt_secret
 
 
 def generate_token(user: Any, *, expires_in: int, token_type: str) -> str:
     """Generate JWT token for user."""
+    cfg = get_auth_settings()
     now = datetime.now(timezone.utc)
     payload = {
         "sub": str(user.id),  # type: ignore[attr-defined]
         "type": token_type,
         "iat": int(now.timestamp()),
         "exp": int((now + timedelta(seconds=expires_in)).timestamp()),
-        "iss": get_jwt_issuer(),
-        "aud": get_jwt_audience(),
+        "iss": cfg.jwt_issuer,
+        "aud": cfg.jwt_audience,
         "jti": uuid4().hex,
     }
-    return jwt.encode(payload, get_jwt_secret(), algorithm=get_jwt_algorithm())
+    return jwt.encode(payload, _signing_secret(cfg), algorithm=cfg.jwt_algorithm)
 
 
 def decode_raw_token(token: str) -> Dict[str, Any]:
+    cfg = get_auth_settings()
     try:
         payload = jwt.decode(
             token,
-            get_jwt_secret(),
-            algorithms=[get_jwt_algorithm()],
-            issuer=get_jwt_issuer(),
-            audience=get_jwt_audience(),
+            _signing_secret(cfg),
+            algorithms=[cfg.jwt_algorithm],
+            issuer=cfg.jwt_issuer,
+            audience=cfg.jwt_audience,
         )
     except ExpiredSignatureError as exc:
         raise HttpError(401, "Expired token.") from exc
@@ -55,7 +56,7 @@ def validate_token_payload(payload: Dict[str, Any], expected_type: str) -> None:
     if payload.get("type") != expected_type:
         raise HttpError(401, "Invalid token type.")
 
-    if is_stateful():
+    if get_auth_settings().stateful:
         jti = payload.get("jti")
         if not jti:
             raise HttpError(401, "Missing token identifier.")
@@ -79,7 +80,8 @@ def get_token_ttl(payload: Dict[str, Any]) -> int:
 
 
 def blacklist_key(jti: str) -> str:
-    return f"{get_blacklist_prefix()}:{get_jwt_issuer()}:{get_jwt_audience()}:{jti}"
+    cfg = get_auth_settings()
+    return f"{cfg.blacklist_prefix}:{cfg.jwt_issuer}:{cfg.jwt_audience}:{jti}"
 
 
 def is_token_blacklisted(jti: str) -> bool:
@@ -87,7 +89,7 @@ def is_token_blacklisted(jti: str) -> bool:
 
 
 def blacklist_token_payload(payload: Dict[str, Any]) -> None:
-    if not is_stateful():
+    if not get_auth_settings().stateful:
         return
     jti = payload.get("jti")
     if not jti:
@@ -1,11 +1,12 @@
 import asyncio
+import logging
 import inflect
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Set, Dict, List, Type, Union, Any, cast
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import connection
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
 from django.apps import apps
 
 from ninja import NinjaAPI
@@ -16,10 +17,13 @@ from .core import register_model_routes
 from .utils import generate_schema
 from .helpers import to_kebab_case
 from .pagination import get_pagination_strategy
+from .renderers import LazyNinjaJSONRenderer
 from .file_upload import FileUploadConfig, detect_file_fields
 from .auth import register_auth_routes, LazyNinjaAccessToken
 from .utils.type_guards import get_model_field_names, has_field
 
+logger = logging.getLogger(__name__)
+
 p = inflect.engine()
 
 class ExclusionConfig:
@@ -107,6 +111,20 @@ class DynamicAPI:
         auth_refresh_cookie_name: str = "lazy_ninja_refresh_token",
         auth_cookie_path: str = "/",
         auth_tags: Optional[List[str]] = None,
+        conditional_requests: bool = True,
+        cache_config: Optional[Dict[str, Union[bool, Dict[str, Any]]]] = None,
+        export_routes: bool = False,
+        aggregate_routes: bool = False,
+        import_routes: bool = False,
+        json_backend: Optional[str] = None,
+        trusted_output: bool = False,
+        lookup_field: Optional[Dict[str, str]] = None,
+        search_fields: Optional[Dict[str, Union[List[str], Dict[str, Any]]]] = None,
+        indexed_sort_only: bool = False,
+        read_db: Optional[Union[str, Dict[str, str]]] = None,
+        read_your_writes: int = 5,
+        database: Optional[Dict[str, str]] = None,
+        atomic_writes: Union[bool, List[str]] = False,
     ):
         """
         Initializes the DynamicAPI instance.
@@ -138,6 +156,43 @@ class DynamicAPI:
             auth_refresh_cookie_name: Name of the refresh token cookie.
             auth_cookie_path: Cookie path for auth cookies.
             auth_tags: Optional list of tags for auth endpoints.
+            conditional_requests: Send ETag/Last-Modified headers on list and detail
+                  routes and answer If-None-Match/If-Modified-Since with 304 (default: True).
+            cache_config: Dictionary enabling the read cache per model, either `True` for the
+                  defaults or an options dict (e.g., {"Country": {"timeout": 600, "backend": "local"}}).
+                  Options: backend ('django' or 'local'), alias, timeout, max_entries.
+            export_routes: Register a streaming `GET /<models>/export?format=ndjson|csv` route
+                  for each model (default: False).
+            aggregate_routes: Register a `GET /<models>/aggregate` route computing count/sum/avg/min/max,
+                  optionally grouped, in the database (default: False).
+            import_routes: Register a streaming `POST /<models>/import` route (NDJSON or CSV body)
+                  for each model with a create schema (default: False).
+            json_backend: Install Lazy Ninja's JSON renderer on the NinjaAPI using this backend:
+                  'auto' (orjson, then msgspec, then stdlib), 'orjson', 'msgspec' or 'json'.
+                  None (default) keeps the API's current renderer.
+            trusted_output: Skip response-model validation on routes whose output is produced by
+                  Lazy Ninja's serializer (generated schemas, no custom_response hook) and render
+                  it directly. The schemas are still published in OpenAPI (default: False).
+            lookup_field: Dictionary mapping model names to a unique field that the detail, update
+                  and delete routes look objects up by instead of the primary key
+                  (e.g., {"Product": "sku"} serves `/products/{sku}`).
+            search_fields: Dictionary enabling `?search=` on list and export routes per model, either a
+                  list of text fields (e.g., {"Product": ["name", "description"]}) or an options dict
+                  with fields, mode ('auto', 'fulltext', 'trigram', 'icontains'), config
+                  (Postgres text search config), vector_field and fts_table.
+            indexed_sort_only: Reject `sort` keys that do not lead a database index (primary key,
+                  unique, db_index, Meta.indexes or unique constraints) with 400, so clients cannot
+                  sort large tables by unindexed columns (default: False).
+            read_db: Database alias (e.g. a replica) that list, detail, export and aggregate routes
+                  read from, or a dictionary of aliases per model; writes keep Django's routing.
+                  None (default) leaves reads routed as usual.
+            read_your_writes: Seconds after a write during which the writing client reads from the
+                  primary, tracked with a cookie; clients can also send `X-Read-Primary: 1` (default: 5).
+            database: Dictionary mapping model names to the database alias all of their queries use
+                  (e.g., {"Event": "events"}). Models not listed follow `DATABASE_ROUTERS`.
+            atomic_writes: Run each create, update and delete, including its hooks and file relations,
+                  in one `transaction.atomic` block. `True` for every model or a list of model names
+                  (default: False). Hooks decorated with `@on_commit` run after the commit.
                
         Pagination Configuration:
             The pagination can be configured in three ways (in order of precedence):
@@ -168,18 +223,48 @@ class DynamicAPI:
         self.auth_refresh_cookie_name = auth_refresh_cookie_name
         self.auth_cookie_path = auth_cookie_path
         self.auth_tags = auth_tags
+        self.conditional_requests = conditional_requests
+        self.cache_config = cache_config or {}
+        self.export_routes = export_routes
+        self.aggregate_routes = aggregate_routes
+        self.import_routes = import_routes
+        self.trusted_output = trusted_output
+        self.lookup_field = lookup_field or {}
+        self.search_fields = search_fields or {}
+        self.indexed_sort_only = indexed_sort_only
+        self.read_db = read_db
+        self.database = database or {}
+        self.atomic_writes = atomic_writes
+        self.read_your_writes = read_your_writes
+
+        if json_backend is not None:
+            self.api.renderer = LazyNinjaJSONRenderer(json_backend)
 
         self._already_registered = False
         
     @staticmethod
-    def _get_existing_tables() -> List[str]:
-        """Get list of existing database tables.
-        
+    def _get_existing_tables() -> Set[str]:
+        """Get the existing tables across all configured databases.
+
+        Each alias is introspected at most once, default first, stopping as
+        soon as every model table has been found; aliases that cannot be
+        reached are skipped with a warning.
+
         Returns:
-            List of table names in the database.
+            Set of table names.
         """
-        with connection.cursor() as cursor:
-            return connection.introspection.table_names(cursor)
+        wanted = {model._meta.db_table for model in apps.get_models()}
+        found: Set[str] = set()
+        for alias in sorted(connections, key=lambda alias: alias != DEFAULT_DB_ALIAS):
+            if wanted <= found:
+                break
+            connection = connections[alias]
+            try:
+                with connection.cursor() as cursor:
+                    found.update(connection.introspection.table_names(cursor))
+            except DatabaseError as e:
+                logger.warning("Could not introspect database '%s': %s", alias, e)
+        return found
     
     def _register_all_models_sync(self) -> None:
         existing_tables = self._get_existing_tables()
@@ -266,7 +351,23 @@ class DynamicAPI:
                 file_upload_config=self.file_upload_config if model_file_fields else None,
                 use_multipart_create=use_multipart_create,
                 use_multipart_update=use_multipart_update,
-                is_async=getattr(self, 'is_async', True)
+                is_async=getattr(self, 'is_async', True),
+                conditional_requests=self.conditional_requests,
+                cache_config=self.cache_config.get(model_name),
+                export_routes=self.export_routes,
+                aggregate_routes=self.aggregate_routes,
+                import_routes=self.import_routes,
+                trusted_output=self.trusted_output,
+                lookup_field=self.lookup_field.get(model_name),
+                search_fields=self.search_fields.get(model_name),
+                indexed_sort_only=self.indexed_sort_only,
+                read_db=self.read_db.get(model_name) if isinstance(self.read_db, dict) else self.read_db,
+                database=self.database.get(model_name),
+                atomic_writes=(
+                    self.atomic_writes if isinstance(self.atomic_writes, bool)
+                    else model_name in self.atomic_writes
+                ),
+                read_your_writes=self.read_your_writes,
             )
             
     def register_all_models(self) -> None:
@@ -23,6 +23,19 @@ def register_model_routes(
     use_multipart_create: bool = False,
     use_multipart_update: bool = False,
     is_async: bool = True,
+    conditional_requests: bool = True,
+    cache_config: Optional[Any] = None,
+    export_routes: bool = False,
+    aggregate_routes: bool = False,
+    import_routes: bool = False,
+    trusted_output: bool = False,
+    lookup_field: Optional[str] = None,
+    search_fields: Optional[Any] = None,
+    indexed_sort_only: bool = False,
+    read_db: Optional[str] = None,
+    read_your_writes: int = 5,
+    database: Optional[str] = None,
+    atomic_writes: bool = False,
 ) -> None:
     """Register CRUD routes for a Django model using Django Ninja.
 
@@ -42,6 +55,26 @@ def register_model_routes(
         use_multipart_create: Whether to use multipart/form-data for create
         use_multipart_update: Whether to use multipart/form-data for update
         is_async: Whether to use async routes (default: True)
+        conditional_requests: Whether read routes send ETag/Last-Modified headers
+            and answer conditional requests with 304 (default: True)
+        cache_config: Read cache options for the model, or None to disable caching
+        export_routes: Whether to register GET /export (default: False)
+        aggregate_routes: Whether to register GET /aggregate (default: False)
+        import_routes: Whether to register POST /import (default: False)
+        trusted_output: Whether routes using generated schemas skip response
+            validation and render the serializer output directly (default: False)
+        lookup_field: Unique field used by the detail, update and delete routes
+            instead of the primary key (default: None)
+        search_fields: Text fields searched by the list route's ``search`` parameter,
+            or a search options dict (default: None, search disabled)
+        indexed_sort_only: Whether the list route only sorts by indexed fields (default: False)
+        read_db: Database alias used by the read routes, e.g. a replica (default: None)
+        read_your_writes: Seconds a client keeps reading from the primary after
+            a write, when read_db is set (default: 5)
+        database: Database alias for all of the model's queries; None follows
+            DATABASE_ROUTERS (default: None)
+        atomic_writes: Whether each create, update and delete, with its hooks and
+            file relations, runs in a single transaction (default: False)
     
     Example:
         >>> from myapp.models import User
@@ -69,6 +102,7 @@ def register_model_routes(
         create_schema=create_schema,
         update_schema=update_schema,
         pre_list=get_hook(controller, 'pre_list'),
+        post_list=get_hook(controller, 'post_list'),
         before_create=get_hook(controller, 'before_create'),
         after_create=get_hook(controller, 'after_create'),
         before_update=get_hook(controller, 'before_update'),
@@ -80,5 +114,18 @@ def register_model_routes(
         file_upload_config=file_upload_config,
         use_multipart_create=use_multipart_create,
         use_multipart_update=use_multipart_update,
-        is_async=is_async
+        is_async=is_async,
+        conditional_requests=conditional_requests,
+        cache_config=cache_config,
+        export_routes=export_routes,
+        aggregate_routes=aggregate_routes,
+        import_routes=import_routes,
+        trusted_output=trusted_output,
+        lookup_field=lookup_field,
+        search_fields=search_fields,
+        indexed_sort_only=indexed_sort_only,
+        read_db=read_db,
+        read_your_writes=read_your_writes,
+        database=database,
+        atomic_writes=atomic_writes,
     )
\ No newline at end of file
@@ -1,19 +1,18 @@
-from typing import Dict, Any, Optional
-import traceback
+from typing import Dict, Any, Optional, Tuple, Type
 import logging
-from django.conf import settings
+import threading
+import time
 
 from django.db import DatabaseError
 from django.core.exceptions import (
     ValidationError as DjangoValidationError,
     ObjectDoesNotExist,
+    PermissionDenied,
     SynchronousOnlyOperation,
 )
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 from ninja.errors import HttpError
-from colorama import Fore, Style, init
 
-init(autoreset=True) 
 logger = logging.getLogger(__name__)
 
 class LazyNinjaError(Exception):
@@ -64,41 +63,107 @@ class ConflictError(LazyNinjaError):
     status_code = 409
     default_message = "Resource conflict"
 
-def handle_exception(exc: Exception) -> JsonResponse:
-    if isinstance(exc, ObjectDoesNotExist) or "matches the given query" in str(exc):
-        error = NotFoundError(str(exc))
-
-    elif isinstance(exc, PermissionError) or "permission" in str(exc).lower():
-        error = PermissionDeniedError(str(exc))
-
-    elif isinstance(exc, DjangoValidationError) or isinstance(exc, ValueError):
-        error = ValidationError(str(exc))
-
-    elif isinstance(exc, DatabaseError):
-        error = DatabaseOperationError(str(exc))
-
-    elif isinstance(exc, SynchronousOnlyOperation):
-        error = SynchronousOperationError()
-
-    elif isinstance(exc, HttpError):
-        error = LazyNinjaError(str(exc), exc.status_code)
 
-    elif isinstance(exc, LazyNinjaError):
-        error = exc
-
-    else:
-        error = LazyNinjaError(str(exc))
-
-    print(
-        f"{Fore.RED + Style.BRIGHT}[LazyNinja ❌] {error.__class__.__name__}: "
-        f"{Fore.YELLOW}{error.message}"
+# Exception type -> Lazy Ninja error class. Lookups walk the exception's MRO,
+# so subclasses (e.g. Model.DoesNotExist) resolve to their closest entry.
+EXCEPTION_ERROR_MAP: Dict[Type[BaseException], Type[LazyNinjaError]] = {
+    ObjectDoesNotExist: NotFoundError,
+    Http404: NotFoundError,
+    PermissionError: PermissionDeniedError,
+    PermissionDenied: PermissionDeniedError,
+    DjangoValidationError: ValidationError,
+    ValueError: ValidationError,
+    DatabaseError: DatabaseOperationError,
+    SynchronousOnlyOperation: SynchronousOperationError,
+}
+
+_resolved_error_classes: Dict[type, Optional[Type[LazyNinjaError]]] = {}
+
+
+def _error_class_for(exc_type: type) -> Optional[Type[LazyNinjaError]]:
+    try:
+        return _resolved_error_classes[exc_type]
+    except KeyError:
+        pass
+    error_class = next(
+        (EXCEPTION_ERROR_MAP[base] for base in exc_type.__mro__ if base in EXCEPTION_ERROR_MAP),
+        None,
+    )
+    _resolved_error_classes[exc_type] = error_class
+    return error_class
+
+
+class ErrorLogLimiter:
+    """
+    Lets the first occurrence of an error through and suppresses repeats of it
+    for ``interval`` seconds; the next record reports how many were dropped.
+    """
+
+    def __init__(self, interval: float = 60.0):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._windows: Dict[Tuple[Any, ...], Tuple[float, int]] = {}
+
+    def allow(self, key: Tuple[Any, ...]) -> Tuple[bool, int]:
+        """Return whether to log ``key`` now and how many repeats were suppressed before it."""
+        now = time.monotonic()
+        with self._lock:
+            started, suppressed = self._windows.get(key, (None, 0))
+            if started is not None and now - started < self.interval:
+                self._windows[key] = (started, suppressed + 1)
+                return False, 0
+            self._windows[key] = (now, 0)
+            return True, suppressed
+
+
+error_log_limiter = ErrorLogLimiter()
+
+
+def to_lazy_ninja_error(exc: Exception) -> LazyNinjaError:
+    """Convert an exception into the LazyNinjaError that describes its response."""
+    if isinstance(exc, LazyNinjaError):
+        return exc
+    if isinstance(exc, HttpError):
+        return LazyNinjaError(str(exc), exc.status_code)
+    error_class = _error_class_for(type(exc))
+    if error_class is SynchronousOperationError:
+        return SynchronousOperationError()
+    if error_class is not None:
+        return error_class(str(exc))
+    return LazyNinjaError(str(exc))
+
+
+def log_exception(exc: Exception, error: LazyNinjaError) -> None:
+    """
+    Log a handled exception.
+
+    Client errors are logged at DEBUG, server errors at ERROR with the
+    traceback. Nothing is formatted unless the record will be emitted, and
+    repeats of the same error type and status are rate limited.
+    """
+    server_error = error.status_code >= 500
+    level = logging.ERROR if server_error else logging.DEBUG
+    if not logger.isEnabledFor(level):
+        return
+    allowed, suppressed = error_log_limiter.allow((type(exc), error.status_code))
+    if not allowed:
+        return
+    logger.log(
+        level,
+        "%s (%s): %s%s",
+        error.__class__.__name__,
+        error.status_code,
+        error.message,
+        f" [{suppressed} similar suppressed]" if suppressed else "",
+        exc_info=exc if server_error else None,
     )
-    
-    if getattr(settings, "DEBUG", False):
-        print(Fore.LIGHTBLACK_EX + traceback.format_exc())
 
+
+def handle_exception(exc: Exception) -> JsonResponse:
+    error = to_lazy_ninja_error(exc)
+    log_exception(exc, error)
     return JsonResponse(error.to_dict(), status=error.status_code)
 
 
 async def handle_exception_async(exc: Exception) -> JsonResponse:
-    return handle_exception(exc)
\ No newline at end of file
+    return handle_exception(exc)
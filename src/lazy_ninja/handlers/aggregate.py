@@ -0,0 +1,133 @@
+"""Database-side aggregation for generated model routes."""
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from asgiref.sync import sync_to_async
+from django.db import models
+from django.db.models import Aggregate, Avg, Count, Max, Min, QuerySet, Sum
+from ninja import Schema
+from pydantic import BaseModel
+
+from ..errors import BadRequestError
+from ..helpers import FieldIndex
+from ..utils import get_pydantic_type
+
+AGGREGATE_FUNCTIONS: Dict[str, Type[Aggregate]] = {
+    "count": Count,
+    "sum": Sum,
+    "avg": Avg,
+    "min": Min,
+    "max": Max,
+}
+NUMERIC_FUNCTIONS = ("sum", "avg")
+NUMERIC_TYPES = (int, float, Decimal)
+DEFAULT_MAX_GROUPS = 1000
+
+
+class AggregateResult(Schema):
+    results: List[Dict[str, Any]]
+
+
+def _split(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+class BaseAggregateHandler:
+    """
+    Translates aggregate query parameters into a single database query.
+
+    ``group_by`` becomes ``values(...)`` and every requested function an
+    annotation, so ``?group_by=status&sum=amount&count=*`` runs as one
+    ``GROUP BY`` query. Without ``group_by`` the whole (filtered) table is
+    aggregated into a single row. Result keys are ``count`` for ``count=*``
+    and ``<function>_<field>`` otherwise.
+
+    Only fields of ``schema`` (the list schema) can be grouped or aggregated,
+    so the route exposes nothing the list route hides. A grouped query
+    yielding more than ``max_groups`` rows is rejected.
+    """
+
+    def __init__(
+        self,
+        model: Type[models.Model],
+        field_index: FieldIndex,
+        schema: Type[BaseModel],
+        max_groups: int = DEFAULT_MAX_GROUPS,
+    ):
+        self.model = model
+        self.field_index = field_index
+        self.max_groups = max_groups
+        exposed = {
+            name: field for name, field in field_index.fields.items()
+            if name in schema.model_fields
+        }
+        self.comparable_fields = {
+            name for name, field in exposed.items()
+            if not isinstance(field, models.FileField)
+        }
+        self.numeric_fields = {
+            name for name, field in exposed.items()
+            if not field.is_relation and get_pydantic_type(field) in NUMERIC_TYPES
+        }
+
+    def build(
+        self,
+        group_by: Optional[str] = None,
+        **functions: Optional[str],
+    ) -> Tuple[List[str], Dict[str, Aggregate]]:
+        """Validate the requested groups and functions against the model's fields."""
+        groups = _split(group_by)
+        for name in groups:
+            if name not in self.comparable_fields:
+                raise BadRequestError(f"Cannot group by '{name}'")
+
+        aggregates: Dict[str, Aggregate] = {}
+        for function, fields in functions.items():
+            for name in _split(fields):
+                if function == "count" and name == "*":
+                    aggregates["count"] = Count("pk")
+                    continue
+                allowed = self.numeric_fields if function in NUMERIC_FUNCTIONS else self.comparable_fields
+                if name not in allowed:
+                    raise BadRequestError(f"Cannot compute {function} of '{name}'")
+                aggregates[f"{function}_{name}"] = AGGREGATE_FUNCTIONS[function](name)
+
+        if not aggregates:
+            aggregates["count"] = Count("pk")
+        return groups, aggregates
+
+    def fetch(
+        self,
+        queryset: QuerySet,
+        groups: List[str],
+        aggregates: Dict[str, Aggregate],
+    ) -> List[Dict[str, Any]]:
+        if not groups:
+            return [queryset.aggregate(**aggregates)]
+        # order_by() also replaces Meta.ordering, which would otherwise join the GROUP BY.
+        grouped = queryset.values(*groups).annotate(**aggregates).order_by(*groups)
+        rows = list(grouped[:self.max_groups + 1])
+        if len(rows) > self.max_groups:
+            raise BadRequestError(
+                f"Aggregation yields more than {self.max_groups} groups; narrow the filter or group_by"
+            )
+        return rows
+
+
+class SyncAggregateHandler(BaseAggregateHandler):
+    """Aggregate handler for sync routes."""
+
+    def run(self, queryset: QuerySet, group_by: Optional[str] = None, **functions: Optional[str]) -> AggregateResult:
+        groups, aggregates = self.build(group_by, **functions)
+        return AggregateResult(results=self.fetch(queryset, groups, aggregates))
+
+
+class AsyncAggregateHandler(BaseAggregateHandler):
+    """Aggregate handler for async routes; the query runs in a worker thread."""
+
+    async def run(self, queryset: QuerySet, group_by: Optional[str] = None, **functions: Optional[str]) -> AggregateResult:
+        groups, aggregates = self.build(group_by, **functions)
+        rows = await sync_to_async(self.fetch)(queryset, groups, aggregates)
+        return AggregateResult(results=rows)
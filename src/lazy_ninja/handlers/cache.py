@@ -0,0 +1,236 @@
+"""Opt-in read cache for generated list and detail routes."""
+import hashlib
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Type, Union
+
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from pydantic import BaseModel
+
+CacheEntry = Dict[str, Any]
+CacheConfig = Union[bool, Dict[str, Any]]
+
+DEFAULT_TIMEOUT = 300
+DEFAULT_MAX_ENTRIES = 1024
+KEY_PREFIX = "lazy_ninja:read"
+
+
+class LocalLRUCacheBackend:
+    """
+    Process-local LRU cache with per-entry expiry.
+
+    Invalidation only reaches the worker that saw the write; other workers
+    keep serving their entries until they expire.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, timeout: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def aget(self, key: str) -> Any:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, timeout: Optional[float] = None) -> None:
+        self.set(key, value, timeout)
+
+
+class DjangoCacheBackend:
+    """Adapter over a configured Django cache alias."""
+
+    def __init__(self, alias: str = "default"):
+        self.alias = alias
+
+    @property
+    def cache(self) -> Any:
+        return caches[self.alias]
+
+    def get(self, key: str) -> Any:
+        return self.cache.get(key)
+
+    def set(self, key: str, value: Any, timeout: Optional[float] = None) -> None:
+        self.cache.set(key, value, timeout)
+
+    async def aget(self, key: str) -> Any:
+        return await self.cache.aget(key)
+
+    async def aset(self, key: str, value: Any, timeout: Optional[float] = None) -> None:
+        await self.cache.aset(key, value, timeout)
+
+
+def _new_generation() -> str:
+    return os.urandom(8).hex()
+
+
+def _auth_scope(request: Any) -> str:
+    """Identify who the response was rendered for, so users never share entries."""
+    principal = getattr(request, "auth", None)
+    if principal is None:
+        user = getattr(request, "user", None)
+        if user is not None and getattr(user, "is_authenticated", False):
+            principal = user
+    if principal is None:
+        return "anon"
+    pk = getattr(principal, "pk", None)
+    if pk is not None:
+        return f"{type(principal).__name__}:{pk}"
+    return hashlib.blake2b(repr(principal).encode(), digest_size=8).hexdigest()
+
+
+_tracked_caches: Dict[str, "weakref.WeakSet[ModelReadCache]"] = {}
+_tracked_lock = threading.Lock()
+
+
+def _on_model_change(sender: Any, using: Optional[str] = None, **kwargs: Any) -> None:
+    """
+    Invalidate every read cache of ``sender`` once the write commits.
+
+    Bumping the generation while the writer's transaction is still open would
+    let a concurrent reader cache the old rows under the new generation.
+    """
+    tracked = _tracked_caches.get(sender._meta.label_lower)
+    if not tracked:
+        return
+
+    def invalidate() -> None:
+        for read_cache in list(tracked):
+            read_cache.invalidate()
+
+    transaction.on_commit(invalidate, using=using)
+
+
+def _track(read_cache: "ModelReadCache") -> None:
+    """Register a cache for signal invalidation with one receiver per model."""
+    with _tracked_lock:
+        _tracked_caches.setdefault(read_cache.label, weakref.WeakSet()).add(read_cache)
+    dispatch_uid = f"{KEY_PREFIX}:{read_cache.label}"
+    post_save.connect(_on_model_change, sender=read_cache.model, dispatch_uid=dispatch_uid)
+    post_delete.connect(_on_model_change, sender=read_cache.model, dispatch_uid=dispatch_uid)
+
+
+class ModelReadCache:
+    """
+    Caches serialized read responses for one model.
+
+    Entries are keyed by route, sorted query string and auth scope. Every key
+    also embeds the model's current generation token; ``invalidate`` swaps the
+    token, which orphans all previous entries at once without having to track
+    them. The token is replaced when a ``post_save``/``post_delete`` of the
+    model commits and after writes through the generated routes.
+    """
+
+    def __init__(
+        self,
+        model: Type[models.Model],
+        backend: Union[LocalLRUCacheBackend, DjangoCacheBackend],
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ):
+        self.model = model
+        self.backend = backend
+        self.timeout = timeout
+        self.label = model._meta.label_lower
+        self.generation_key = f"{KEY_PREFIX}:{self.label}:generation"
+        _track(self)
+
+    def _entry_key(self, request: Any, kind: str, generation: str) -> str:
+        query = "&".join(sorted(request.GET.urlencode().split("&"))) if request.GET else ""
+        raw = "|".join((kind, request.path, query, _auth_scope(request)))
+        digest = hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+        return f"{KEY_PREFIX}:{self.label}:{generation}:{digest}"
+
+    def _generation(self) -> str:
+        generation = self.backend.get(self.generation_key)
+        if generation is None:
+            generation = _new_generation()
+            self.backend.set(self.generation_key, generation, None)
+        return generation
+
+    async def _ageneration(self) -> str:
+        generation = await self.backend.aget(self.generation_key)
+        if generation is None:
+            generation = _new_generation()
+            await self.backend.aset(self.generation_key, generation, None)
+        return generation
+
+    def get(self, request: Any, kind: str) -> Optional[CacheEntry]:
+        return self.backend.get(self._entry_key(request, kind, self._generation()))
+
+    def set(self, request: Any, kind: str, entry: CacheEntry) -> None:
+        self.backend.set(self._entry_key(request, kind, self._generation()), entry, self.timeout)
+
+    async def aget(self, request: Any, kind: str) -> Optional[CacheEntry]:
+        return await self.backend.aget(self._entry_key(request, kind, await self._ageneration()))
+
+    async def aset(self, request: Any, kind: str, entry: CacheEntry) -> None:
+        key = self._entry_key(request, kind, await self._ageneration())
+        await self.backend.aset(key, entry, self.timeout)
+
+    def invalidate(self) -> None:
+        self.backend.set(self.generation_key, _new_generation(), None)
+
+    async def ainvalidate(self) -> None:
+        await self.backend.aset(self.generation_key, _new_generation(), None)
+
+
+def dump_for_cache(schema: Type[BaseModel], data: Any) -> Any:
+    """Convert a model instance or schema object into plain data the cache can store."""
+    if isinstance(data, models.Model):
+        return schema.model_validate(data, from_attributes=True).model_dump(mode="json")
+    if isinstance(data, BaseModel):
+        return data.model_dump(mode="json")
+    return data
+
+
+def build_read_cache(model: Type[models.Model], config: Optional[CacheConfig]) -> Optional[ModelReadCache]:
+    """
+    Build the read cache for a model from its ``cache_config`` entry.
+
+    ``config`` is ``True`` for the defaults or a dict with any of:
+    ``backend`` (``"django"`` or ``"local"``), ``alias`` (Django cache alias,
+    default ``"default"``), ``timeout`` (seconds, default 300, ``None`` for no
+    expiry) and ``max_entries`` (local backend only, default 1024).
+
+    The local backend is per process: a write invalidates it only in the
+    worker that handled it, so other workers may serve stale entries for up
+    to ``timeout``.
+    """
+    if not config:
+        return None
+    options: Dict[str, Any] = config if isinstance(config, dict) else {}
+
+    backend_name = options.get("backend", "django")
+    if backend_name == "local":
+        backend: Union[LocalLRUCacheBackend, DjangoCacheBackend] = LocalLRUCacheBackend(
+            options.get("max_entries", DEFAULT_MAX_ENTRIES)
+        )
+    elif backend_name == "django":
+        backend = DjangoCacheBackend(options.get("alias", "default"))
+    else:
+        raise ValueError(f"Unknown cache backend '{backend_name}'. Use 'django' or 'local'.")
+
+    return ModelReadCache(model, backend, timeout=options.get("timeout", DEFAULT_TIMEOUT))
@@ -0,0 +1,135 @@
+"""Conditional GET support (ETag / Last-Modified) for generated read routes."""
+import hashlib
+import json
+from typing import Any, Iterable, Optional, Tuple, Type
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from ..utils import serialize_model_instance
+
+VERSION_FIELD_NAMES = ("version", "updated_at", "modified_at", "last_modified")
+
+Validators = Tuple[Optional[str], Optional[int]]
+
+
+class _PayloadEncoder(DjangoJSONEncoder):
+    """JSON encoder for hashing payloads; falls back to ``str`` for files and the like."""
+
+    def default(self, o: Any) -> Any:
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+def _weak_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\x1f")
+    return f'W/"{digest.hexdigest()}"'
+
+
+class ConditionalRequestHandler:
+    """
+    Computes validators for read responses and answers conditional requests.
+
+    When the model has a cheap version column (``version``, ``updated_at``,
+    ``modified_at`` or ``last_modified``) the ETag is derived from the primary
+    key and that column, so a matching ``If-None-Match`` is answered with 304
+    before the instance is serialized. Otherwise the ETag is a hash of the
+    serialized payload.
+    """
+
+    def __init__(self, model: Type[models.Model], enabled: bool = True):
+        self.model = model
+        self.enabled = enabled
+        self.label = model._meta.label_lower
+        self.version_field = self._detect_version_field(model)
+        self.last_modified_field = (
+            self.version_field
+            if isinstance(self.version_field, models.DateTimeField)
+            else None
+        )
+
+    @staticmethod
+    def _detect_version_field(model: Type[models.Model]) -> Optional[models.Field]:
+        concrete = {field.name: field for field in model._meta.concrete_fields}
+        for name in VERSION_FIELD_NAMES:
+            field = concrete.get(name)
+            if field is not None:
+                return field
+        return None
+
+    def instance_validators(self, instance: models.Model) -> Validators:
+        """Return ``(etag, last_modified)`` from the version column, if any."""
+        if not self.enabled or self.version_field is None:
+            return None, None
+        version = getattr(instance, self.version_field.attname)
+        etag = _weak_etag(self.label, instance.pk, version)
+        last_modified = None
+        if self.last_modified_field is not None and version is not None:
+            last_modified = int(version.timestamp())
+        return etag, last_modified
+
+    def page_etag(self, items: Iterable[Any], extra: Any = None) -> Optional[str]:
+        """
+        Return an ETag for a page of model instances from their version column.
+
+        Returns None when the model has no version column or the page holds
+        anything other than model instances, so callers fall back to hashing
+        the payload.
+        """
+        if not self.enabled or self.version_field is None:
+            return None
+        attname = self.version_field.attname
+        parts = [self.label, extra]
+        for item in items:
+            if not isinstance(item, models.Model):
+                return None
+            parts.append(item.pk)
+            parts.append(getattr(item, attname))
+        return _weak_etag(*parts)
+
+    def payload_etag(self, data: Any) -> Optional[str]:
+        """Return an ETag hashing the serialized payload."""
+        if not self.enabled or isinstance(data, HttpResponse):
+            return None
+        if isinstance(data, models.Model):
+            data = serialize_model_instance(data)
+        elif hasattr(data, "model_dump"):
+            data = data.model_dump()
+        try:
+            encoded = json.dumps(data, sort_keys=True, cls=_PayloadEncoder).encode()
+        except (TypeError, ValueError):
+            return None
+        return _weak_etag(encoded)
+
+    def not_modified(
+        self,
+        request: Any,
+        etag: Optional[str],
+        last_modified: Optional[int] = None,
+    ) -> Optional[HttpResponse]:
+        """Return a 304 response when the request's validators match, else None."""
+        if not self.enabled or (etag is None and last_modified is None):
+            return None
+        return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    def apply(
+        self,
+        response: Optional[HttpResponse],
+        etag: Optional[str],
+        last_modified: Optional[int] = None,
+    ) -> None:
+        """Set ``ETag`` / ``Last-Modified`` headers on the outgoing response."""
+        if response is None or not self.enabled:
+            return
+        if etag:
+            response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
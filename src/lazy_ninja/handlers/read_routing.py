@@ -0,0 +1,48 @@
+"""Read replica routing with read-your-writes stickiness for generated routes."""
+from typing import Any, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.http import HttpResponse
+
+PRIMARY_COOKIE = "lazy_ninja_read_primary"
+PRIMARY_HEADER = "X-Read-Primary"
+
+
+class ReadRouter:
+    """
+    Sends reads from the generated routes to a replica database alias.
+
+    Writes keep Django's default routing. Every successful write sets a
+    cookie that expires after ``sticky_seconds``. While a client sends that
+    cookie, or an ``X-Read-Primary`` header, its reads also use the default
+    routing, so it sees its own writes despite replication lag.
+    """
+
+    def __init__(self, alias: str, sticky_seconds: int = 5, cookie_name: str = PRIMARY_COOKIE):
+        if alias not in connections:
+            raise ImproperlyConfigured(f"read_db '{alias}' is not in DATABASES")
+        self.alias = alias
+        self.sticky_seconds = sticky_seconds
+        self.cookie_name = cookie_name
+
+    def alias_for(self, request: Any) -> Optional[str]:
+        """Return the replica alias, or None when the request must read from the primary."""
+        if request.COOKIES.get(self.cookie_name) or request.headers.get(PRIMARY_HEADER):
+            return None
+        return self.alias
+
+    def mark_write(self, response: Optional[HttpResponse]) -> None:
+        """Pin the client's next reads to the primary for the stickiness window."""
+        if response is None or self.sticky_seconds <= 0:
+            return
+        response.set_cookie(
+            self.cookie_name, "1", max_age=self.sticky_seconds, httponly=True, samesite="Lax"
+        )
+
+
+def build_read_router(alias: Optional[str], sticky_seconds: int = 5) -> Optional[ReadRouter]:
+    """Create the read router for a replica alias, or None when reads are not routed."""
+    if not alias:
+        return None
+    return ReadRouter(alias, sticky_seconds)
@@ -1,9 +1,9 @@
-from typing import Any, Type, Optional, Callable
-from asgiref.sync import sync_to_async
+from typing import Any, Dict, Type, Optional, Callable
 
 from ninja import Schema
 
 from ..utils import serialize_model_instance, serialize_model_instance_async
+from ..utils.hooks import ensure_async
 
 
 class BaseResponseHandler:
@@ -48,6 +48,16 @@ class SyncResponseHandler(BaseResponseHandler):
 
 class AsyncResponseHandler(BaseResponseHandler):
     """Handles response formatting for async routes."""
+
+    def __init__(self):
+        self._adapted: Dict[Callable, Callable] = {}
+
+    async def apply_custom_response(self, custom_response: Callable, request: Any, data: Any) -> Any:
+        """Await ``custom_response``; ``async def`` hooks run on the loop, sync ones in a thread."""
+        adapted = self._adapted.get(custom_response)
+        if adapted is None:
+            adapted = self._adapted[custom_response] = ensure_async(custom_response)
+        return await adapted(request, data)
     
     async def handle_response(
         self, 
@@ -69,7 +79,7 @@ class AsyncResponseHandler(BaseResponseHandler):
             Formatted response
         """
         if custom_response:
-            return await sync_to_async(custom_response)(request, instance)
+            return await self.apply_custom_response(custom_response, request, instance)
         
         serialized = await serialize_model_instance_async(instance)
         return serialized
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""Full-text search for generated list routes using database-native indexes."""
+import threading
+from typing import Any, Dict, List, Optional, Type, Union
+
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections, models
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+from ..helpers import FieldIndex
+
+try:
+    from django.contrib.postgres.search import SearchQuery, SearchVector
+except ImportError:  # pragma: no cover - requires psycopg
+    SearchQuery = SearchVector = None
+
+SEARCH_MODES = ("auto", "fulltext", "trigram", "icontains")
+
+SearchConfig = Union[List[str], Dict[str, Any]]
+
+
+def _fts5_query(term: str) -> str:
+    """Quote each word for FTS5 and make the last one a prefix, for search-as-you-type."""
+    words = ['"' + word.replace('"', '""') + '"' for word in term.split()]
+    if words:
+        words[-1] += "*"
+    return " ".join(words)
+
+
+class SearchHandler:
+    """
+    Applies ``?search=`` to a queryset with the best backend available.
+
+    In ``"auto"`` (and ``"fulltext"``) mode PostgreSQL uses
+    ``SearchVector``/``SearchQuery`` (or a stored ``vector_field``, which a
+    GIN index can serve), and SQLite uses an FTS5 table named
+    ``<db_table>_fts`` when one exists. ``"trigram"`` uses pg_trgm word
+    similarity on PostgreSQL. Everything else falls back to ``icontains``
+    across the search fields, every word having to match. The backend is
+    resolved once per database alias.
+    """
+
+    def __init__(self, model: Type[models.Model], field_index: FieldIndex, config: SearchConfig):
+        if not isinstance(config, dict):
+            config = {"fields": list(config)}
+        self.model = model
+        self.fields: List[str] = list(config.get("fields") or [])
+        self.mode: str = config.get("mode", "auto")
+        self.config: Optional[str] = config.get("config")
+        self.vector_field: Optional[str] = config.get("vector_field")
+        self.fts_table: str = config.get("fts_table") or f"{model._meta.db_table}_fts"
+
+        if self.mode not in SEARCH_MODES:
+            raise ImproperlyConfigured(
+                f"Unknown search mode '{self.mode}'. Use one of: {', '.join(SEARCH_MODES)}"
+            )
+        if not self.fields:
+            raise ImproperlyConfigured(f"search_fields for {model.__name__} must name at least one field")
+        for name in self.fields:
+            if not isinstance(field_index.get(name), (models.CharField, models.TextField)):
+                raise ImproperlyConfigured(f"'{name}' is not a text field of {model.__name__}")
+
+        self._backends: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def backend_for(self, alias: str) -> str:
+        """Return the search backend for a database alias, detecting it on first use."""
+        backend = self._backends.get(alias)
+        if backend is None:
+            with self._lock:
+                backend = self._backends.get(alias) or self._detect(alias)
+                self._backends[alias] = backend
+        return backend
+
+    def _detect(self, alias: str) -> str:
+        if self.mode == "icontains":
+            return "icontains"
+        connection = connections[alias]
+        if connection.vendor == "postgresql" and SearchQuery is not None:
+            if self.mode == "trigram":
+                return "trigram" if apps.is_installed("django.contrib.postgres") else "icontains"
+            return "postgres"
+        if connection.vendor == "sqlite" and self.mode != "trigram":
+            with connection.cursor() as cursor:
+                tables = connection.introspection.table_names(cursor)
+            if self.fts_table in tables:
+                return "fts5"
+        return "icontains"
+
+    def apply(self, queryset: QuerySet, term: str) -> QuerySet:
+        """Filter ``queryset`` to the rows matching ``term``."""
+        term = term.strip()
+        if not term:
+            return queryset
+        backend = self.backend_for(queryset.db)
+
+        if backend == "postgres":
+            query = SearchQuery(term, config=self.config, search_type="websearch")
+            if self.vector_field:
+                return queryset.filter(**{self.vector_field: query})
+            vector = SearchVector(*self.fields, config=self.config)
+            return queryset.annotate(_search_vector=vector).filter(_search_vector=query)
+
+        if backend == "fts5":
+            fts = connections[queryset.db].ops.quote_name(self.fts_table)
+            matches = RawSQL(f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", (_fts5_query(term),))
+            return queryset.filter(pk__in=matches)
+
+        if backend == "trigram":
+            condition = Q()
+            for name in self.fields:
+                condition |= Q(**{f"{name}__trigram_word_similar": term})
+            return queryset.filter(condition)
+
+        for word in term.split():
+            condition = Q()
+            for name in self.fields:
+                condition |= Q(**{f"{name}__icontains": word})
+            queryset = queryset.filter(condition)
+        return queryset
+
+
+def build_search_handler(
+    model: Type[models.Model],
+    field_index: FieldIndex,
+    config: Optional[SearchConfig],
+) -> Optional[SearchHandler]:
+    """Create the model's search handler, or None when search is not configured."""
+    if not config:
+        return None
+    return SearchHandler(model, field_index, config)
@@ -1,13 +1,17 @@
 import re
-from typing import Any, Callable, Optional, Type, Dict
+import uuid
+from functools import lru_cache
+from typing import Any, Callable, Optional, Type, Dict, List, Set, Tuple
 from asgiref.sync import sync_to_async
 
-from django.db.models import QuerySet, Model
-from django.core.exceptions import FieldDoesNotExist
-from django.db import models
+from django.db.models import QuerySet, Model, Q
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections, models, router
 
 from ninja import Schema
 
+from .errors import BadRequestError
+
 def parse_model_id(model: Type[models.Model], item_id: str) -> Any:
     """
     Converts a path parameter string to the correct type for the model's PK.
@@ -19,6 +23,107 @@ def parse_model_id(model: Type[models.Model], item_id: str) -> Any:
     return item_id
 
 
+INVALID_ID = object()
+"""Returned by ModelIdParser for ids that cannot match any row."""
+
+_INTEGER_ID = re.compile(r"-?\d+")
+_COMPOSITE_SEPARATOR = ","
+
+
+def _integer_id_parser(field: models.Field, using: str) -> Callable[[Any], Any]:
+    try:
+        low, high = connections[using].ops.integer_field_range(field.get_internal_type())
+    except KeyError:
+        low, high = None, None
+
+    def parse(value: Any) -> Any:
+        if isinstance(value, str):
+            if not _INTEGER_ID.fullmatch(value):
+                return INVALID_ID
+            value = int(value)
+        if (low is not None and value < low) or (high is not None and value > high):
+            return INVALID_ID
+        return value
+
+    return parse
+
+
+def _uuid_id_parser(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(value)
+    except (TypeError, ValueError):
+        return INVALID_ID
+
+
+def _generic_id_parser(field: models.Field) -> Callable[[Any], Any]:
+    max_length = getattr(field, "max_length", None)
+
+    def parse(value: Any) -> Any:
+        if max_length is not None and len(value) > max_length:
+            return INVALID_ID
+        try:
+            value = field.to_python(value)
+            field.run_validators(value)
+        except ValidationError:
+            return INVALID_ID
+        return value
+
+    return parse
+
+
+def _field_id_parser(field: models.Field, using: str) -> Tuple[Type, Callable[[Any], Any]]:
+    """Return the path parameter type and value parser for a single key field."""
+    if isinstance(field, models.ForeignKey):
+        return _field_id_parser(field.target_field, using)
+    if isinstance(field, (models.AutoField, models.IntegerField)):
+        return int, _integer_id_parser(field, using)
+    if isinstance(field, models.UUIDField):
+        return uuid.UUID, _uuid_id_parser
+    return str, _generic_id_parser(field)
+
+
+class ModelIdParser:
+    """
+    Parses path ids for a model's primary key (or another unique field).
+
+    Built once per router. ``path_type`` is the annotation used for the path
+    parameter, so ninja already rejects ids of the wrong type with 422; the
+    parser then applies the remaining checks (integer range, max_length,
+    field validators) and returns ``INVALID_ID`` for ids that cannot match any
+    row, so routes answer 404 without querying. Composite primary keys take
+    their components comma-separated, e.g. ``/order-lines/12,3``.
+
+    Integer ranges come from the backend of ``using``, or of the database
+    the model's reads are routed to when it is None.
+    """
+
+    def __init__(
+        self,
+        model: Type[models.Model],
+        field: Optional[models.Field] = None,
+        using: Optional[str] = None,
+    ):
+        field = field or model._meta.pk
+        self.field = field
+        using = using or router.db_for_read(model)
+        composite = getattr(models, "CompositePrimaryKey", None)
+        if composite is not None and isinstance(field, composite):
+            self.path_type: Type = str
+            self._parsers = [_field_id_parser(part, using)[1] for part in field.fields]
+            self.parse = self._parse_composite
+        else:
+            self.path_type, self.parse = _field_id_parser(field, using)
+
+    def _parse_composite(self, value: str) -> Any:
+        parts = value.split(_COMPOSITE_SEPARATOR)
+        if len(parts) != len(self._parsers):
+            return INVALID_ID
+        values = tuple(parse(part) for parse, part in zip(self._parsers, parts))
+        return INVALID_ID if INVALID_ID in values else values
+
+
 def get_hook(controller: Optional[Any], hook_name: str) -> Optional[Callable]:
     """
     Safely get a hook method from a controller.
@@ -81,7 +186,8 @@ def parse_query_param(q: str) -> Dict[str, Any]:
     if not q:
         return filter_dict
     
-    operators = ['=', ':', '>', '<', '>=', '<=']
+    # Two-character operators first, so 'views>=10' is not read as 'views' > '=10'.
+    operators = ['>=', '<=', '=', ':', '>', '<']
     operator_found = None
     field_name = None
     value = None
@@ -121,13 +227,209 @@ def parse_query_param(q: str) -> Dict[str, Any]:
     
     return filter_dict
 
+FILTER_CACHE_SIZE = 1024
+
+_CONDITION = re.compile(r"^\s*(?P<field>[A-Za-z_]\w*)\s*(?P<op>>=|<=|!=|>|<|=|:)(?P<value>.*)$", re.S)
+_OPERATOR_LOOKUPS = {">=": "gte", "<=": "lte", ">": "gt", "<": "lt"}
+TEXT_LOOKUPS = frozenset({
+    "exact", "iexact", "contains", "icontains",
+    "startswith", "istartswith", "endswith", "iendswith",
+})
+FILTER_LOOKUPS = TEXT_LOOKUPS | {"gt", "gte", "lt", "lte", "in", "range", "isnull"}
+_LIST_SUFFIXES = ("__in", "__range")
+_ESCAPED_CHAR = re.compile(r"\\(.)", re.S)
+
+
+def _is_text_field(field: models.Field) -> bool:
+    return isinstance(field, (models.CharField, models.TextField))
+
+
+def _split_expression(text: str, separator: str) -> List[str]:
+    """Split on ``separator`` except inside double quotes or after a backslash."""
+    parts: List[str] = []
+    start = 0
+    quoted = escaped = False
+    for position, char in enumerate(text):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif char == separator and not quoted:
+            parts.append(text[start:position])
+            start = position + 1
+    if quoted:
+        raise BadRequestError("Unterminated quote in filter expression")
+    parts.append(text[start:])
+    return parts
+
+
+def _unquote(raw: str) -> str:
+    """Strip a value, remove surrounding double quotes and resolve backslash escapes."""
+    raw = raw.strip()
+    if len(raw) >= 2 and raw[0] == raw[-1] == '"':
+        raw = raw[1:-1]
+    return _ESCAPED_CHAR.sub(r"\1", raw)
+
+
+def _filter_value(field: models.Field, lookup: str, raw: str) -> Any:
+    raw = _unquote(raw)
+    if lookup == "isnull":
+        field = models.BooleanField(name=lookup)
+    elif lookup in TEXT_LOOKUPS and lookup != "exact":
+        return raw
+    try:
+        return field.to_python(raw)
+    except ValidationError:
+        raise BadRequestError(f"Invalid value '{raw}' for '{field.name}'") from None
+
+
+def _compile_condition(index: "FieldIndex", name: str, op: str, values: List[str]) -> Q:
+    field_name, _, lookup = name.partition("__")
+    field = index.get(field_name)
+    if field is None:
+        raise BadRequestError(f"Cannot filter by '{field_name}'")
+    if lookup:
+        if lookup not in FILTER_LOOKUPS or op not in ("=", ":", "!="):
+            raise BadRequestError(f"Unsupported filter '{name}{op}'")
+    else:
+        lookup = _OPERATOR_LOOKUPS.get(op) or ("icontains" if _is_text_field(field) else "exact")
+
+    if name.endswith(_LIST_SUFFIXES):
+        value: Any = [_filter_value(field, lookup, raw) for raw in values]
+        if lookup == "range" and len(value) != 2:
+            raise BadRequestError(f"'{name}' takes exactly two values")
+    else:
+        value = _filter_value(field, lookup, values[0])
+
+    condition = Q(**{f"{field_name}__{lookup}": value})
+    return ~condition if op == "!=" else condition
+
+
+def _compile_group(index: "FieldIndex", group: str) -> Q:
+    conditions: List[Tuple[str, str, List[str]]] = []
+    for token in _split_expression(group, ","):
+        match = _CONDITION.match(token)
+        if match:
+            conditions.append((match["field"], match["op"], [match["value"]]))
+        elif conditions and conditions[-1][0].endswith(_LIST_SUFFIXES):
+            # 'id__in=1,2,3': bare tokens continue the previous list value.
+            conditions[-1][2].append(token)
+        else:
+            raise BadRequestError(f"Invalid filter condition '{token.strip()}'")
+
+    compiled = Q()
+    for name, op, values in conditions:
+        compiled &= _compile_condition(index, name, op, values)
+    return compiled
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def compile_filter_expression(model: Type[Model], expression: str) -> Q:
+    """
+    Compile a ``q`` filter expression into a single ``Q`` object.
+
+    Conditions are separated by ``,`` (AND) and groups by ``|`` (OR), with
+    AND binding tighter. Each condition is ``field<op>value`` where the
+    operator is one of ``= : != > >= < <=``, and ``=``/``:``/``!=`` may
+    follow a lookup suffix (``id__in=1,2,3``, ``price__range=10,20``,
+    ``owner__isnull=true``). Without a suffix, ``=`` matches text fields
+    with ``icontains`` and other fields exactly.
+
+    Values containing ``,`` or ``|`` are written in double quotes
+    (``title:"hello, world"``) or with the separator escaped by a backslash
+    (``title:hello\\, world``); ``\\"`` and ``\\\\`` escape a quote and a
+    backslash.
+
+    Fields are validated against the model's concrete fields and values
+    converted with the field's ``to_python``; invalid expressions raise
+    ``BadRequestError``. Compiled expressions are cached per model.
+
+    Examples:
+    - "status:active,priority>=3|owner:5"
+        -> Q(status__icontains="active", priority__gte=3) | Q(owner__exact=5)
+    - "id__in=1,2,3" -> Q(id__in=[1, 2, 3])
+    - 'title:"hello, world"' -> Q(title__icontains="hello, world")
+    """
+    index = _field_index(model)
+    compiled = Q()
+    for group in _split_expression(expression, "|"):
+        compiled |= _compile_group(index, group)
+    return compiled
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def compile_ordering(
+    model: Type[Model],
+    sort: str,
+    order: Optional[str] = "asc",
+    indexed_only: bool = False,
+) -> Tuple[str, ...]:
+    """
+    Compile a ``sort`` parameter into ``order_by`` arguments.
+
+    ``sort`` is a comma-separated list of fields; a ``-`` prefix sorts that
+    key descending, and ``order=desc`` reverses the unprefixed keys. Foreign
+    keys sort by their column, without a join. Unless a key is already
+    unique, the primary key is appended as a tiebreaker so pages are
+    deterministic. With ``indexed_only``, every key must be the leading
+    column of an index (see FieldIndex.indexed).
+
+    Example:
+    - "-created_at,name" -> ("-created_at", "name", "pk")
+    """
+    index = _field_index(model)
+    descending = (order or "asc").lower() == "desc"
+    ordering: List[str] = []
+    seen: Set[str] = set()
+    unique = False
+
+    for key in sort.split(","):
+        key = key.strip()
+        if not key:
+            continue
+        name = key.lstrip("-")
+        field = index.get(name)
+        if field is None:
+            raise BadRequestError(f"Cannot sort by '{name}'")
+        if indexed_only and name not in index.indexed:
+            raise BadRequestError(f"Cannot sort by '{name}': the field is not indexed")
+        if name in seen:
+            continue
+        seen.add(name)
+        prefix = "-" if key.startswith("-") or descending else ""
+        ordering.append(prefix + field.attname)
+        unique = unique or (field.unique and not field.null)
+
+    if ordering and not unique:
+        ordering.append(("-" if ordering[-1].startswith("-") else "") + "pk")
+    return tuple(ordering)
+
+
+def _order(queryset: QuerySet, model: Type[Model], sort: Optional[str], order: Optional[str], indexed_only: bool) -> QuerySet:
+    ordering = compile_ordering(model, sort, order, indexed_only) if sort else ()
+    if ordering:
+        return queryset.order_by(*ordering)
+    if not queryset.ordered:
+        # Without an ORDER BY, LIMIT/OFFSET pages are not guaranteed to be disjoint.
+        return queryset.order_by("pk")
+    return queryset
+
+
+@lru_cache(maxsize=None)
+def _field_index(model: Type[Model]) -> "FieldIndex":
+    return FieldIndex(model)
+
+
 def apply_filters(
     queryset: QuerySet,
     model: Type[Model],
     q: Optional[str],
     sort: Optional[str],
     order: str,
-    kwargs: Dict[str, Any]
+    kwargs: Dict[str, Any],
+    indexed_sort_only: bool = False,
 ) -> QuerySet:
     """
     Apply filters and sorting to a queryset.
@@ -135,19 +437,17 @@ def apply_filters(
     Args:
         queryset: The base queryset to filter
         model: The Django model class
-        q: Search query string or field=value expression
-        sort: Field to sort by
+        q: Filter expression, see compile_filter_expression
+        sort: Comma-separated fields to sort by, see compile_ordering
         order: Sort order ('asc' or 'desc')
         kwargs: Additional filter parameters
+        indexed_sort_only: Only allow sorting by indexed fields
         
     Returns:
         Filtered and sorted queryset
     """
     if q:
-        filter_dict = parse_query_param(q)
-        
-        if filter_dict:
-            queryset = queryset.filter(**filter_dict)
+        queryset = queryset.filter(compile_filter_expression(model, q))
 
     if kwargs:
         valid_kwargs = {}
@@ -161,25 +461,14 @@ def apply_filters(
         if valid_kwargs:
             queryset = queryset.filter(**valid_kwargs)
     
-    if sort:
-        try:
-            model._meta.get_field(sort)
-            sort_field = f"-{sort}" if order.lower() == "desc" else sort
-            queryset = queryset.order_by(sort_field)
-        except FieldDoesNotExist:
-            pass
-            
-    return queryset
+    return _order(queryset, model, sort, order, indexed_sort_only)
 
-async def apply_filters_async(queryset, model, q, sort, order, kwargs):
+async def apply_filters_async(queryset, model, q, sort, order, kwargs, indexed_sort_only=False):
     """
     Asynchronous version for applying filters to a queryset
     """
     if q:
-        filter_dict = await sync_to_async(parse_query_param)(q)
-        
-        if filter_dict:
-            queryset = await sync_to_async(lambda qs, kw: qs.filter(**kw))(queryset, filter_dict)
+        queryset = queryset.filter(compile_filter_expression(model, q))
     
     if kwargs:
         valid_kwargs = {}
@@ -193,15 +482,7 @@ async def apply_filters_async(queryset, model, q, sort, order, kwargs):
         if valid_kwargs:
             queryset = await sync_to_async(lambda qs, kw: qs.filter(**kw))(queryset, valid_kwargs)
     
-    if sort:
-        try:
-            await sync_to_async(lambda m, s: m._meta.get_field(s))(model, sort)
-            
-            sort_field = f"-{sort}" if order.lower() == "desc" else sort
-            queryset = await sync_to_async(lambda qs, sf: qs.order_by(sf))(queryset, sort_field)
-        except Exception:
-            pass
-    
+    queryset = _order(queryset, model, sort, order, indexed_sort_only)
     return await sync_to_async(list)(queryset)
 
 def to_kebab_case(name: str) -> str:
@@ -234,11 +515,48 @@ def to_kebab_case(name: str) -> str:
     return s2.lower().replace('_', '-').replace('--', '-')
 
 
+class FieldIndex:
+    """Name -> field lookup over a model's concrete fields, built once per router."""
+
+    def __init__(self, model: Type[Model]):
+        self.model = model
+        self.fields: Dict[str, models.Field] = {
+            field.name: field for field in model._meta.concrete_fields
+        }
+        self.indexed = self._indexed_fields()
+
+    def _indexed_fields(self) -> Set[str]:
+        """Fields that lead a (non-partial) index: pk, unique, db_index, Meta.indexes and unique constraints."""
+        meta = self.model._meta
+        indexed = {
+            name for name, field in self.fields.items()
+            if field.primary_key or field.unique or field.db_index
+        }
+        leading = [index.fields for index in meta.indexes if index.condition is None]
+        leading += [
+            constraint.fields for constraint in meta.constraints
+            if isinstance(constraint, models.UniqueConstraint) and constraint.condition is None
+        ]
+        leading += list(meta.unique_together)
+        for fields in leading:
+            if fields:
+                indexed.add(fields[0].lstrip("-"))
+        return indexed & self.fields.keys()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.fields
+
+    def get(self, name: str) -> Optional[models.Field]:
+        return self.fields.get(name)
+
+
 class QuerysetFilter:
     """Utility wrapper for applying query filters and ordering consistently."""
 
-    def __init__(self, model: Type[Model]):
+    def __init__(self, model: Type[Model], indexed_sort_only: bool = False):
         self.model = model
+        self.field_index = FieldIndex(model)
+        self.indexed_sort_only = indexed_sort_only
 
     def apply_filters(
         self,
@@ -249,7 +567,7 @@ class QuerysetFilter:
         **kwargs: Any,
     ) -> QuerySet:
         """Apply sync filters mirroring legacy helper behaviour."""
-        return apply_filters(queryset, self.model, q, sort, order, kwargs)
+        return apply_filters(queryset, self.model, q, sort, order, kwargs, self.indexed_sort_only)
 
     async def apply_filters_async(
         self,
@@ -260,4 +578,4 @@ class QuerysetFilter:
         **kwargs: Any,
     ) -> Any:
         """Async counterpart used by async routers."""
-        return await apply_filters_async(queryset, self.model, q, sort, order, kwargs)
+        return await apply_filters_async(queryset, self.model, q, sort, order, kwargs, self.indexed_sort_only)
@@ -0,0 +1,171 @@
+"""Request-scoped batch loaders for enriching results inside controller hooks."""
+import asyncio
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Type
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db.models import Model
+
+from .utils.type_guards import has_unique_field
+
+REQUEST_ATTRIBUTE = "_lazy_ninja_loaders"
+READ_ALIAS_ATTRIBUTE = "_lazy_ninja_read_alias"
+
+
+class LoadResult:
+    """A value queued on a ``BatchLoader``; reading ``value`` runs the pending batch."""
+
+    __slots__ = ("loader", "key")
+
+    def __init__(self, loader: "BatchLoader", key: Hashable):
+        self.loader = loader
+        self.key = key
+
+    @property
+    def value(self) -> Optional[Model]:
+        return self.loader.get(self.key)
+
+
+class BatchLoader:
+    """
+    Loads instances of one model by a unique field, one query per batch.
+
+    Keys requested with ``load`` are queued and fetched together with a
+    single ``<field>__in`` query the first time any of their values is read;
+    ``aload`` batches every key requested in the same event loop tick.
+    Results, including misses (None), are memoized for the loader's
+    lifetime, which ``loader_for`` ties to the request. Keys are converted
+    with the field's ``to_python``, so ``"5"`` and ``5`` are the same key.
+
+    Example:
+        @classmethod
+        def post_list(cls, request, rows):
+            authors = loader_for(request, User)
+            refs = [authors.load(row.author_id) for row in rows]
+            for row, ref in zip(rows, refs):
+                row.author_name = ref.value.get_full_name() if ref.value else None
+    """
+
+    def __init__(self, model: Type[Model], field: str = "pk", using: Optional[str] = None):
+        if field != "pk" and not has_unique_field(model, field):
+            raise ImproperlyConfigured(f"'{field}' is not a unique field of {model.__name__}")
+        self.model = model
+        self.field = field
+        self.using = using
+        self.key_field = model._meta.pk if field == "pk" else model._meta.get_field(field)
+        self.attname = self.key_field.attname
+        self._cache: Dict[Hashable, Optional[Model]] = {}
+        self._pending: Set[Hashable] = set()
+        self._batch: Optional[asyncio.Future] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _key(self, key: Hashable) -> Hashable:
+        """Return ``key`` as the field's Python value."""
+        try:
+            return self.key_field.to_python(key)
+        except ValidationError:
+            # Cannot match any row: remember it as a miss so it is never queried.
+            self._cache.setdefault(key, None)
+            return key
+
+    def load(self, key: Hashable) -> LoadResult:
+        """Queue ``key`` and return a handle to its value."""
+        key = self._key(key)
+        if key not in self._cache:
+            self._pending.add(key)
+        return LoadResult(self, key)
+
+    def load_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Optional[Model]]:
+        """Return the instances for ``keys``, fetching the missing ones in one query."""
+        keys = list(keys)
+        normalized = [self.load(key).key for key in keys]
+        self.dispatch()
+        return {key: self._cache[value] for key, value in zip(keys, normalized)}
+
+    def get(self, key: Hashable) -> Optional[Model]:
+        """Return the instance for ``key``, running the pending batch first if needed."""
+        key = self._key(key)
+        if key not in self._cache:
+            self._pending.add(key)
+            self.dispatch()
+        return self._cache[key]
+
+    def prime(self, key: Hashable, instance: Optional[Model]) -> None:
+        """Store an instance that is already in memory."""
+        key = self._key(key)
+        self._cache[key] = instance
+        self._pending.discard(key)
+
+    def dispatch(self) -> None:
+        """Fetch every pending key with a single query."""
+        keys, self._pending = self._pending, set()
+        self._fetch(keys)
+
+    def _fetch(self, keys: Set[Hashable]) -> None:
+        if not keys:
+            return
+        queryset = self.model._default_manager.using(self.using).filter(**{f"{self.field}__in": keys})
+        found = {self.key_field.to_python(getattr(instance, self.attname)): instance for instance in queryset}
+        for key in keys:
+            self._cache[key] = found.get(key)
+
+    async def aload(self, key: Hashable) -> Optional[Model]:
+        """Return the instance for ``key``; concurrent calls share one query."""
+        key = self._key(key)
+        if key in self._cache:
+            return self._cache[key]
+        self._pending.add(key)
+        if self._batch is None:
+            loop = asyncio.get_running_loop()
+            self._batch = loop.create_future()
+            # Runs once the current tasks yield, after they queued their keys.
+            loop.call_soon(self._start_dispatch, loop)
+        await asyncio.shield(self._batch)
+        return self._cache[key]
+
+    def _start_dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        # The loop only keeps weak references to tasks; hold this one until it is done.
+        task = loop.create_task(self._adispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def aload_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Optional[Model]]:
+        """Async version of ``load_many``."""
+        return await sync_to_async(self.load_many)(keys)
+
+    async def _adispatch(self) -> None:
+        batch, self._batch = self._batch, None
+        keys, self._pending = self._pending, set()
+        try:
+            await sync_to_async(self._fetch)(keys)
+        except Exception as e:
+            batch.set_exception(e)
+        else:
+            batch.set_result(None)
+
+
+def use_read_alias(request: Any, alias: Optional[str]) -> None:
+    """Record the database alias a generated route reads from for ``loader_for``."""
+    setattr(request, READ_ALIAS_ATTRIBUTE, alias)
+
+
+def loader_for(request: Any, model: Type[Model], field: str = "pk", using: Optional[str] = None) -> BatchLoader:
+    """
+    Return the request's loader for ``model`` by ``field``, creating it on first use.
+
+    Every hook that asks for the same loader during a request shares its
+    batch and memoized results. Without ``using``, loaders read from the
+    alias the route itself reads from (the ``read_db`` replica unless the
+    client is pinned to the primary), or follow Django's routing.
+    """
+    if using is None:
+        using = getattr(request, READ_ALIAS_ATTRIBUTE, None)
+    loaders = getattr(request, REQUEST_ATTRIBUTE, None)
+    if loaders is None:
+        loaders = {}
+        setattr(request, REQUEST_ATTRIBUTE, loaders)
+    key = (model, field, using)
+    loader = loaders.get(key)
+    if loader is None:
+        loader = loaders[key] = BatchLoader(model, field, using)
+    return loader
@@ -1,9 +1,30 @@
 import importlib
 from pathlib import Path
-from typing import Type, Dict, Any, Optional
+from typing import Type, Dict, Any, List, Optional
 
 from django.apps import apps
 
+from .utils.hooks import HOOK_NAMES, compile_hook
+
+
+class ControllerStack:
+    """
+    Several controllers registered for one model.
+
+    Each hook attribute runs the controllers' hooks in registration order
+    (see ``HookChain``), so mixins for auditing, indexing and so on can be
+    registered separately instead of being merged by hand.
+    """
+
+    def __init__(self, controllers: List[Any]):
+        self.controllers = list(controllers)
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in HOOK_NAMES:
+            raise AttributeError(name)
+        return compile_hook(name, [getattr(controller, name, None) for controller in self.controllers])
+
+
 class ModelRegistry:
     """Registry for model controllers."""
     
@@ -11,9 +32,19 @@ class ModelRegistry:
     _discovered = False
     
     @classmethod
-    def register_controller(cls, model_name: str, controller: Any) -> None:
-        """Register a controller for a model."""
-        cls._controllers[model_name.lower()] = controller
+    def register_controller(cls, model_name: str, controller: Any, stack: bool = False) -> None:
+        """
+        Register a controller for a model.
+
+        A new registration replaces the previous one unless ``stack`` is
+        True, in which case both controllers' hooks run, earlier ones first.
+        """
+        key = model_name.lower()
+        current = cls._controllers.get(key)
+        if stack and current is not None and current is not controller:
+            previous = current.controllers if isinstance(current, ControllerStack) else [current]
+            controller = ControllerStack([*previous, controller])
+        cls._controllers[key] = controller
         
     @classmethod
     def get_controller(cls, model_name: str) -> Optional[Any]:
@@ -53,7 +84,7 @@ class ModelRegistry:
                             continue
 
         cls._discovered = True
-def controller_for(model_name: str):
+def controller_for(model_name: str, stack: bool = False):
     """
     Decorator to automatically register a controller for a model.
     
@@ -61,9 +92,13 @@ def controller_for(model_name: str):
         @controller_for('Post')
         class PostController(BaseModelController):
             ...
+
+        @controller_for('Post', stack=True)
+        class PostAuditController(BaseModelController):
+            ...
     """
     def decorator(controller_class: Type):
-        ModelRegistry.register_controller(model_name, controller_class)
+        ModelRegistry.register_controller(model_name, controller_class, stack=stack)
         return controller_class
     return decorator
 
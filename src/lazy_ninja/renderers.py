@@ -0,0 +1,104 @@
+"""Fast JSON renderer for Lazy Ninja APIs."""
+import json
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+JSON_BACKENDS = ("auto", "orjson", "msgspec", "json")
+
+_fallback_encoder = NinjaJSONEncoder()
+
+
+def _encode_default(obj: Any) -> Any:
+    """Handle types the fast encoders do not serialize natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    return _fallback_encoder.default(obj)
+
+
+def _orjson_dumps() -> Callable[[Any], bytes]:
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps(data: Any) -> bytes:
+        return orjson.dumps(data, default=_encode_default, option=options)
+
+    return dumps
+
+
+def _msgspec_dumps() -> Callable[[Any], bytes]:
+    encoder = msgspec.json.Encoder(enc_hook=_encode_default, decimal_format="string")
+    return encoder.encode
+
+
+def _stdlib_dumps() -> Callable[[Any], bytes]:
+    def dumps(data: Any) -> bytes:
+        return json.dumps(data, cls=NinjaJSONEncoder).encode()
+
+    return dumps
+
+
+def resolve_json_backend(backend: Optional[str] = "auto") -> str:
+    """
+    Resolve the JSON backend name to the one that will actually be used.
+
+    ``"auto"`` prefers orjson, then msgspec, then the standard library.
+    Requesting a library that is not installed raises ImproperlyConfigured.
+    """
+    backend = (backend or "auto").lower()
+    if backend not in JSON_BACKENDS:
+        raise ImproperlyConfigured(
+            f"Unknown JSON backend '{backend}'. Use one of: {', '.join(JSON_BACKENDS)}"
+        )
+    if backend == "auto":
+        if orjson is not None:
+            return "orjson"
+        if msgspec is not None:
+            return "msgspec"
+        return "json"
+    if backend == "orjson" and orjson is None:
+        raise ImproperlyConfigured("json_backend='orjson' requires the orjson package")
+    if backend == "msgspec" and msgspec is None:
+        raise ImproperlyConfigured("json_backend='msgspec' requires the msgspec package")
+    return backend
+
+
+class LazyNinjaJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson or msgspec when available.
+
+    datetime, date, time and UUID values are encoded natively by the fast
+    backends (datetimes keep microsecond precision and UTC is written as
+    ``Z``); Decimal is written as a string, matching Django's encoder. Other
+    types fall back to ninja's ``NinjaJSONEncoder``.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, backend: Optional[str] = "auto"):
+        self.backend = resolve_json_backend(backend)
+        if self.backend == "orjson":
+            self.dumps = _orjson_dumps()
+        elif self.backend == "msgspec":
+            self.dumps = _msgspec_dumps()
+        else:
+            self.dumps = _stdlib_dumps()
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        return self.dumps(data)
@@ -1,15 +1,21 @@
-from typing import List, Any, Dict, Optional
+from functools import wraps
+from typing import List, Any, Dict, Optional, Callable
 from asgiref.sync import sync_to_async
 
-from ninja import Form
+from django.http import HttpResponse
+
+from ninja import Form, Query
 from ninja.pagination import paginate
 
 from .base import BaseModelRouter
 from ..handlers.response import AsyncResponseHandler
 from ..handlers.file_handler import AsyncFileHandler
-from ..utils.hooks import AsyncHookExecutor
+from ..handlers.export import AsyncExportHandler
+from ..handlers.aggregate import AsyncAggregateHandler, AggregateResult
+from ..handlers.bulk_import import AsyncImportHandler, ImportReport
+from ..utils.hooks import AsyncHookExecutor, is_default_hook
 from ..utils.model import AsyncModelUtils
-from ..helpers import QuerysetFilter, parse_model_id
+from ..helpers import INVALID_ID
 from ..errors import handle_exception_async
 
 
@@ -24,9 +30,51 @@ class AsyncModelRouter(BaseModelRouter):
         super().__init__(*args, **kwargs)
         self.response_handler = AsyncResponseHandler()
         self.file_handler = AsyncFileHandler(self.file_upload_config)
-        self.hook_executor = AsyncHookExecutor()
+        self.hook_executor = AsyncHookExecutor(self.write_db)
         self.model_utils = AsyncModelUtils()
-        self.queryset_filter = QuerysetFilter(self.model)
+        self.export_handler = AsyncExportHandler(self.model, self.list_schema)
+        self.aggregate_handler = AsyncAggregateHandler(self.model, self.queryset_filter.field_index, self.list_schema)
+        self.import_handler = AsyncImportHandler(self.model, self.create_schema, using=self.database) if self.create_schema else None
+
+    async def get_instance(self, item_id: Any, using: Optional[str] = None) -> Optional[Any]:
+        """Fetch the object addressed by a path id, or None if the id is invalid or missing."""
+        value = self.id_parser.parse(item_id)
+        if value is INVALID_ID:
+            return None
+        return await self.model_utils.get_object_or_none(self.model, using or self.database, **{self.lookup_field: value})
+
+    def list_pipeline(self, view: Callable) -> Callable:
+        """Wrap the paginated list view with post-pagination processing."""
+
+        @wraps(view)
+        async def list_view(request, **kwargs: Any) -> Any:
+            response = kwargs.get("response")
+            if self.read_cache is not None:
+                entry = await self.read_cache.aget(request, "list")
+                if entry is not None:
+                    return self.respond_from_entry(request, entry, response)
+
+            try:
+                # Errors are handled here: the paginator cannot page an error response.
+                page = await view(request, **kwargs)
+                rows = self.page_rows(page)
+                if self.post_list and rows is not None:
+                    # One call per page, so enrichment can batch its queries.
+                    rows = await sync_to_async(list)(rows)
+                    result = await self.hook_executor.execute(self.post_list, request, rows)
+                    page = self.with_rows(page, rows, result)
+            except Exception as e:
+                return await handle_exception_async(e)
+
+            # Only the current page is serialized, in one worker thread hop.
+            entry = await sync_to_async(self.list_entry)(page, serialize=True)
+            if entry is None:
+                return page
+            if self.read_cache is not None:
+                await self.read_cache.aset(request, "list", entry)
+            return self.respond_from_entry(request, entry, response)
+
+        return list_view
 
     def register_list_route(self) -> None:
         """Register async list route with pagination and filtering."""
@@ -37,42 +85,121 @@ class AsyncModelRouter(BaseModelRouter):
             tags=self.get_tags(),
             operation_id=self.get_operation_id("list")
         )
+        @self.list_pipeline
         @paginate(self.paginator_class)
         async def list_items(
             request,
             q: Optional[str] = None,
+            search: Optional[str] = None,
             sort: Optional[str] = None,
             order: Optional[str] = "asc",
+            response: HttpResponse = None,
             **kwargs: Any
         ) -> List[Any]:
             """List objects with optional filtering and sorting."""
+            queryset = await self.afiltered_queryset(request, q, search, sort, order, **kwargs)
+
+            if is_default_hook(self.custom_response):
+                # Building the queryset is lazy; the paginator fetches and
+                # counts only the requested page, which list_pipeline serializes.
+                return queryset
+
+            all_items = await sync_to_async(list)(queryset)
+
+            serialized_items = []
+            for item in all_items:
+                serialized = await self.model_utils.serialize_model_instance(item)
+                serialized_items.append(serialized)
+
+            return await self.response_handler.apply_custom_response(
+                self.custom_response, request, serialized_items
+            )
+            
+    def register_export_route(self) -> None:
+        """Register async streaming export route."""
+
+        @self.router.get(
+            "/export",
+            tags=self.get_tags(),
+            operation_id=self.get_operation_id("export")
+        )
+        async def export_items(
+            request,
+            fmt: str = Query("ndjson", alias="format"),
+            q: Optional[str] = None,
+            search: Optional[str] = None,
+            sort: Optional[str] = None,
+            order: Optional[str] = "asc",
+            **kwargs: Any
+        ) -> Any:
+            """Stream all matching objects as NDJSON or CSV."""
             try:
-                all_items = await self.model_utils.get_all_objects(self.model)
+                fmt = self.export_handler.check_format(fmt)
+                # Building the queryset is lazy; rows are only fetched while streaming.
+                queryset = await self.afiltered_queryset(request, q, search, sort, order, **kwargs)
+                return self.export_handler.build_response(
+                    self.export_handler.stream(queryset, fmt), fmt, self.base_url.strip("/")
+                )
+            except Exception as e:
+                return await handle_exception_async(e)
 
-                if self.pre_list:
-                    hook_result = await self.hook_executor.execute(self.pre_list, request, all_items)
-                    if hook_result is not None:
-                        all_items = hook_result
-                
-                if q or sort or kwargs:
-                    all_items = await self.queryset_filter.apply_filters_async(
-                        all_items, q, sort, order, **kwargs
-                    )
-                else:
-                    all_items = await sync_to_async(list)(all_items)
+    def register_aggregate_route(self) -> None:
+        """Register async aggregate route."""
+
+        @self.router.get(
+            "/aggregate",
+            response=AggregateResult,
+            tags=self.get_tags(),
+            operation_id=self.get_operation_id("aggregate")
+        )
+        async def aggregate_items(
+            request,
+            group_by: Optional[str] = None,
+            count: Optional[str] = None,
+            sum_fields: Optional[str] = Query(None, alias="sum"),
+            avg_fields: Optional[str] = Query(None, alias="avg"),
+            min_fields: Optional[str] = Query(None, alias="min"),
+            max_fields: Optional[str] = Query(None, alias="max"),
+            q: Optional[str] = None,
+            **kwargs: Any
+        ) -> Any:
+            """Count, sum, average, min or max matching objects, optionally grouped."""
+            try:
+                queryset = await self.afiltered_queryset(request, q, **kwargs)
+                return await self.aggregate_handler.run(
+                    queryset,
+                    group_by,
+                    count=count,
+                    sum=sum_fields,
+                    avg=avg_fields,
+                    min=min_fields,
+                    max=max_fields,
+                )
+            except Exception as e:
+                return await handle_exception_async(e)
 
-                serialized_items = []
-                for item in all_items:
-                    serialized = await self.model_utils.serialize_model_instance(item)
-                    serialized_items.append(serialized)
+    def register_import_route(self) -> None:
+        """Register async streaming bulk import route."""
 
-                if self.custom_response:
-                    return await sync_to_async(self.custom_response)(request, serialized_items)
-                
-                return serialized_items
+        @self.router.post(
+            "/import",
+            response=ImportReport,
+            tags=self.get_tags(),
+            operation_id=self.get_operation_id("import")
+        )
+        async def import_items(request, fmt: Optional[str] = Query(None, alias="format"), response: HttpResponse = None) -> Any:
+            """Create objects in bulk from an NDJSON or CSV request body."""
+            try:
+                fmt = self.import_handler.detect_format(request, fmt)
+                report = await self.import_handler.run(
+                    request, fmt, self.before_create, self.after_create
+                )
+                await self.ainvalidate_cache()
+                self.mark_write(response)
+                return report
             except Exception as e:
                 return await handle_exception_async(e)
-            
+
     def register_detail_route(self) -> None:
         """Register async detail route."""
 
@@ -82,14 +209,32 @@ class AsyncModelRouter(BaseModelRouter):
             tags=self.get_tags(),
             operation_id=self.get_operation_id("get")
         )
-        async def get_item(request, item_id: str) -> Any:
+        async def get_item(request, item_id: self.id_parser.path_type, response: HttpResponse) -> Any: # type: ignore
             """Retrieve a single object by ID."""
             try:
-                item_id_value = parse_model_id(self.model, item_id)
-                instance = await self.model_utils.get_object_or_404(self.model, id=item_id_value)
-                return await self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                if self.read_cache is not None:
+                    entry = await self.read_cache.aget(request, "detail")
+                    if entry is not None:
+                        return self.respond_from_entry(request, entry, response)
+
+                instance = await self.get_instance(item_id, self.read_alias(request))
+                if instance is None:
+                    return self.not_found()
+
+                etag, last_modified = self.conditional.instance_validators(instance)
+                not_modified = self.conditional.not_modified(request, etag, last_modified)
+                if not_modified is not None:
+                    return not_modified
+
+                data = await self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                entry = self.detail_entry(data, etag, last_modified)
+                if entry is None:
+                    return data
+                if self.read_cache is not None:
+                    await self.read_cache.aset(request, "detail", entry)
+                return self.respond_from_entry(request, entry, response)
             except Exception as e:
                 return await handle_exception_async(e)
             
@@ -109,26 +254,30 @@ class AsyncModelRouter(BaseModelRouter):
             tags=self.get_tags(),
             operation_id=self.get_operation_id("create")
         )
-        async def create_item(request, payload: self.create_schema) -> Any: # type: ignore
+        async def create_item(request, payload: self.create_schema, response: HttpResponse = None) -> Any: # type: ignore
             """Create a new object."""
             try:
-                if self.before_create:
-                    payload = await self.hook_executor.execute(
-                        self.before_create, request, payload, self.create_schema
-                    ) or payload
+                async with self.awrite_transaction():
+                    if self.before_create:
+                        payload = await self.hook_executor.execute(
+                            self.before_create, request, payload, self.create_schema
+                        ) or payload
 
-                data = await self.model_utils.convert_foreign_keys(self.model, payload.model_dump())
+                    data = await self.model_utils.convert_foreign_keys(self.model, payload.model_dump(), self.database)
 
-                instance = await self.model_utils.create_instance(self.model, **data)
+                    instance = await self.model_utils.create_instance(self.model, self.database, **data)
 
-                if self.after_create:
-                    instance = await self.hook_executor.execute(
-                        self.after_create, request, instance
-                    ) or instance
+                    if self.after_create:
+                        instance = await self.hook_executor.execute(
+                            self.after_create, request, instance
+                        ) or instance
 
-                return await self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                await self.ainvalidate_cache()
+                self.mark_write(response)
+                data = await self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                return self.detail_output(request, data, response)
             except Exception as e:
                 return await handle_exception_async(e)
             
@@ -141,35 +290,39 @@ class AsyncModelRouter(BaseModelRouter):
             tags=self.get_tags(),
             operation_id=self.get_operation_id("create")
         )
-        async def create_item(request, payload: self.create_schema = Form(...)) -> Any: # type: ignore
+        async def create_item(request, payload: self.create_schema = Form(...), response: HttpResponse = None) -> Any: # type: ignore
             """Create a new object with file upload support."""
             try:
-                if self.before_create:
-                    payload = await self.hook_executor.execute(
-                        self.before_create, request, payload, self.create_schema
-                    ) or payload
-
-                data, file_fields_map = await self.file_handler.process_create_files(
-                    request, payload, self.model
-                )
+                async with self.awrite_transaction():
+                    if self.before_create:
+                        payload = await self.hook_executor.execute(
+                            self.before_create, request, payload, self.create_schema
+                        ) or payload
+
+                    data, file_fields_map = await self.file_handler.process_create_files(
+                        request, payload, self.model
+                    )
 
-                data = await self.model_utils.convert_foreign_keys(self.model, data)
+                    data = await self.model_utils.convert_foreign_keys(self.model, data, self.database)
 
-                instance = await self.model_utils.create_instance(self.model, **data)
+                    instance = await self.model_utils.create_instance(self.model, self.database, **data)
 
-                if file_fields_map:
-                    await self.file_handler.handle_file_relations(
-                        instance, file_fields_map, self.model
-                    )
+                    if file_fields_map:
+                        await self.file_handler.handle_file_relations(
+                            instance, file_fields_map, self.model
+                        )
 
-                if self.after_create:
-                    instance = await self.hook_executor.execute(
-                        self.after_create, request, instance
-                    ) or instance
+                    if self.after_create:
+                        instance = await self.hook_executor.execute(
+                            self.after_create, request, instance
+                        ) or instance
 
-                return await self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                await self.ainvalidate_cache()
+                self.mark_write(response)
+                data = await self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                return self.detail_output(request, data, response)
             except Exception as e:
                 return await handle_exception_async(e)
     
@@ -189,31 +342,36 @@ class AsyncModelRouter(BaseModelRouter):
             tags=self.get_tags(),
             operation_id=self.get_operation_id("update")
         )
-        async def update_item(request, item_id: str, payload: self.update_schema) -> Any: # type: ignore
+        async def update_item(request, item_id: self.id_parser.path_type, payload: self.update_schema, response: HttpResponse = None) -> Any: # type: ignore
             """Update an existing object"""
             try:
-                item_id_value = parse_model_id(self.model, item_id)
-                instance = await self.model_utils.get_object_or_404(self.model, id=item_id_value)
-
-                if self.before_update:
-                    payload = await self.hook_executor.execute(
-                        self.before_update, request, instance, payload, self.update_schema
-                    ) or payload
-
-                data = await self.model_utils.convert_foreign_keys(
-                    self.model, payload.model_dump(exclude_unset=True)
-                )
+                async with self.awrite_transaction():
+                    instance = await self.get_instance(item_id)
+                    if instance is None:
+                        return self.not_found()
+
+                    if self.before_update:
+                        payload = await self.hook_executor.execute(
+                            self.before_update, request, instance, payload, self.update_schema
+                        ) or payload
+
+                    data = await self.model_utils.convert_foreign_keys(
+                        self.model, payload.model_dump(exclude_unset=True), self.database
+                    )
 
-                await self.model_utils.update_instance(instance, data)
+                    await self.model_utils.update_instance(instance, data)
 
-                if self.after_update:
-                    instance = await self.hook_executor.execute(
-                        self.after_update, request, instance
-                    ) or instance
+                    if self.after_update:
+                        instance = await self.hook_executor.execute(
+                            self.after_update, request, instance
+                        ) or instance
 
-                return await self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                await self.ainvalidate_cache()
+                self.mark_write(response)
+                data = await self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                return self.detail_output(request, data, response)
             except Exception as e:
                 return await handle_exception_async(e)
             
@@ -226,38 +384,43 @@ class AsyncModelRouter(BaseModelRouter):
             tags=self.get_tags(), 
             operation_id=self.get_operation_id("update")
         )
-        async def update_item(request, item_id: str, payload: self.update_schema = Form(...)) -> Any: # type: ignore
+        async def update_item(request, item_id: self.id_parser.path_type, payload: self.update_schema = Form(...), response: HttpResponse = None) -> Any: # type: ignore
             """Update an existing object with file upload support."""
             try:
-                item_id_value = parse_model_id(self.model, item_id)
-                instance = await self.model_utils.get_object_or_404(self.model, id=item_id_value)
-
-                if self.before_update:
-                    payload = await self.hook_executor.execute(
-                        self.before_update, request, instance, payload, self.update_schema
-                    ) or payload
+                async with self.awrite_transaction():
+                    instance = await self.get_instance(item_id)
+                    if instance is None:
+                        return self.not_found()
+
+                    if self.before_update:
+                        payload = await self.hook_executor.execute(
+                            self.before_update, request, instance, payload, self.update_schema
+                        ) or payload
                 
-                data, file_fields_map = await self.file_handler.process_update_files(
-                    request, payload, self.model
-                )
+                    data, file_fields_map = await self.file_handler.process_update_files(
+                        request, payload, self.model
+                    )
                 
-                data = await self.model_utils.convert_foreign_keys(self.model, data)
+                    data = await self.model_utils.convert_foreign_keys(self.model, data, self.database)
                 
-                await self.model_utils.update_instance(instance, data)
+                    await self.model_utils.update_instance(instance, data)
                 
-                if file_fields_map:
-                    await self.file_handler.handle_file_relations(
-                        instance, file_fields_map, self.model
-                    )
+                    if file_fields_map:
+                        await self.file_handler.handle_file_relations(
+                            instance, file_fields_map, self.model
+                        )
                 
-                if self.after_update:
-                    instance = await self.hook_executor.execute(
-                        self.after_update, request, instance
-                    ) or instance
-                
-                return await self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                    if self.after_update:
+                        instance = await self.hook_executor.execute(
+                            self.after_update, request, instance
+                        ) or instance
+
+                await self.ainvalidate_cache()
+                self.mark_write(response)
+                data = await self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                return self.detail_output(request, data, response)
             except Exception as e:
                 return await handle_exception_async(e)
     
@@ -270,20 +433,24 @@ class AsyncModelRouter(BaseModelRouter):
             tags=self.get_tags(), 
             operation_id=self.get_operation_id("delete")
         )
-        async def delete_item(request, item_id: str) -> Dict[str, str]:
+        async def delete_item(request, item_id: self.id_parser.path_type, response: HttpResponse = None) -> Dict[str, str]: # type: ignore
             """Delete an object."""
             try:
-                item_id_value = parse_model_id(self.model, item_id)
-                instance = await self.model_utils.get_object_or_404(self.model, id=item_id_value)
+                async with self.awrite_transaction():
+                    instance = await self.get_instance(item_id)
+                    if instance is None:
+                        return self.not_found()
 
-                if self.before_delete:
-                    await self.hook_executor.execute(self.before_delete, request, instance)
-                
-                await self.model_utils.delete_instance(instance)
+                    if self.before_delete:
+                        await self.hook_executor.execute(self.before_delete, request, instance)
                 
-                if self.after_delete:
-                    await self.hook_executor.execute(self.after_delete, instance)
+                    await self.model_utils.delete_instance(instance)
                 
+                    if self.after_delete:
+                        await self.hook_executor.execute(self.after_delete, instance)
+
+                await self.ainvalidate_cache()
+                self.mark_write(response)
                 return {"message": f"{self.model.__name__} with ID {item_id} has been deleted"}
             except Exception as e:
                 return await handle_exception_async(e)
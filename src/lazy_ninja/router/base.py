@@ -1,12 +1,33 @@
+import json
+import logging
 from abc import ABC, abstractmethod
-from typing import Type, Optional, List, Any
+from contextlib import asynccontextmanager, nullcontext
+from typing import Type, Optional, List, Any, AsyncIterator, ContextManager
 
-from django.db.models import Model
+from asgiref.sync import sync_to_async
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections, router, transaction
+from django.db.models import Model, QuerySet
+from django.http import HttpResponse, HttpResponseBase
 from ninja import Router, NinjaAPI
 from pydantic import BaseModel
 
+from ..errors import BadRequestError, NotFoundError
+from ..helpers import INVALID_ID, ModelIdParser, QuerysetFilter
 from ..pagination import BasePagination
 from ..file_upload import FileUploadConfig
+from ..handlers.cache import CacheConfig, CacheEntry, build_read_cache, dump_for_cache
+from ..handlers.conditional import ConditionalRequestHandler
+from ..handlers.read_routing import build_read_router
+from ..handlers.search import SearchConfig, build_search_handler
+from ..loaders import use_read_alias
+from ..utils.base import serialize_model_instance
+from ..utils.hooks import HOOK_NAMES, compile_hook, is_default_hook
+from ..utils.schema import is_generated_schema
+from ..utils.type_guards import has_unique_field
+
+logger = logging.getLogger(__name__)
 
 
 class BaseModelRouter(ABC):
@@ -30,6 +51,19 @@ class BaseModelRouter(ABC):
         use_multipart_create: bool = False,
         use_multipart_update: bool = False,
         controller: Optional[Any] = None,
+        conditional_requests: bool = True,
+        cache_config: Optional[CacheConfig] = None,
+        export_routes: bool = False,
+        aggregate_routes: bool = False,
+        import_routes: bool = False,
+        trusted_output: bool = False,
+        lookup_field: Optional[str] = None,
+        search_fields: Optional[SearchConfig] = None,
+        indexed_sort_only: bool = False,
+        read_db: Optional[str] = None,
+        read_your_writes: int = 5,
+        database: Optional[str] = None,
+        atomic_writes: bool = False,
         **hooks
     ):
         """
@@ -48,7 +82,30 @@ class BaseModelRouter(ABC):
             use_multipart_create: Whether to use multipart for create
             use_multipart_update: Whether to use multipart for update
             controller:
-            **hooks: Hook functions (before_create, pre_list, etc.)
+            conditional_requests: Whether read routes send ETag/Last-Modified
+                and answer conditional requests with 304
+            cache_config: Read cache options for the model (see build_read_cache);
+                None disables caching
+            export_routes: Whether to register the streaming export route
+            aggregate_routes: Whether to register the aggregate route
+            import_routes: Whether to register the streaming bulk import route
+            trusted_output: Whether read routes whose output comes from Lazy
+                Ninja's own serializer skip response-model validation
+            lookup_field: Unique field addressed by "/{item_id}" instead of the
+                primary key (e.g. "slug")
+            search_fields: Fields searched by the list route's ``search`` parameter,
+                or a search options dict (see SearchHandler); None disables search
+            indexed_sort_only: Whether ``sort`` is restricted to fields leading
+                a database index
+            read_db: Database alias (e.g. a replica) that read routes query
+            read_your_writes: Seconds a client reads from the primary after
+                one of its writes (see ReadRouter)
+            database: Database alias for all of the model's queries; None
+                leaves routing to DATABASE_ROUTERS
+            atomic_writes: Whether create, update and delete run in one
+                transaction together with their hooks and file relations
+            **hooks: Hook functions (before_create, pre_list, etc.); a list
+                of hooks for one stage runs them in order
         """
         self.api = api
         self.model = model
@@ -63,17 +120,47 @@ class BaseModelRouter(ABC):
         self.use_multipart_update = use_multipart_update
         self.controller = controller
 
-        self.pre_list = hooks.get('pre_list')
-        self.before_create = hooks.get('before_create')
-        self.after_create = hooks.get('after_create')
-        self.before_update = hooks.get('before_update')
-        self.after_update = hooks.get('after_update')
-        self.before_delete = hooks.get('before_delete')
-        self.after_delete = hooks.get('after_delete')
-        self.custom_response = hooks.get('custom_response')
+        # Compiled once: default hooks become None so routes skip them with a
+        # plain check, and stacked hooks become a single HookChain.
+        for name in HOOK_NAMES:
+            setattr(self, name, compile_hook(name, hooks.get(name)))
 
         self.model_name = model.__name__.lower()
         self.paginator_class = pagination_strategy.get_paginator() if pagination_strategy else None
+        self.items_attribute = getattr(self.paginator_class, "items_attribute", "items")
+        if lookup_field is not None and not has_unique_field(model, lookup_field):
+            raise ImproperlyConfigured(
+                f"lookup_field '{lookup_field}' must be a unique field of {model.__name__}"
+            )
+        self.lookup_field = lookup_field or "pk"
+        if database is not None and database not in connections:
+            raise ImproperlyConfigured(f"database '{database}' for {model.__name__} is not in DATABASES")
+        self.database = database
+        self.atomic_writes = atomic_writes
+        self.queryset_filter = QuerysetFilter(model, indexed_sort_only)
+        self.search_handler = build_search_handler(model, self.queryset_filter.field_index, search_fields)
+        self.id_parser = ModelIdParser(
+            model, model._meta.get_field(lookup_field) if lookup_field else None, using=database
+        )
+        self.conditional = ConditionalRequestHandler(model, enabled=conditional_requests)
+        self.read_cache = build_read_cache(model, cache_config)
+        self.read_router = build_read_router(read_db, read_your_writes)
+        # Missing ids are common (crawlers, stale links); the 404 body is built once.
+        self._not_found_body = json.dumps(
+            NotFoundError(f"No {model._meta.object_name} matches the given query.").to_dict()
+        ).encode()
+        self.export_routes = export_routes
+        self.aggregate_routes = aggregate_routes
+        self.import_routes = import_routes
+
+        # Output is trusted only when the generated schema describes exactly
+        # what serialize_model_instance produces and no custom_response (or,
+        # for lists, post_list) hook can change it; response schemas stay
+        # declared for OpenAPI.
+        default_response = trusted_output and is_default_hook(self.custom_response)
+        self.trusted_list = default_response and self.post_list is None and self._matches_serializer(list_schema)
+        self.trusted_detail = default_response and self._matches_serializer(detail_schema)
+        self.detail_response_hook = None if self.trusted_detail else self.custom_response
 
         self.router = Router()
 
@@ -82,6 +169,21 @@ class BaseModelRouter(ABC):
         """Register the list route."""
         pass
 
+    @abstractmethod
+    def register_export_route(self) -> None:
+        """Register the streaming export route."""
+        pass
+
+    @abstractmethod
+    def register_aggregate_route(self) -> None:
+        """Register the aggregate route."""
+        pass
+
+    @abstractmethod
+    def register_import_route(self) -> None:
+        """Register the streaming bulk import route."""
+        pass
+
     @abstractmethod
     def register_detail_route(self) -> None:
         """Register the detail route."""
@@ -103,6 +205,36 @@ class BaseModelRouter(ABC):
         pass
 
     
+    def fixed_paths(self) -> List[str]:
+        """Enabled fixed paths that share the "/{item_id}" level."""
+        paths = []
+        if self.export_routes:
+            paths.append("export")
+        if self.aggregate_routes:
+            paths.append("aggregate")
+        if self.create_schema and self.import_routes:
+            paths.append("import")
+        return paths
+
+    def warn_shadowed_ids(self) -> None:
+        """
+        Warn when an enabled fixed path is also a valid id for the model.
+
+        With a string primary key or ``lookup_field``, an object whose id is
+        "export", "aggregate" or "import" cannot be read, updated or deleted
+        through "/{item_id}", because the fixed path matches first.
+        """
+        for path in self.fixed_paths():
+            if self.id_parser.path_type is str and self.id_parser.parse(path) is not INVALID_ID:
+                logger.warning(
+                    "%s '/%s' shadows objects whose %s is '%s'; disable the route or "
+                    "keep that value reserved.",
+                    self.model.__name__,
+                    path,
+                    self.lookup_field,
+                    path,
+                )
+
     def finalize(self) -> None:
         """
         Register all routes and add the router to the API.
@@ -110,6 +242,18 @@ class BaseModelRouter(ABC):
         This method orchestrates the route registration process.
         """
         self.register_list_route()
+
+        # Fixed paths must be registered before "/{item_id}" to be reachable.
+        self.warn_shadowed_ids()
+        if self.export_routes:
+            self.register_export_route()
+
+        if self.aggregate_routes:
+            self.register_aggregate_route()
+
+        if self.create_schema and self.import_routes:
+            self.register_import_route()
+
         self.register_detail_route()
 
         if self.create_schema:
@@ -129,4 +273,239 @@ class BaseModelRouter(ABC):
     def get_tags(self) -> List[str]:
         """Get tags for route grouping."""
         return [self.model.__name__]
-    
+
+    def _matches_serializer(self, schema: Type[BaseModel]) -> bool:
+        """Check that a schema is generated and covers exactly the fields serialize_model_instance emits."""
+        fields = {field.name for field in self.model._meta.fields}
+        return is_generated_schema(schema) and set(schema.model_fields) == fields
+
+    @staticmethod
+    def serialize_items(items: Any) -> List[Any]:
+        """Serialize model instances in a page, leaving anything else untouched."""
+        return [
+            serialize_model_instance(item) if isinstance(item, Model) else item
+            for item in items
+        ]
+
+    @staticmethod
+    def schema_payload(schema: Type[BaseModel], data: Any) -> Any:
+        """Validate data against a response schema and dump it the way ninja does before rendering."""
+        return schema.model_validate(data, from_attributes=True).model_dump()
+
+    def detail_entry(
+        self,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[int] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Build the response entry for a serialized detail payload.
+
+        ``etag`` comes from the version column when the model has one; without
+        it the payload is hashed, after dumping it through the detail schema so
+        the same dump is rendered without ninja serializing it again. Returns
+        None for ready-made responses, which are neither cached nor given
+        validators.
+        """
+        if isinstance(data, HttpResponseBase):
+            return None
+        trusted = self.trusted_detail
+        hashed = etag is None and last_modified is None and self.conditional.enabled
+        if self.read_cache is not None:
+            data = dump_for_cache(self.detail_schema, data)
+        elif hashed and not trusted:
+            data = self.schema_payload(self.detail_schema, data)
+            trusted = True
+        if hashed:
+            etag = self.conditional.payload_etag(data)
+        return {"data": data, "etag": etag, "last_modified": last_modified, "trusted": trusted}
+
+    def list_entry(self, page: Any, serialize: bool = False) -> Optional[CacheEntry]:
+        """
+        Build the response entry for a paginated list page.
+
+        The ETag comes from the version column of the page items when possible,
+        otherwise from a hash of the serialized page. Returns None when the view
+        did not produce a page (e.g. an error response). With ``serialize`` the
+        page items are always returned serialized.
+
+        Pages serialized here through the list schema are rendered directly,
+        so ninja does not serialize them a second time.
+        """
+        if not isinstance(page, dict) or page.get(self.items_attribute) is None:
+            return None
+
+        items = page[self.items_attribute]
+        etag = None
+        # post_list enrichment is not covered by the version column.
+        if self.conditional.enabled and self.post_list is None:
+            extra = [(key, str(value)) for key, value in sorted(page.items()) if key != self.items_attribute]
+            etag = self.conditional.page_etag(items, extra)
+
+        hashed = etag is None and self.conditional.enabled
+        trusted = self.trusted_list
+        if trusted:
+            page = {**page, self.items_attribute: self.serialize_items(items)}
+        elif self.read_cache is not None:
+            page = {**page, self.items_attribute: [dump_for_cache(self.list_schema, item) for item in items]}
+        elif serialize or hashed:
+            page = {**page, self.items_attribute: [self.schema_payload(self.list_schema, item) for item in items]}
+            trusted = True
+
+        if hashed:
+            etag = self.conditional.payload_etag(page)
+        return {"data": page, "etag": etag, "last_modified": None, "trusted": trusted}
+
+    def respond_from_entry(self, request: Any, entry: CacheEntry, response: Optional[HttpResponse] = None) -> Any:
+        """
+        Answer a conditional request with 304, or return the entry data with its validators.
+
+        Trusted entries are rendered here, which skips ninja's validation
+        against the response schema.
+        """
+        not_modified = self.conditional.not_modified(request, entry["etag"], entry["last_modified"])
+        if not_modified is not None:
+            return not_modified
+
+        self.conditional.apply(response, entry["etag"], entry["last_modified"])
+        if entry.get("trusted"):
+            return self.render_trusted(request, entry["data"], response)
+        return entry["data"]
+
+    def page_rows(self, page: Any) -> Optional[Any]:
+        """Return the rows of a paginated page, or None when the view did not produce one."""
+        if not isinstance(page, dict):
+            return None
+        return page.get(self.items_attribute)
+
+    def with_rows(self, page: dict, rows: List[Any], result: Any) -> dict:
+        """Replace a page's rows with what post_list returned; None keeps the rows."""
+        return {**page, self.items_attribute: rows if result is None else result}
+
+    def read_alias(self, request: Any) -> Optional[str]:
+        """Database alias for the request's reads; None keeps Django's routing."""
+        if self.read_router is None:
+            return None
+        alias = self.read_router.alias_for(request)
+        # Loaders used by the route's hooks read from the same database.
+        use_read_alias(request, alias)
+        return alias
+
+    def read_queryset(self, request: Any) -> QuerySet:
+        """Base queryset for list, export and aggregate reads."""
+        return self.model.objects.using(self.read_alias(request) or self.database)
+
+    def filtered_queryset(
+        self,
+        request: Any,
+        q: Optional[str] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: Optional[str] = "asc",
+        **kwargs: Any,
+    ) -> QuerySet:
+        """
+        Build the queryset of the list, export and aggregate routes.
+
+        Applies, in order, read_queryset, the ``pre_list`` hook, ``search`` and
+        ``q``/``sort``/field filters. Nothing is fetched: the caller decides how
+        the rows are read.
+        """
+        queryset = self.read_queryset(request)
+        if self.pre_list:
+            # Not `or queryset`: truthiness would evaluate the whole queryset.
+            hook_result = self.hook_executor.execute(self.pre_list, request, queryset)
+            if hook_result is not None:
+                queryset = hook_result
+        if search:
+            queryset = self.apply_search(queryset, search)
+        return self.queryset_filter.apply_filters(queryset, q, sort, order, **kwargs)
+
+    async def afiltered_queryset(
+        self,
+        request: Any,
+        q: Optional[str] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: Optional[str] = "asc",
+        **kwargs: Any,
+    ) -> QuerySet:
+        """Async version of filtered_queryset; search backend detection runs in a worker thread."""
+        queryset = self.read_queryset(request)
+        if self.pre_list:
+            hook_result = await self.hook_executor.execute(self.pre_list, request, queryset)
+            if hook_result is not None:
+                queryset = hook_result
+        if search:
+            # Search backend detection may query the database once.
+            queryset = await sync_to_async(self.apply_search)(queryset, search)
+        return self.queryset_filter.apply_filters(queryset, q, sort, order, **kwargs)
+
+    @property
+    def write_db(self) -> str:
+        """Database alias the model's writes go to."""
+        return self.database or router.db_for_write(self.model)
+
+    def write_transaction(self) -> ContextManager[Any]:
+        """Transaction around a write route's body when ``atomic_writes`` is enabled."""
+        if not self.atomic_writes:
+            return nullcontext()
+        return transaction.atomic(using=self.write_db)
+
+    @asynccontextmanager
+    async def awrite_transaction(self) -> AsyncIterator[None]:
+        """
+        Async version of write_transaction.
+
+        The atomic block is entered and left through sync_to_async, which runs
+        in the same thread as the route's other ORM calls, so they all share
+        the transaction.
+        """
+        if not self.atomic_writes:
+            yield
+            return
+        atomic = transaction.atomic(using=self.write_db)
+        await sync_to_async(atomic.__enter__)()
+        try:
+            yield
+        except BaseException as e:
+            await sync_to_async(atomic.__exit__)(type(e), e, e.__traceback__)
+            raise
+        await sync_to_async(atomic.__exit__)(None, None, None)
+
+    def mark_write(self, response: Optional[HttpResponse]) -> None:
+        """Keep the client's reads on the primary for a while after a write."""
+        if self.read_router is not None:
+            self.read_router.mark_write(response)
+
+    def apply_search(self, queryset: Any, term: str) -> Any:
+        """Apply the ``search`` query parameter with the model's search handler."""
+        if self.search_handler is None:
+            raise BadRequestError(f"Search is not enabled for {self.model.__name__}")
+        return self.search_handler.apply(queryset, term)
+
+    def not_found(self) -> HttpResponse:
+        """Return the 404 response for a missing object without raising."""
+        return HttpResponse(self._not_found_body, status=404, content_type="application/json")
+
+    def detail_output(self, request: Any, data: Any, response: Optional[HttpResponse] = None) -> Any:
+        """Return a create/update payload, rendering it directly when trusted."""
+        if self.trusted_detail:
+            return self.render_trusted(request, data, response)
+        return data
+
+    def render_trusted(self, request: Any, data: Any, response: Optional[HttpResponse] = None) -> Any:
+        """Render already-serialized output directly with the API renderer."""
+        if isinstance(data, HttpResponseBase):
+            return data
+        return self.api.create_response(request, data, status=200, temporal_response=response)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached reads for the model after a write through the generated routes."""
+        if self.read_cache is not None:
+            self.read_cache.invalidate()
+
+    async def ainvalidate_cache(self) -> None:
+        """Async version of invalidate_cache."""
+        if self.read_cache is not None:
+            await self.read_cache.ainvalidate()
@@ -1,16 +1,20 @@
-from typing import List, Any, Dict, Optional, Union
+from functools import wraps
+from typing import List, Any, Dict, Optional, Union, Callable
 
-from django.shortcuts import get_object_or_404
+from django.http import HttpResponse
 from django.db.models import QuerySet
-from ninja import Form
+from ninja import Form, Query
 from ninja.pagination import paginate
 
 from .base import BaseModelRouter
 from ..handlers.response import SyncResponseHandler
 from ..handlers.file_handler import SyncFileHandler
+from ..handlers.export import SyncExportHandler
+from ..handlers.aggregate import SyncAggregateHandler, AggregateResult
+from ..handlers.bulk_import import SyncImportHandler, ImportReport
 from ..utils.hooks import SyncHookExecutor
 from ..utils.model import SyncModelUtils
-from ..helpers import QuerysetFilter, parse_model_id
+from ..helpers import INVALID_ID
 from ..errors import handle_exception
 
 
@@ -25,9 +29,48 @@ class SyncModelRouter(BaseModelRouter):
         super().__init__(*args, **kwargs)
         self.response_handler = SyncResponseHandler()
         self.file_handler = SyncFileHandler(self.file_upload_config)
-        self.hook_executor = SyncHookExecutor()
+        self.hook_executor = SyncHookExecutor(self.write_db)
         self.model_utils = SyncModelUtils()
-        self.queryset_filter = QuerysetFilter(self.model)
+        self.export_handler = SyncExportHandler(self.model, self.list_schema)
+        self.aggregate_handler = SyncAggregateHandler(self.model, self.queryset_filter.field_index, self.list_schema)
+        self.import_handler = SyncImportHandler(self.model, self.create_schema, using=self.database) if self.create_schema else None
+
+    def get_instance(self, item_id: Any, using: Optional[str] = None) -> Optional[Any]:
+        """Fetch the object addressed by a path id, or None if the id is invalid or missing."""
+        value = self.id_parser.parse(item_id)
+        if value is INVALID_ID:
+            return None
+        return self.model_utils.get_object_or_none(self.model, using or self.database, **{self.lookup_field: value})
+
+    def list_pipeline(self, view: Callable) -> Callable:
+        """Wrap the paginated list view with post-pagination processing."""
+
+        @wraps(view)
+        def list_view(request, **kwargs: Any) -> Any:
+            response = kwargs.get("response")
+            if self.read_cache is not None:
+                entry = self.read_cache.get(request, "list")
+                if entry is not None:
+                    return self.respond_from_entry(request, entry, response)
+
+            try:
+                # Errors are handled here: the paginator cannot page an error response.
+                page = view(request, **kwargs)
+                rows = self.page_rows(page)
+                if self.post_list and rows is not None:
+                    # One call per page, so enrichment can batch its queries.
+                    rows = list(rows)
+                    page = self.with_rows(page, rows, self.hook_executor.execute(self.post_list, request, rows))
+            except Exception as e:
+                return handle_exception(e)
+            entry = self.list_entry(page)
+            if entry is None:
+                return page
+            if self.read_cache is not None:
+                self.read_cache.set(request, "list", entry)
+            return self.respond_from_entry(request, entry, response)
+
+        return list_view
     
     def register_list_route(self) -> None:
         """Register sync list route with pagination and filtering."""
@@ -38,27 +81,105 @@ class SyncModelRouter(BaseModelRouter):
             tags=self.get_tags(), 
             operation_id=self.get_operation_id("list")
         )
+        @self.list_pipeline
         @paginate(self.paginator_class)
         def list_items(
             request, 
             q: Optional[str] = None, 
+            search: Optional[str] = None,
             sort: Optional[str] = None,
             order: Optional[str] = "asc", 
+            response: HttpResponse = None,
             **kwargs: Any
         ) -> Union[QuerySet, Any]:
             """List objects with optional filtering and sorting."""
+            queryset = self.filtered_queryset(request, q, search, sort, order, **kwargs)
+            return queryset if not self.custom_response else self.custom_response(request, queryset)
+    
+    def register_export_route(self) -> None:
+        """Register sync streaming export route."""
+
+        @self.router.get(
+            "/export",
+            tags=self.get_tags(),
+            operation_id=self.get_operation_id("export")
+        )
+        def export_items(
+            request,
+            fmt: str = Query("ndjson", alias="format"),
+            q: Optional[str] = None,
+            search: Optional[str] = None,
+            sort: Optional[str] = None,
+            order: Optional[str] = "asc",
+            **kwargs: Any
+        ) -> Any:
+            """Stream all matching objects as NDJSON or CSV."""
             try:
-                queryset = self.model.objects.all()
-                
-                if self.pre_list:
-                    queryset = self.hook_executor.execute(self.pre_list, request, queryset) or queryset
-                
-                queryset = self.queryset_filter.apply_filters(queryset, q, sort, order, **kwargs)
-                
-                return queryset if not self.custom_response else self.custom_response(request, queryset)
+                fmt = self.export_handler.check_format(fmt)
+                queryset = self.filtered_queryset(request, q, search, sort, order, **kwargs)
+                return self.export_handler.build_response(
+                    self.export_handler.stream(queryset, fmt), fmt, self.base_url.strip("/")
+                )
             except Exception as e:
                 return handle_exception(e)
-    
+
+    def register_aggregate_route(self) -> None:
+        """Register sync aggregate route."""
+
+        @self.router.get(
+            "/aggregate",
+            response=AggregateResult,
+            tags=self.get_tags(),
+            operation_id=self.get_operation_id("aggregate")
+        )
+        def aggregate_items(
+            request,
+            group_by: Optional[str] = None,
+            count: Optional[str] = None,
+            sum_fields: Optional[str] = Query(None, alias="sum"),
+            avg_fields: Optional[str] = Query(None, alias="avg"),
+            min_fields: Optional[str] = Query(None, alias="min"),
+            max_fields: Optional[str] = Query(None, alias="max"),
+            q: Optional[str] = None,
+            **kwargs: Any
+        ) -> Any:
+            """Count, sum, average, min or max matching objects, optionally grouped."""
+            try:
+                queryset = self.filtered_queryset(request, q, **kwargs)
+                return self.aggregate_handler.run(
+                    queryset,
+                    group_by,
+                    count=count,
+                    sum=sum_fields,
+                    avg=avg_fields,
+                    min=min_fields,
+                    max=max_fields,
+                )
+            except Exception as e:
+                return handle_exception(e)
+
+    def register_import_route(self) -> None:
+        """Register sync streaming bulk import route."""
+
+        @self.router.post(
+            "/import",
+            response=ImportReport,
+            tags=self.get_tags(),
+            operation_id=self.get_operation_id("import")
+        )
+        def import_items(request, fmt: Optional[str] = Query(None, alias="format"), response: HttpResponse = None) -> Any:
+            """Create objects in bulk from an NDJSON or CSV request body."""
+            try:
+                fmt = self.import_handler.detect_format(request, fmt)
+                report = self.import_handler.run(
+                    request, fmt, self.before_create, self.after_create
+                )
+                self.invalidate_cache()
+                self.mark_write(response)
+                return report
+            except Exception as e:
+                return handle_exception(e)
+
     def register_detail_route(self) -> None:
         """Register sync detail route."""
         
@@ -68,14 +189,32 @@ class SyncModelRouter(BaseModelRouter):
             tags=self.get_tags(), 
             operation_id=self.get_operation_id("get")
         )
-        def get_item(request, item_id: str) -> Any:
+        def get_item(request, item_id: self.id_parser.path_type, response: HttpResponse) -> Any: # type: ignore
             """Retrieve a single object by ID."""
             try:
-                item_id_value = parse_model_id(self.model, item_id)
-                instance = get_object_or_404(self.model, id=item_id_value)
-                return self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                if self.read_cache is not None:
+                    entry = self.read_cache.get(request, "detail")
+                    if entry is not None:
+                        return self.respond_from_entry(request, entry, response)
+
+                instance = self.get_instance(item_id, self.read_alias(request))
+                if instance is None:
+                    return self.not_found()
+
+                etag, last_modified = self.conditional.instance_validators(instance)
+                not_modified = self.conditional.not_modified(request, etag, last_modified)
+                if not_modified is not None:
+                    return not_modified
+
+                data = self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                entry = self.detail_entry(data, etag, last_modified)
+                if entry is None:
+                    return data
+                if self.read_cache is not None:
+                    self.read_cache.set(request, "detail", entry)
+                return self.respond_from_entry(request, entry, response)
             except Exception as e:
                 return handle_exception(e)
     
@@ -95,26 +234,30 @@ class SyncModelRouter(BaseModelRouter):
             tags=self.get_tags(), 
             operation_id=self.get_operation_id("create")
         )
-        def create_item(request, payload: self.create_schema) -> Any: # type: ignore
+        def create_item(request, payload: self.create_schema, response: HttpResponse = None) -> Any: # type: ignore
             """Create a new object."""
             try:
-                if self.before_create:
-                    payload = self.hook_executor.execute(
-                        self.before_create, request, payload, self.create_schema
-                    ) or payload
-                
-                data = self.model_utils.convert_foreign_keys(self.model, payload.model_dump())
+                with self.write_transaction():
+                    if self.before_create:
+                        payload = self.hook_executor.execute(
+                            self.before_create, request, payload, self.create_schema
+                        ) or payload
                 
-                instance = self.model.objects.create(**data)
+                    data = self.model_utils.convert_foreign_keys(self.model, payload.model_dump(), self.database)
                 
-                if self.after_create:
-                    instance = self.hook_executor.execute(
-                        self.after_create, request, instance
-                    ) or instance
+                    instance = self.model.objects.db_manager(self.database).create(**data)
                 
-                return self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                    if self.after_create:
+                        instance = self.hook_executor.execute(
+                            self.after_create, request, instance
+                        ) or instance
+
+                self.invalidate_cache()
+                self.mark_write(response)
+                data = self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                return self.detail_output(request, data, response)
             except Exception as e:
                 return handle_exception(e)
     
@@ -127,35 +270,39 @@ class SyncModelRouter(BaseModelRouter):
             tags=self.get_tags(), 
             operation_id=self.get_operation_id("create")
         )
-        def create_item(request, payload: self.create_schema = Form(...)) -> Any: # type: ignore
+        def create_item(request, payload: self.create_schema = Form(...), response: HttpResponse = None) -> Any: # type: ignore
             """Create a new object with file upload support."""
             try:
-                if self.before_create:
-                    payload = self.hook_executor.execute(
-                        self.before_create, request, payload, self.create_schema
-                    ) or payload
-                
-                data, file_fields_map = self.file_handler.process_create_files(
-                    request, payload, self.model
-                )
+                with self.write_transaction():
+                    if self.before_create:
+                        payload = self.hook_executor.execute(
+                            self.before_create, request, payload, self.create_schema
+                        ) or payload
                 
-                data = self.model_utils.convert_foreign_keys(self.model, data)
+                    data, file_fields_map = self.file_handler.process_create_files(
+                        request, payload, self.model
+                    )
                 
-                instance = self.model.objects.create(**data)
+                    data = self.model_utils.convert_foreign_keys(self.model, data, self.database)
                 
-                if file_fields_map:
-                    self.file_handler.handle_file_relations(
-                        instance, file_fields_map, self.model
-                    )
+                    instance = self.model.objects.db_manager(self.database).create(**data)
                 
-                if self.after_create:
-                    instance = self.hook_executor.execute(
-                        self.after_create, request, instance
-                    ) or instance
+                    if file_fields_map:
+                        self.file_handler.handle_file_relations(
+                            instance, file_fields_map, self.model
+                        )
                 
-                return self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                    if self.after_create:
+                        instance = self.hook_executor.execute(
+                            self.after_create, request, instance
+                        ) or instance
+
+                self.invalidate_cache()
+                self.mark_write(response)
+                data = self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                return self.detail_output(request, data, response)
             except Exception as e:
                 return handle_exception(e)
     
@@ -175,33 +322,38 @@ class SyncModelRouter(BaseModelRouter):
             tags=self.get_tags(), 
             operation_id=self.get_operation_id("update")
         )
-        def update_item(request, item_id: str, payload: self.update_schema) -> Any: # type: ignore
+        def update_item(request, item_id: self.id_parser.path_type, payload: self.update_schema, response: HttpResponse = None) -> Any: # type: ignore
             """Update an existing object."""
             try:
-                item_id_value = parse_model_id(self.model, item_id)
-                instance = get_object_or_404(self.model, id=item_id_value)
+                with self.write_transaction():
+                    instance = self.get_instance(item_id)
+                    if instance is None:
+                        return self.not_found()
 
-                if self.before_update:
-                    payload = self.hook_executor.execute(
-                        self.before_update, request, instance, payload, self.update_schema
-                    ) or payload
+                    if self.before_update:
+                        payload = self.hook_executor.execute(
+                            self.before_update, request, instance, payload, self.update_schema
+                        ) or payload
                 
-                data = self.model_utils.convert_foreign_keys(
-                    self.model, payload.model_dump(exclude_unset=True)
-                )
-                
-                for key, value in data.items():
-                    setattr(instance, key, value)
-                instance.save()
+                    data = self.model_utils.convert_foreign_keys(
+                        self.model, payload.model_dump(exclude_unset=True), self.database
+                    )
                 
-                if self.after_update:
-                    instance = self.hook_executor.execute(
-                        self.after_update, request, instance
-                    ) or instance
+                    for key, value in data.items():
+                        setattr(instance, key, value)
+                    instance.save()
                 
-                return self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                    if self.after_update:
+                        instance = self.hook_executor.execute(
+                            self.after_update, request, instance
+                        ) or instance
+
+                self.invalidate_cache()
+                self.mark_write(response)
+                data = self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                return self.detail_output(request, data, response)
             except Exception as e:
                 return handle_exception(e)
     
@@ -214,40 +366,45 @@ class SyncModelRouter(BaseModelRouter):
             tags=self.get_tags(), 
             operation_id=self.get_operation_id("update")
         )
-        def update_item(request, item_id: str, payload: self.update_schema = Form(...)) -> Any: # type: ignore
+        def update_item(request, item_id: self.id_parser.path_type, payload: self.update_schema = Form(...), response: HttpResponse = None) -> Any: # type: ignore
             """Update an existing object with file upload support."""
             try:
-                item_id_value = parse_model_id(self.model, item_id)
-                instance = get_object_or_404(self.model, id=item_id_value)
+                with self.write_transaction():
+                    instance = self.get_instance(item_id)
+                    if instance is None:
+                        return self.not_found()
                 
-                if self.before_update:
-                    payload = self.hook_executor.execute(
-                        self.before_update, request, instance, payload, self.update_schema
-                    ) or payload
+                    if self.before_update:
+                        payload = self.hook_executor.execute(
+                            self.before_update, request, instance, payload, self.update_schema
+                        ) or payload
                 
-                data, file_fields_map = self.file_handler.process_update_files(
-                    request, payload, self.model
-                )
-                
-                data = self.model_utils.convert_foreign_keys(self.model, data)
+                    data, file_fields_map = self.file_handler.process_update_files(
+                        request, payload, self.model
+                    )
                 
-                for key, value in data.items():
-                    setattr(instance, key, value)
-                instance.save()
+                    data = self.model_utils.convert_foreign_keys(self.model, data, self.database)
                 
-                if file_fields_map:
-                    self.file_handler.handle_file_relations(
-                        instance, file_fields_map, self.model
-                    )
+                    for key, value in data.items():
+                        setattr(instance, key, value)
+                    instance.save()
                 
-                if self.after_update:
-                    instance = self.hook_executor.execute(
-                        self.after_update, request, instance
-                    ) or instance
+                    if file_fields_map:
+                        self.file_handler.handle_file_relations(
+                            instance, file_fields_map, self.model
+                        )
                 
-                return self.response_handler.handle_response(
-                    instance, self.detail_schema, self.custom_response, request
+                    if self.after_update:
+                        instance = self.hook_executor.execute(
+                            self.after_update, request, instance
+                        ) or instance
+
+                self.invalidate_cache()
+                self.mark_write(response)
+                data = self.response_handler.handle_response(
+                    instance, self.detail_schema, self.detail_response_hook, request
                 )
+                return self.detail_output(request, data, response)
             except Exception as e:
                 return handle_exception(e)
     
@@ -260,20 +417,24 @@ class SyncModelRouter(BaseModelRouter):
             tags=self.get_tags(), 
             operation_id=self.get_operation_id("delete")
         )
-        def delete_item(request, item_id: str) -> Dict[str, str]:
+        def delete_item(request, item_id: self.id_parser.path_type, response: HttpResponse = None) -> Dict[str, str]: # type: ignore
             """Delete an object."""
             try:
-                item_id_value = parse_model_id(self.model, item_id)
-                instance = get_object_or_404(self.model, id=item_id_value)
+                with self.write_transaction():
+                    instance = self.get_instance(item_id)
+                    if instance is None:
+                        return self.not_found()
 
-                if self.before_delete:
-                    self.hook_executor.execute(self.before_delete, request, instance)
-                
-                instance.delete()
+                    if self.before_delete:
+                        self.hook_executor.execute(self.before_delete, request, instance)
                 
-                if self.after_delete:
-                    self.hook_executor.execute(self.after_delete, instance)
+                    instance.delete()
                 
+                    if self.after_delete:
+                        self.hook_executor.execute(self.after_delete, instance)
+
+                self.invalidate_cache()
+                self.mark_write(response)
                 return {"message": f"{self.model.__name__} with ID {item_id} has been deleted."}
             except Exception as e:
                 return handle_exception(e)
@@ -1,5 +1,5 @@
 """Route registration facade delegating to sync/async model routers."""
-from typing import Type, Optional, Callable, Any
+from typing import Type, Optional, Callable, Any, List
 
 from django.db.models import Model
 
@@ -10,6 +10,8 @@ from .router.base import BaseModelRouter
 from .router.async_router import AsyncModelRouter
 from .router.sync_router import SyncModelRouter
 from .pagination import BasePagination
+from .handlers.cache import CacheConfig
+from .handlers.search import SearchConfig
 from .file_upload import FileUploadConfig
 
 
@@ -22,6 +24,7 @@ def register_model_routes_internal(
     create_schema: Optional[Type[BaseModel]] = None,
     update_schema: Optional[Type[BaseModel]] = None,
     pre_list: Optional[Callable[[Any, Any], Any]] = None,
+    post_list: Optional[Callable[[Any, List[Any]], Any]] = None,
     before_create: Optional[Callable[[Any, Any, Type[Schema]], Any]] = None,
     after_create: Optional[Callable[[Any, Any], Any]] = None,
     before_update: Optional[Callable[[Any, Any, Type[Schema]], Any]] = None,
@@ -34,6 +37,19 @@ def register_model_routes_internal(
     use_multipart_create: bool = False,
     use_multipart_update: bool = False,
     is_async: bool = True,
+    conditional_requests: bool = True,
+    cache_config: Optional[CacheConfig] = None,
+    export_routes: bool = False,
+    aggregate_routes: bool = False,
+    import_routes: bool = False,
+    trusted_output: bool = False,
+    lookup_field: Optional[str] = None,
+    search_fields: Optional[SearchConfig] = None,
+    indexed_sort_only: bool = False,
+    read_db: Optional[str] = None,
+    read_your_writes: int = 5,
+    database: Optional[str] = None,
+    atomic_writes: bool = False,
 ) -> None:
     """Register CRUD routes for a Django model using the appropriate router implementation."""
 
@@ -52,7 +68,21 @@ def register_model_routes_internal(
         file_upload_config=file_upload_config,
         use_multipart_create=use_multipart_create,
         use_multipart_update=use_multipart_update,
+        conditional_requests=conditional_requests,
+        cache_config=cache_config,
+        export_routes=export_routes,
+        aggregate_routes=aggregate_routes,
+        import_routes=import_routes,
+        trusted_output=trusted_output,
+        lookup_field=lookup_field,
+        search_fields=search_fields,
+        indexed_sort_only=indexed_sort_only,
+        read_db=read_db,
+        read_your_writes=read_your_writes,
+        database=database,
+        atomic_writes=atomic_writes,
         pre_list=pre_list,
+        post_list=post_list,
         before_create=before_create,
         after_create=after_create,
         before_update=before_update,
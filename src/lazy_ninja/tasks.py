@@ -0,0 +1,77 @@
+"""Task runners for hooks that run in the background (see ``utils.hooks.background``)."""
+import logging
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class TaskRunner(ABC):
+    """
+    Interface for running background hooks.
+
+    ``submit`` receives the hook and its arguments once the write has
+    committed. Runners for external queues (Celery, RQ, ...) enqueue a job
+    here; since hooks receive the request and model instance, such runners
+    usually pass on something serializable, such as the instance's pk.
+    """
+
+    @abstractmethod
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Schedule ``func(*args, **kwargs)``."""
+
+
+def _run_task(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    close_old_connections()
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background hook %s failed", getattr(func, "__qualname__", func))
+    finally:
+        close_old_connections()
+
+
+class ThreadPoolTaskRunner(TaskRunner):
+    """Runs tasks on an in-process thread pool; the default runner."""
+
+    def __init__(self, max_workers: Optional[int] = 4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lazy-ninja-task")
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self.executor.submit(_run_task, func, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
+
+
+class ImmediateTaskRunner(TaskRunner):
+    """Runs tasks synchronously in the calling thread; meant for tests."""
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        func(*args, **kwargs)
+
+
+_runner: Optional[TaskRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_task_runner() -> TaskRunner:
+    """Return the task runner, creating the default thread pool on first use."""
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = ThreadPoolTaskRunner()
+    return _runner
+
+
+def set_task_runner(runner: Optional[TaskRunner]) -> Optional[TaskRunner]:
+    """Install the task runner for background hooks and return the previous one; None restores the default."""
+    global _runner
+    with _runner_lock:
+        previous, _runner = _runner, runner
+    return previous
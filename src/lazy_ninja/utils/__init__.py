@@ -20,7 +20,7 @@ from .base import (
 from .schema import generate_schema
 
 # Component classes
-from .hooks import SyncHookExecutor, AsyncHookExecutor
+from .hooks import SyncHookExecutor, AsyncHookExecutor, on_commit, background
 from .model import SyncModelUtils, AsyncModelUtils
 
 # Legacy functions
@@ -46,6 +46,8 @@ __all__ = [
     'AsyncHookExecutor', 
     'SyncModelUtils',
     'AsyncModelUtils',
+    'on_commit',
+    'background',
     
     # Legacy (deprecated)
     'handle_response_async',
@@ -1,13 +1,222 @@
-from typing import Any, Callable, Optional
-from asgiref.sync import sync_to_async
+import inspect
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.db import transaction
 
+from ..tasks import get_task_runner
 
-class BaseHookExecutor:
+
+def _hook_flag(hook: Callable, flag: str) -> bool:
+    """
+    Read a marker attribute from a hook.
+
+    Markers set below ``@classmethod`` are visible through the bound method;
+    markers set on the classmethod object itself are looked up on the owning
+    class.
+    """
+    if getattr(hook, flag, False):
+        return True
+    owner = getattr(hook, "__self__", None)
+    name = getattr(hook, "__name__", None)
+    if owner is None or name is None:
+        return False
+    owner_cls = owner if isinstance(owner, type) else type(owner)
+    return bool(getattr(inspect.getattr_static(owner_cls, name, None), flag, False))
+
+
+def is_default_hook(hook: Optional[Callable]) -> bool:
+    """Check whether a hook is missing or one of BaseModelController's no-op defaults."""
+    return hook is None or _hook_flag(hook, "__is_default_hook__")
+
+
+def on_commit(hook: Callable) -> Callable:
+    """
+    Mark a hook to run once the surrounding transaction commits.
+
+    The hook is handed to ``transaction.on_commit`` instead of being called
+    inline, so side effects (emails, webhooks) never fire for a write that
+    rolls back. Its return value is ignored; outside a transaction it runs
+    immediately.
+
+    Example:
+        class OrderController(BaseModelController):
+            @classmethod
+            @on_commit
+            def after_create(cls, request, instance):
+                send_confirmation(instance)
+    """
+    hook.__lazy_ninja_on_commit__ = True
+    return hook
+
+
+def is_on_commit_hook(hook: Callable) -> bool:
+    return _hook_flag(hook, "__lazy_ninja_on_commit__")
+
+
+def background(hook: Callable) -> Callable:
+    """
+    Mark a hook to run on the task runner after the surrounding transaction commits.
+
+    Slow side effects (emails, webhooks, search indexing) then stay out of
+    the request's latency. The hook runs on ``lazy_ninja.tasks``'s runner,
+    an in-process thread pool unless ``set_task_runner`` installed another.
+    Its return value is ignored and exceptions are logged.
+
+    Example:
+        class OrderController(BaseModelController):
+            @classmethod
+            @background
+            def after_update(cls, request, instance):
+                reindex(instance.pk)
+    """
+    hook.__lazy_ninja_background__ = True
+    return hook
+
+
+def is_background_hook(hook: Callable) -> bool:
+    return _hook_flag(hook, "__lazy_ninja_background__")
+
+
+# Controller hooks, mapped to the index of the argument a hook may return a
+# replacement for (the payload, instance, queryset, ...). Chained hooks pass
+# that value on; None means return values are ignored.
+HOOK_ARGUMENTS: Dict[str, Optional[int]] = {
+    "pre_list": 1,
+    "post_list": 1,
+    "before_create": 1,
+    "after_create": 1,
+    "before_update": 2,
+    "after_update": 1,
+    "before_delete": None,
+    "after_delete": None,
+    "custom_response": 1,
+}
+
+HOOK_NAMES = tuple(HOOK_ARGUMENTS)
+
+
+class HookChain:
+    """
+    Several hooks for the same stage, run in order.
+
+    When a hook returns something other than None it replaces the value the
+    stage threads through (see ``HOOK_ARGUMENTS``) for the hooks after it,
+    and the chain returns the final value. ``@on_commit`` and ``@background``
+    markers apply per hook.
+    """
+
+    def __init__(self, name: str, hooks: Iterable[Callable]):
+        self.name = name
+        self.hooks = tuple(hooks)
+        self.argument = HOOK_ARGUMENTS[name]
+        # Kept for the chain's lifetime so their dispatch caches are reused.
+        self._executor = SyncHookExecutor()
+        self._async_executor = AsyncHookExecutor()
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._executor.execute(self, *args, **kwargs)
+
+    async def acall(self, *args, **kwargs) -> Any:
+        return await self._async_executor.execute(self, *args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"HookChain({self.name!r}, {list(self.hooks)!r})"
+
+
+HookSpec = Union[None, Callable, Iterable[Optional[Callable]]]
+
+
+def compile_hook(name: str, hook: HookSpec) -> Optional[Callable]:
+    """
+    Reduce a hook, or a list of hooks, to what a route needs to call.
+
+    Missing and default hooks are dropped, so routes can skip a stage with a
+    plain ``if``. A single remaining hook is returned as is, several become a
+    ``HookChain``.
+    """
+    if hook is None or callable(hook):
+        hooks = [hook]
+    else:
+        hooks = list(hook)
+    flat = []
+    for item in hooks:
+        if isinstance(item, HookChain):
+            flat.extend(item.hooks)
+        elif not is_default_hook(item):
+            flat.append(item)
+    if not flat:
+        return None
+    return flat[0] if len(flat) == 1 else HookChain(name, flat)
+
+
+def ensure_sync(hook: Callable) -> Callable:
+    """Return a blocking callable for ``hook``, driving ``async def`` hooks with ``async_to_sync``."""
+    return async_to_sync(hook) if iscoroutinefunction(hook) else hook
+
+
+def ensure_async(hook: Callable) -> Callable:
+    """Return an awaitable callable for ``hook``; only sync hooks hop to a thread."""
+    if isinstance(hook, HookChain):
+        return hook.acall
+    return hook if iscoroutinefunction(hook) else sync_to_async(hook)
+
+
+INLINE, ON_COMMIT, BACKGROUND, CHAIN = "inline", "on_commit", "background", "chain"
+
+Dispatch = Optional[Tuple[str, Callable]]
+
+
+class BaseHookExecutor(ABC):
     """Base class for hook execution."""
 
+    def __init__(self, using: Optional[str] = None):
+        # Database alias whose commit releases @on_commit hooks.
+        self.using = using
+        self._dispatch_cache: Dict[Callable, Dispatch] = {}
+
     def _is_valid_hook(self, hook: Optional[Callable]) -> bool:
         """Check if hook is valid and not a default hook."""
-        return hook is not None and not getattr(hook, "__is_default_hook__", False)
+        return not is_default_hook(hook)
+
+    @abstractmethod
+    def _adapt(self, hook: Callable) -> Callable:
+        """Adapt an inline hook to the executor's calling convention."""
+
+    def _resolve(self, hook: Optional[Callable]) -> Dispatch:
+        """
+        Return ``(mode, callable)`` for a hook, or None when there is nothing to run.
+
+        The result is cached per hook, so markers and ``async def`` are only
+        inspected the first time a hook is executed.
+        """
+        try:
+            return self._dispatch_cache[hook]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable callable
+            return self._build_dispatch(hook)
+        dispatch = self._dispatch_cache[hook] = self._build_dispatch(hook)
+        return dispatch
+
+    def _build_dispatch(self, hook: Optional[Callable]) -> Dispatch:
+        if not self._is_valid_hook(hook):
+            return None
+        if isinstance(hook, HookChain):
+            steps = tuple(step for step in map(self._resolve, hook.hooks) if step is not None)
+            return CHAIN, (hook.argument, steps)
+        if is_background_hook(hook):
+            return BACKGROUND, ensure_sync(hook)
+        if is_on_commit_hook(hook):
+            return ON_COMMIT, ensure_sync(hook)
+        return INLINE, self._adapt(hook)
+
+    def _deferred(self, mode: str, func: Callable, *args, **kwargs) -> Callable:
+        """Return what to run at commit for @background/@on_commit hooks."""
+        if mode == BACKGROUND:
+            return partial(get_task_runner().submit, func, *args, **kwargs)
+        return partial(func, *args, **kwargs)
     
 
 class SyncHookExecutor(BaseHookExecutor):
@@ -25,9 +234,27 @@ class SyncHookExecutor(BaseHookExecutor):
         Returns:
             The result of the hook execution or None
         """
-        if self._is_valid_hook(hook):
-            return hook(*args, **kwargs)
+        dispatch = self._resolve(hook)
+        if dispatch is None:
+            return None
+        return self._run(dispatch, args, kwargs)
+
+    def _run(self, dispatch: Tuple[str, Any], args: tuple, kwargs: dict) -> Any:
+        mode, func = dispatch
+        if mode == INLINE:
+            return func(*args, **kwargs)
+        if mode == CHAIN:
+            argument, steps = func
+            for step in steps:
+                result = self._run(step, args, kwargs)
+                if argument is not None and result is not None:
+                    args = (*args[:argument], result, *args[argument + 1:])
+            return args[argument] if argument is not None else None
+        transaction.on_commit(self._deferred(mode, func, *args, **kwargs), using=self.using)
         return None
+
+    def _adapt(self, hook: Callable) -> Callable:
+        return ensure_sync(hook)
     
 
 class AsyncHookExecutor(BaseHookExecutor):
@@ -45,9 +272,30 @@ class AsyncHookExecutor(BaseHookExecutor):
         Returns:
             The result of the hook execution or None
         """
-        if self._is_valid_hook(hook):
-            return await sync_to_async(hook)(*args, **kwargs)
+        dispatch = self._resolve(hook)
+        if dispatch is None:
+            return None
+        return await self._run(dispatch, args, kwargs)
+
+    async def _run(self, dispatch: Tuple[str, Any], args: tuple, kwargs: dict) -> Any:
+        mode, func = dispatch
+        if mode == INLINE:
+            return await func(*args, **kwargs)
+        if mode == CHAIN:
+            argument, steps = func
+            for step in steps:
+                result = await self._run(step, args, kwargs)
+                if argument is not None and result is not None:
+                    args = (*args[:argument], result, *args[argument + 1:])
+            return args[argument] if argument is not None else None
+        # Registered from the thread that holds the transaction.
+        await sync_to_async(transaction.on_commit)(
+            self._deferred(mode, func, *args, **kwargs), using=self.using
+        )
         return None
+
+    def _adapt(self, hook: Callable) -> Callable:
+        return ensure_async(hook)
     
 
 # Legacy function wrappers for backward compatibility
@@ -66,6 +314,6 @@ async def execute_hook_async(hook: Optional[Callable], *args, **kwargs) -> Any:
 def get_hook(controller: Optional[object], hook_name: str, passed_hook: Optional[Callable] = None) -> Optional[Callable]:
     if controller:
         controller_hook = getattr(controller, hook_name, None)
-        if controller_hook and not getattr(controller_hook, "__is_default_hook__", False):
-                return controller_hook
+        if not is_default_hook(controller_hook):
+            return controller_hook
     return passed_hook
\ No newline at end of file
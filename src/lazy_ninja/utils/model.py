@@ -1,6 +1,7 @@
-from typing import Type, Any, Dict
+from typing import Type, Any, Dict, List, Optional
 from asgiref.sync import sync_to_async
 
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.shortcuts import get_object_or_404
 
@@ -9,13 +10,16 @@ from .base import serialize_model_instance, serialize_model_instance_async
 class BaseModelUtils:
     """Base class for model utilities."""
 
-    def convert_foreign_keys(self, model: Type[models.Model], data: Dict[str, Any]) -> Dict[str, Any]:
+    def convert_foreign_keys(
+        self, model: Type[models.Model], data: Dict[str, Any], using: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Converts integer values for ForeignKey fields in `data` to the corresponding model instances.
         
         Args:
             model: The Django model class
             data: Dictionary containing field data
+            using: Database alias to fetch related objects from (default: routed)
             
         Returns:
             Dictionary with converted foreign key values
@@ -24,9 +28,61 @@ class BaseModelUtils:
             if isinstance(field, models.ForeignKey) and field.name in data:
                 fk_value = data[field.name]
                 if isinstance(fk_value, (int, str)):
-                    data[field.name] = field.related_model.objects.get(pk=fk_value)
+                    data[field.name] = field.related_model.objects.using(using).get(pk=fk_value)
         return data
 
+    def convert_foreign_keys_bulk(
+        self, model: Type[models.Model], rows: List[Dict[str, Any]], using: Optional[str] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Batched variant of `convert_foreign_keys` for many rows at once.
+
+        Issues one query per ForeignKey field for the whole batch instead of
+        one per row. Rows are converted in place.
+
+        Args:
+            model: The Django model class
+            rows: List of field data dictionaries
+            using: Database alias to fetch related objects from (default: routed)
+
+        Returns:
+            Per-row error (``{"field": ..., "message": ...}``) or None
+        """
+        errors: List[Optional[Dict[str, Any]]] = [None] * len(rows)
+
+        for field in model._meta.fields:
+            if not isinstance(field, models.ForeignKey):
+                continue
+
+            related_model = field.related_model
+            wanted: Dict[Any, List[int]] = {}
+            for index, data in enumerate(rows):
+                fk_value = data.get(field.name)
+                if errors[index] is not None or not isinstance(fk_value, (int, str)):
+                    continue
+                try:
+                    key = related_model._meta.pk.to_python(fk_value)
+                except ValidationError as e:
+                    errors[index] = {"field": field.name, "message": "; ".join(e.messages)}
+                    continue
+                wanted.setdefault(key, []).append(index)
+
+            if not wanted:
+                continue
+
+            found = related_model.objects.using(using).in_bulk(list(wanted))
+            for key, indexes in wanted.items():
+                instance = found.get(key)
+                for index in indexes:
+                    if instance is None:
+                        errors[index] = {
+                            "field": field.name,
+                            "message": f"{related_model.__name__} matching query does not exist.",
+                        }
+                    else:
+                        rows[index][field.name] = instance
+        return errors
+
 
 class SyncModelUtils(BaseModelUtils):
     """Handles model operations for sync routes."""
@@ -34,10 +90,14 @@ class SyncModelUtils(BaseModelUtils):
     def get_object_or_404(self, model: Type[models.Model], **kwargs) -> Any:
         """Get object or raise 404."""
         return get_object_or_404(model, **kwargs)
+
+    def get_object_or_none(self, model: Type[models.Model], using: Optional[str] = None, **kwargs) -> Any:
+        """Get an object, or None when no row matches; ``using`` picks the database alias."""
+        return model.objects.using(using).filter(**kwargs).first()
     
-    def create_instance(self, model: Type[models.Model], **data) -> Any:
+    def create_instance(self, model: Type[models.Model], using: Optional[str] = None, **data) -> Any:
         """Create a new model instance."""
-        return model.objects.create(**data)
+        return model.objects.db_manager(using).create(**data)
     
     def update_instance(self, instance: Any, data: Dict[str, Any]) -> None:
         """Update an existing model instance."""
@@ -64,10 +124,14 @@ class AsyncModelUtils(BaseModelUtils):
     async def get_object_or_404(self, model: Type[models.Model], **kwargs) -> Any:
         """Get object or raise 404 asynchronously."""
         return await sync_to_async(get_object_or_404)(model, **kwargs)
+
+    async def get_object_or_none(self, model: Type[models.Model], using: Optional[str] = None, **kwargs) -> Any:
+        """Get an object, or None when no row matches, asynchronously."""
+        return await model.objects.using(using).filter(**kwargs).afirst()
     
-    async def create_instance(self, model: Type[models.Model], **data) -> Any:
+    async def create_instance(self, model: Type[models.Model], using: Optional[str] = None, **data) -> Any:
         """Create a new model instance asynchronously."""
-        create_func = sync_to_async(lambda m, **kwargs: m.objects.create(**kwargs))
+        create_func = sync_to_async(lambda m, **kwargs: m.objects.db_manager(using).create(**kwargs))
         return await create_func(model, **data)
     
     async def update_instance(self, instance: Any, data: Dict[str, Any]) -> None:
@@ -83,9 +147,11 @@ class AsyncModelUtils(BaseModelUtils):
         delete_func = sync_to_async(lambda obj: obj.delete())
         await delete_func(instance)
 
-    async def convert_foreign_keys(self, model: Type[models.Model], data: Dict[str, Any]) -> Dict[str, Any]:
+    async def convert_foreign_keys(
+        self, model: Type[models.Model], data: Dict[str, Any], using: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Convert foreign keys asynchronously."""
-        return await sync_to_async(super().convert_foreign_keys)(model, data)
+        return await sync_to_async(super().convert_foreign_keys)(model, data, using)
 
     async def serialize_model_instance(self, instance: Any) -> Dict[str, Any]:
         """Serialize a model instance asynchronously."""
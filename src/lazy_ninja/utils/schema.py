@@ -1,7 +1,7 @@
 """
 Schema generation utilities for lazy-ninja.
 """
-from typing import Type, List, Optional, Any, Dict, cast
+from typing import Type, List, Optional, Any, Dict, ClassVar, cast
 from pydantic import BaseModel, ConfigDict, create_model, model_validator
 
 from django.db import models
@@ -64,6 +64,8 @@ def generate_schema(
     
     class DynamicSchema(Schema):
         """Base schema with model serialization validator."""
+
+        __lazy_ninja_generated__: ClassVar[bool] = True
         
         @model_validator(mode="before")
         def pre_serialize(cls, values: Any) -> Any:
@@ -90,3 +92,8 @@ def generate_schema(
     )
     
     return cast(Type[BaseModel], schema)
+
+
+def is_generated_schema(schema: Optional[Type[BaseModel]]) -> bool:
+    """Check whether a schema was produced by `generate_schema`."""
+    return bool(getattr(schema, "__lazy_ninja_generated__", False))
@@ -1,8 +1,13 @@
 import pytest
 from django.core.management import call_command
 from django.test import Client
+from ninja import NinjaAPI
 
-from .models import TestModel, Category
+from lazy_ninja.pagination import get_pagination_strategy
+from lazy_ninja.routes import register_model_routes_internal
+from lazy_ninja.utils import generate_schema
+
+from .models import TestModel, Category, Note
 
 @pytest.fixture(scope="session")
 def django_db_setup(django_db_setup, django_db_blocker):
@@ -35,4 +40,28 @@ def create_test_category(db):
         defaults = {'name': 'Test Category'}
         defaults.update(kwargs)
         return Category.objects.create(**defaults)
-    return _create_test_category
\ No newline at end of file
+    return _create_test_category
+
+
+@pytest.fixture
+def build_api():
+    """
+    Register one model's routes on a fresh NinjaAPI.
+
+    Defaults to sync routes for Note at /notes, with generated schemas and
+    limit-offset pagination; tests pass only the options they change.
+    """
+    def _build_api(namespace, model=Note, base_url="/notes", **options):
+        api = NinjaAPI(urls_namespace=namespace)
+        schema = generate_schema(model)
+        defaults = {
+            "list_schema": schema,
+            "detail_schema": schema,
+            "create_schema": generate_schema(model, exclude=["id", "updated_at"]),
+            "update_schema": generate_schema(model, exclude=["id", "updated_at"], update=True),
+            "pagination_strategy": get_pagination_strategy("limit-offset"),
+            "is_async": False,
+        }
+        register_model_routes_internal(api=api, model=model, base_url=base_url, **{**defaults, **options})
+        return api
+    return _build_api
@@ -9,3 +9,24 @@ class TestModel(models.Model):
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
     
     
+
+
+class Note(models.Model):
+    title = models.CharField(max_length=100)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class Country(models.Model):
+    name = models.CharField(max_length=100)
+    code = models.CharField(max_length=2)
+
+
+class Product(models.Model):
+    sku = models.SlugField(max_length=20, unique=True)
+    name = models.CharField(max_length=100)
+
+
+class Order(models.Model):
+    status = models.CharField(max_length=20)
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    quantity = models.IntegerField(default=1)
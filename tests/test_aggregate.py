@@ -0,0 +1,94 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+from ninja import NinjaAPI
+
+from lazy_ninja.errors import BadRequestError
+from lazy_ninja.handlers.aggregate import AsyncAggregateHandler, SyncAggregateHandler
+from lazy_ninja.helpers import FieldIndex
+from lazy_ninja.router.sync_router import SyncModelRouter
+from lazy_ninja.utils import generate_schema
+
+from tests.models import Order
+
+OrderSchema = generate_schema(Order)
+
+
+@pytest.fixture
+def orders(db):
+    return Order.objects.bulk_create([
+        Order(status="open", amount=Decimal("10.50"), quantity=1),
+        Order(status="open", amount=Decimal("4.50"), quantity=3),
+        Order(status="paid", amount=Decimal("20.00"), quantity=2),
+    ])
+
+
+@pytest.mark.django_db
+def test_aggregate_groups_in_a_single_query(client, orders, django_assert_num_queries):
+    client.get("/api/orders/aggregate")  # load the URLconf first
+    with django_assert_num_queries(1):
+        response = client.get("/api/orders/aggregate?group_by=status&sum=amount&count=*&max=quantity")
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    for row in results:
+        row["sum_amount"] = Decimal(row["sum_amount"])
+    assert results == [
+        {"status": "open", "sum_amount": Decimal("15"), "count": 2, "max_quantity": 3},
+        {"status": "paid", "sum_amount": Decimal("20"), "count": 1, "max_quantity": 2},
+    ]
+
+
+@pytest.mark.django_db
+def test_aggregate_without_group_by_applies_filters(client, orders):
+    response = client.get("/api/orders/aggregate?q=status=open&avg=quantity")
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [{"avg_quantity": 2.0}]
+
+    response = client.get("/api/orders/aggregate")
+    assert response.json()["results"] == [{"count": 3}]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", ["sum=status", "group_by=missing", "min=unknown"])
+def test_aggregate_rejects_fields_outside_the_index(client, query):
+    response = client.get(f"/api/orders/aggregate?{query}")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_aggregate_handler_runs_query():
+    Order.objects.create(status="open", amount=Decimal("3.00"))
+    handler = AsyncAggregateHandler(Order, FieldIndex(Order), OrderSchema)
+
+    result = asyncio.run(handler.run(Order.objects.all(), "status", sum="amount"))
+    assert result.results == [{"status": "open", "sum_amount": Decimal("3")}]
+
+
+def test_aggregate_only_exposes_list_schema_fields():
+    schema = generate_schema(Order, exclude=["amount"])
+    handler = SyncAggregateHandler(Order, FieldIndex(Order), schema)
+
+    for functions in ({"max": "amount"}, {"sum": "amount"}, {"group_by": "amount"}):
+        with pytest.raises(BadRequestError):
+            handler.build(**functions)
+    assert handler.build(max="quantity")[1].keys() == {"max_quantity"}
+
+
+@pytest.mark.django_db
+def test_aggregate_rejects_too_many_groups(orders):
+    handler = SyncAggregateHandler(Order, FieldIndex(Order), OrderSchema, max_groups=1)
+
+    with pytest.raises(BadRequestError):
+        handler.run(Order.objects.all(), "status")
+    assert handler.run(Order.objects.filter(status="paid"), "status").results == [{"status": "paid", "count": 1}]
+
+
+def test_aggregate_route_is_opt_in():
+    def router(**options):
+        return SyncModelRouter(NinjaAPI(), Order, "/orders", list_schema=OrderSchema, detail_schema=OrderSchema, **options)
+
+    assert "aggregate" not in router().fixed_paths()
+    assert "aggregate" in router(aggregate_routes=True).fixed_paths()
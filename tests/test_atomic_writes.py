@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from ninja.testing import TestAsyncClient, TestClient
+
+from lazy_ninja.utils import on_commit
+from lazy_ninja.utils.hooks import SyncHookExecutor
+
+from .models import Note
+
+
+def failing_hook(request, instance):
+    raise ValueError("hook failed")
+
+
+@pytest.mark.django_db
+def test_failing_hook_rolls_back_the_write(build_api):
+    client = TestClient(build_api(
+        "atomic-sync", atomic_writes=True, after_create=failing_hook, after_update=failing_hook
+    ))
+    note = Note.objects.create(title="before")
+
+    assert client.post("/notes/", json={"title": "orphan"}).status_code == 400
+    assert client.patch(f"/notes/{note.pk}", json={"title": "after"}).status_code == 400
+
+    assert list(Note.objects.values_list("title", flat=True)) == ["before"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_failing_hook_rolls_back_the_write(build_api):
+    client = TestAsyncClient(build_api("atomic-async", is_async=True, atomic_writes=True, after_create=failing_hook))
+
+    response = asyncio.run(client.post("/notes/", json={"title": "orphan"}))
+
+    assert response.status_code == 400
+    assert not Note.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_on_commit_hooks_run_after_the_commit(build_api):
+    seen = []
+
+    @on_commit
+    def notify(request, instance):
+        seen.append(Note.objects.filter(pk=instance.pk).exists())
+        return "ignored"
+
+    client = TestClient(build_api("atomic-on-commit", atomic_writes=True, after_create=notify))
+    response = client.post("/notes/", json={"title": "sent"})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "sent"
+    assert seen == [True]
+
+
+@pytest.mark.django_db
+def test_on_commit_classmethod_hook_is_deferred(django_capture_on_commit_callbacks):
+    seen = []
+
+    class Controller:
+        @classmethod
+        @on_commit
+        def after_delete(cls, instance):
+            seen.append(instance)
+
+    executor = SyncHookExecutor("default")
+    with django_capture_on_commit_callbacks() as callbacks:
+        assert executor.execute(Controller.after_delete, "deleted") is None
+    assert seen == [] and len(callbacks) == 1
+
+    callbacks[0]()
+    assert seen == ["deleted"]
@@ -1,9 +1,28 @@
 import json
+import threading
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import UserManager
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.test.utils import override_settings
+from ninja.errors import HttpError
+
+from lazy_ninja.auth.config import AuthSettings, get_auth_settings
+from lazy_ninja.auth.throttling import (
+    AuthRateLimiter,
+    CacheRateLimitBackend,
+    InMemoryRateLimitBackend,
+    parse_rate,
+)
+from lazy_ninja.auth.hashing import (
+    InlineHashingExecutor,
+    PasswordHashingExecutor,
+    get_hashing_executor,
+)
 
 
 @pytest.mark.django_db
@@ -318,4 +337,248 @@ def test_stateful_logout_blacklists_access_token(client):
             "/api/auth/me",
             HTTP_AUTHORIZATION=f"Bearer {access_token}",
         )
-        assert me_response.status_code == 401
\ No newline at end of file
+        assert me_response.status_code == 401
+
+
+def test_hashing_executor_defaults_to_inline():
+    with override_settings(LAZY_NINJA_AUTH={}):
+        assert isinstance(get_hashing_executor(), InlineHashingExecutor)
+
+    with override_settings(LAZY_NINJA_AUTH={"HASHING_MAX_WORKERS": 2}):
+        executor = get_hashing_executor()
+        assert isinstance(executor, PasswordHashingExecutor)
+        assert executor.queue_size == 2
+        assert get_hashing_executor() is executor
+
+
+def test_hashing_executor_rejects_when_saturated():
+    executor = PasswordHashingExecutor(max_workers=1, queue_size=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_hash():
+        started.set()
+        release.wait(timeout=5)
+        return "hashed"
+
+    results = []
+    worker = threading.Thread(target=lambda: results.append(executor.run(slow_hash)))
+    worker.start()
+    try:
+        assert started.wait(timeout=5)
+        with pytest.raises(HttpError) as excinfo:
+            executor.run(lambda: "never")
+        assert excinfo.value.status_code == 429
+    finally:
+        release.set()
+        worker.join(timeout=5)
+        executor.shutdown()
+
+    assert results == ["hashed"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_register_and_login_use_hashing_pool(client):
+    auth_settings = {"LOGIN_FIELDS": ["email"], "HASHING_MAX_WORKERS": 1}
+    with override_settings(LAZY_NINJA_AUTH=auth_settings):
+        with CaptureQueriesContext(connection) as queries:
+            register_response = client.post(
+                "/api/auth/register",
+                data=json.dumps({
+                    "email": "pooled@example.com",
+                    "username": "pooled",
+                    "password": "S0mePassw0rd!",
+                }),
+                content_type="application/json",
+            )
+        assert register_response.status_code == 200
+        writes = [q["sql"] for q in queries.captured_queries if q["sql"].startswith(("INSERT", "UPDATE"))]
+        assert len(writes) == 1 and writes[0].startswith("INSERT")
+        assert get_user_model().objects.get(username="pooled").check_password("S0mePassw0rd!")
+
+        login_response = client.post(
+            "/api/auth/login",
+            data=json.dumps({
+                "email": "pooled@example.com",
+                "password": "S0mePassw0rd!",
+            }),
+            content_type="application/json",
+        )
+        assert login_response.status_code == 200
+
+        bad_login_response = client.post(
+            "/api/auth/login",
+            data=json.dumps({
+                "email": "pooled@example.com",
+                "password": "wrong-password",
+            }),
+            content_type="application/json",
+        )
+        assert bad_login_response.status_code == 401
+
+
+class DenyAllBackend(ModelBackend):
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        return None
+
+
+class RecordingUserManager(UserManager):
+    calls = []
+
+    def create_user(self, *args, **kwargs):
+        self.calls.append(kwargs.get("password"))
+        return super().create_user(*args, **kwargs)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_pooled_login_falls_back_to_configured_backends(client):
+    get_user_model().objects.create_user(
+        username="backend", email="backend@example.com", password="S0mePassw0rd!"
+    )
+    auth_settings = {"LOGIN_FIELDS": ["email"], "HASHING_MAX_WORKERS": 1}
+    with override_settings(
+        LAZY_NINJA_AUTH=auth_settings,
+        AUTHENTICATION_BACKENDS=["tests.test_auth.DenyAllBackend"],
+    ):
+        response = client.post(
+            "/api/auth/login",
+            data=json.dumps({"email": "backend@example.com", "password": "S0mePassw0rd!"}),
+            content_type="application/json",
+        )
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db(transaction=True)
+def test_pooled_register_falls_back_to_custom_create_user(client, monkeypatch):
+    User = get_user_model()
+    monkeypatch.setattr(User.objects, "__class__", RecordingUserManager)
+    monkeypatch.setattr(RecordingUserManager, "calls", [])
+    auth_settings = {"HASHING_MAX_WORKERS": 1}
+    with override_settings(LAZY_NINJA_AUTH=auth_settings):
+        response = client.post(
+            "/api/auth/register",
+            data=json.dumps({
+                "email": "custom@example.com",
+                "username": "custom",
+                "password": "S0mePassw0rd!",
+            }),
+            content_type="application/json",
+        )
+    assert response.status_code == 200
+    assert RecordingUserManager.calls == ["S0mePassw0rd!"]
+    assert User.objects.get(username="custom").check_password("S0mePassw0rd!")
+
+
+def test_parse_rate():
+    assert parse_rate("5/min") == (5, 60)
+    assert parse_rate("100/hour") == (100, 3600)
+    assert parse_rate("5/15m") == (5, 900)
+    with pytest.raises(ValueError):
+        parse_rate("five per minute")
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [InMemoryRateLimitBackend(), CacheRateLimitBackend()],
+    ids=["memory", "cache"],
+)
+def test_rate_limit_backends_enforce_limit(backend):
+    cache.clear()
+    assert backend.hit("test:key", 2, 60) is None
+    assert backend.hit("test:key", 2, 60) is None
+    assert backend.hit("test:key", 2, 60) > 0
+    backend.reset("test:key", 60)
+    assert backend.count("test:key", 60) == 0
+
+
+def test_rate_limiter_ignores_spoofed_forwarded_addresses(rf):
+    limiter = AuthRateLimiter(InMemoryRateLimitBackend(), {}, ip_header="HTTP_X_FORWARDED_FOR")
+    request = rf.post("/", HTTP_X_FORWARDED_FOR="1.1.1.1, 203.0.113.7", REMOTE_ADDR="10.0.0.1")
+    assert limiter.get_client_ip(request) == "203.0.113.7"
+
+    limiter.trusted_proxies = 2
+    assert limiter.get_client_ip(request) == "1.1.1.1"
+
+    no_header = AuthRateLimiter(InMemoryRateLimitBackend(), {})
+    assert no_header.get_client_ip(request) == "10.0.0.1"
+
+
+def test_rate_limiter_hashes_key_parts(rf):
+    limiter = AuthRateLimiter(InMemoryRateLimitBackend(), {})
+    keys = limiter._keys(rf.post("/"), "login", "  Some User " + "x" * 300)
+    assert all(len(key) < 100 and " " not in key for key in keys)
+
+
+def test_cache_rate_limit_backend_does_not_count_rejected_hits():
+    cache.clear()
+    backend = CacheRateLimitBackend()
+    assert backend.hit("test:rejected", 1, 60) is None
+    assert backend.hit("test:rejected", 1, 60) > 0
+    assert backend.hit("test:rejected", 1, 60) > 0
+    assert backend.count("test:rejected", 60) == 1
+
+
+@pytest.mark.django_db
+def test_login_rate_limit_returns_429(client):
+    auth_settings = {
+        "LOGIN_FIELDS": ["email"],
+        "RATE_LIMITS": {"login": "2/min"},
+        "RATE_LIMIT_BACKEND": "memory",
+    }
+    with override_settings(LAZY_NINJA_AUTH=auth_settings):
+        statuses = [
+            client.post(
+                "/api/auth/login",
+                data=json.dumps({"email": "limited@example.com", "password": "badpass"}),
+                content_type="application/json",
+            ).status_code
+            for _ in range(3)
+        ]
+
+    assert statuses == [401, 401, 429]
+
+
+@pytest.mark.django_db
+def test_login_failures_lock_out_identifier(client):
+    User = get_user_model()
+    User.objects.create_user(
+        username="lockout",
+        email="lockout@example.com",
+        password="S0mePassw0rd!",
+    )
+    auth_settings = {
+        "LOGIN_FIELDS": ["email"],
+        "RATE_LIMITS": {"login_failures": "2/15m"},
+        "RATE_LIMIT_BACKEND": "memory",
+    }
+
+    def login(password):
+        return client.post(
+            "/api/auth/login",
+            data=json.dumps({"email": "lockout@example.com", "password": password}),
+            content_type="application/json",
+        )
+
+    with override_settings(LAZY_NINJA_AUTH=auth_settings):
+        assert login("wrong").status_code == 401
+        assert login("wrong").status_code == 401
+        locked = login("S0mePassw0rd!")
+
+    assert locked.status_code == 429
+    assert locked["Retry-After"] == "900"
+
+
+def test_auth_settings_snapshot_is_cached_and_refreshed():
+    with override_settings(LAZY_NINJA_AUTH={"JWT_ISS": "first-iss"}):
+        snapshot = get_auth_settings()
+        assert isinstance(snapshot, AuthSettings)
+        assert snapshot.jwt_issuer == "first-iss"
+        assert get_auth_settings() is snapshot
+        with pytest.raises(AttributeError):
+            snapshot.jwt_issuer = "mutated"
+
+    with override_settings(LAZY_NINJA_AUTH={"JWT_ISS": "second-iss", "JWT_ACCESS_EXP": 60}):
+        refreshed = get_auth_settings()
+        assert refreshed is not snapshot
+        assert refreshed.jwt_issuer == "second-iss"
+        assert refreshed.token_lifetimes["access"] == 60
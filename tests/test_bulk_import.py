@@ -0,0 +1,115 @@
+import asyncio
+import io
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from lazy_ninja.handlers.bulk_import import AsyncImportHandler, SyncImportHandler
+from lazy_ninja.utils import generate_schema
+from lazy_ninja.utils.model import SyncModelUtils
+
+from tests.models import Category, Country, TestModel
+
+
+class _Body(io.BytesIO):
+    """Stand-in for a request whose body is only readable as a stream."""
+
+    content_type = "application/x-ndjson"
+
+
+def _ndjson(*rows):
+    return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows)
+
+
+@pytest.mark.django_db
+def test_import_ndjson_creates_rows_and_reports_errors(client, create_test_category):
+    category = create_test_category()
+    body = _ndjson(
+        {"title": "One", "category": category.id},
+        {"title": "Two", "category": category.id},
+        {"category": category.id},
+        "{not json",
+        {"title": "Orphan", "category": 999},
+    )
+
+    response = client.post("/api/test-models/import", body, content_type="application/x-ndjson")
+    assert response.status_code == 200
+    report = response.json()
+
+    assert report["created"] == 2
+    assert report["failed"] == 3
+    assert [error["row"] for error in report["errors"]] == [3, 4, 5]
+    assert report["errors"][0]["errors"][0]["field"] == "title"
+    assert report["errors"][2]["errors"][0]["field"] == "category"
+    assert set(TestModel.objects.values_list("title", flat=True)) == {"One", "Two"}
+
+
+@pytest.mark.django_db
+def test_import_csv_with_format_param(client):
+    body = "name,code\nAngola,AO\nBrazil,BR\n"
+
+    response = client.post("/api/countries/import?format=csv", body, content_type="text/plain")
+    assert response.status_code == 200
+    assert response.json()["created"] == 2
+    assert client.get("/api/countries/").json()["count"] == 2
+
+
+@pytest.mark.django_db
+def test_import_rejects_unknown_format(client):
+    response = client.post("/api/countries/import?format=xml", "", content_type="text/plain")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_import_processes_in_chunks_with_one_fk_query(create_test_category):
+    category = create_test_category()
+    handler = SyncImportHandler(TestModel, generate_schema(TestModel, exclude=["id"]), chunk_size=2)
+    body = _Body(_ndjson(*({"title": f"row {i}", "category": category.id} for i in range(3))).encode())
+
+    with CaptureQueriesContext(connection) as queries:
+        report = handler.run(body, "ndjson")
+
+    statements = [query["sql"].split()[0] for query in queries.captured_queries]
+    assert statements.count("SELECT") == 2
+    assert statements.count("INSERT") == 2
+    assert report.created == 3
+    assert TestModel.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_import_saves_rows_individually_without_bulk_returning(monkeypatch):
+    monkeypatch.setattr(type(connection.features), "can_return_rows_from_bulk_insert", False)
+    handler = SyncImportHandler(Country, generate_schema(Country, exclude=["id"]))
+    body = _Body(b"name,code\nAngola,AO\nBrazil,BR\n")
+    seen_pks = []
+
+    report = handler.run(body, "csv", after_create=lambda request, instance: seen_pks.append(instance.pk))
+
+    assert report.created == 2
+    assert sorted(seen_pks) == sorted(Country.objects.values_list("pk", flat=True))
+
+
+@pytest.mark.django_db
+def test_convert_foreign_keys_bulk(create_test_category, django_assert_num_queries):
+    category = create_test_category()
+    rows = [{"category": category.id}, {"category": str(category.id)}, {"category": 404}]
+
+    with django_assert_num_queries(1):
+        errors = SyncModelUtils().convert_foreign_keys_bulk(TestModel, rows)
+
+    assert rows[0]["category"] == rows[1]["category"] == category
+    assert errors[:2] == [None, None]
+    assert errors[2]["field"] == "category"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_import_handler():
+    handler = AsyncImportHandler(Country, generate_schema(Country, exclude=["id"]), chunk_size=1)
+    body = _Body(b"name,code\nAngola,AO\nBrazil,\n")
+
+    report = asyncio.run(handler.run(body, "csv"))
+    assert report.created == 1
+    assert report.errors[0].row == 3
+    assert Country.objects.get().code == "AO"
@@ -0,0 +1,115 @@
+import time
+
+import pytest
+
+from django.db.models.signals import post_save
+
+from lazy_ninja.handlers.cache import LocalLRUCacheBackend, build_read_cache
+
+from tests.models import Country, TestModel
+
+
+def test_local_backend_evicts_least_recently_used():
+    backend = LocalLRUCacheBackend(max_entries=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.get("c") == 3
+
+
+def test_local_backend_expires_entries():
+    backend = LocalLRUCacheBackend()
+    backend.set("a", 1, timeout=0.01)
+    time.sleep(0.02)
+    assert backend.get("a") is None
+
+
+def test_build_read_cache_options():
+    assert build_read_cache(TestModel, None) is None
+    assert build_read_cache(TestModel, False) is None
+    assert build_read_cache(TestModel, True).timeout == 300
+    with pytest.raises(ValueError):
+        build_read_cache(TestModel, {"backend": "memcached-ish"})
+
+
+@pytest.mark.django_db
+def test_detail_is_served_from_cache(client, django_assert_num_queries):
+    country = Country.objects.create(name="Portugal", code="PT")
+    url = f"/api/countries/{country.id}"
+
+    first = client.get(url)
+    assert first.status_code == 200
+
+    with django_assert_num_queries(0):
+        cached = client.get(url)
+    assert cached.json() == first.json() == {"id": country.id, "name": "Portugal", "code": "PT"}
+    assert cached["ETag"] == first["ETag"]
+    assert client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+
+
+@pytest.mark.django_db
+def test_model_signals_invalidate_cache(client, django_capture_on_commit_callbacks):
+    country = Country.objects.create(name="Portugal", code="PT")
+    url = f"/api/countries/{country.id}"
+    assert client.get(url).json()["name"] == "Portugal"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        country.name = "Portuguese Republic"
+        country.save()
+    assert client.get(url).json()["name"] == "Portuguese Republic"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Country.objects.create(name="Angola", code="AO")
+    assert client.get("/api/countries/").json()["count"] == 2
+
+
+@pytest.mark.django_db
+def test_signal_invalidation_waits_for_commit(django_capture_on_commit_callbacks):
+    read_cache = build_read_cache(Country, {"backend": "local"})
+    country = Country.objects.create(name="Portugal", code="PT")
+    generation = read_cache._generation()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        country.save()
+        assert read_cache._generation() == generation
+
+    assert len(callbacks) == 1
+    assert read_cache._generation() != generation
+
+
+def test_read_caches_share_one_receiver_per_model():
+    build_read_cache(Country, True)
+    receivers = len(post_save.receivers)
+    for _ in range(3):
+        build_read_cache(Country, {"backend": "local"})
+    assert len(post_save.receivers) == receivers
+
+
+@pytest.mark.django_db
+def test_list_cache_is_keyed_by_query_params(client, django_assert_num_queries):
+    Country.objects.create(name="Angola", code="AO")
+    Country.objects.create(name="Brazil", code="BR")
+
+    assert len(client.get("/api/countries/?limit=1").json()["items"]) == 1
+    assert len(client.get("/api/countries/?limit=2").json()["items"]) == 2
+    with django_assert_num_queries(0):
+        assert client.get("/api/countries/?limit=1").json()["items"][0]["code"] == "AO"
+
+
+@pytest.mark.django_db
+def test_writes_through_routes_invalidate_cache(client):
+    country = Country.objects.create(name="Angola", code="AO")
+    url = f"/api/countries/{country.id}"
+    assert client.get("/api/countries/").json()["count"] == 1
+    assert client.get(url).status_code == 200
+
+    assert client.patch(url, {"code": "AN"}, content_type="application/json").status_code == 200
+    assert client.get(url).json()["code"] == "AN"
+
+    assert client.delete(url).status_code == 200
+    assert client.get("/api/countries/").json()["count"] == 0
+    assert client.get(url).status_code == 404
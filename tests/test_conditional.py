@@ -0,0 +1,99 @@
+import pytest
+from django.http import HttpResponseBase
+from django.utils.http import http_date
+from ninja.operation import Operation
+from ninja.testing import TestClient
+
+from lazy_ninja.handlers.conditional import ConditionalRequestHandler
+from lazy_ninja.utils import generate_schema
+
+from tests.models import Note, TestModel
+
+
+def test_conditional_handler_detects_version_column():
+    assert ConditionalRequestHandler(Note).version_field.name == "updated_at"
+    assert ConditionalRequestHandler(TestModel).version_field is None
+
+
+def test_disabled_handler_produces_no_validators():
+    handler = ConditionalRequestHandler(Note, enabled=False)
+    note = Note(pk=1, title="Off")
+    assert handler.instance_validators(note) == (None, None)
+    assert handler.payload_etag({"title": "Off"}) is None
+
+
+@pytest.mark.django_db
+def test_detail_route_returns_etag_and_304(client, create_test_model):
+    model = create_test_model()
+    url = f"/api/test-models/{model.id}"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    model.title = "Changed"
+    model.save()
+    changed = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_detail_route_uses_version_column_and_last_modified(client):
+    note = Note.objects.create(title="Versioned")
+    url = f"/api/notes/{note.id}"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response["Last-Modified"] == http_date(int(note.updated_at.timestamp()))
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+    assert client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code == 304
+
+
+@pytest.mark.django_db
+def test_list_route_returns_etag_and_304(client, create_test_model):
+    create_test_model(title="First")
+    url = "/api/test-models/"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    create_test_model(title="Second")
+    refreshed = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert refreshed.status_code == 200
+    assert refreshed.json()["count"] == 2
+
+
+@pytest.mark.django_db
+def test_hashed_payloads_are_rendered_without_serializing_again(build_api, create_test_model, monkeypatch):
+    model = create_test_model()
+    schema = generate_schema(TestModel, exclude=["image"])
+    api = build_api(
+        "hashed-payloads", model=TestModel, base_url="/test-models", list_schema=schema, detail_schema=schema
+    )
+    rendered = []
+    original = Operation._result_to_response
+
+    def spy(self, request, result, temporal_response):
+        rendered.append(isinstance(result, HttpResponseBase))
+        return original(self, request, result, temporal_response)
+
+    monkeypatch.setattr(Operation, "_result_to_response", spy)
+    client = TestClient(api)
+
+    listed = client.get("/test-models/")
+    detail = client.get(f"/test-models/{model.id}")
+
+    assert rendered == [True, True]
+    assert listed.json()["items"] == [detail.json()]
+    assert "image" not in detail.json()
+    assert detail["ETag"].startswith('W/"')
@@ -0,0 +1,62 @@
+import io
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from ninja.testing import TestClient
+
+from lazy_ninja.builder import DynamicAPI
+from lazy_ninja.handlers.bulk_import import SyncImportHandler
+from lazy_ninja.utils import generate_schema
+
+from .models import Category, Note, TestModel
+
+
+@pytest.mark.django_db(databases=["default", "other"])
+def test_routes_use_the_model_database(build_api):
+    client = TestClient(build_api("database-other", database="other"))
+
+    created = client.post("/notes/", json={"title": "sharded"}).json()
+    assert not Note.objects.exists()
+    assert Note.objects.using("other").get().title == "sharded"
+
+    assert client.get("/notes/").json()["count"] == 1
+    assert client.get(f"/notes/{created['id']}").status_code == 200
+    assert client.patch(f"/notes/{created['id']}", json={"title": "renamed"}).status_code == 200
+    assert Note.objects.using("other").get().title == "renamed"
+
+    assert client.delete(f"/notes/{created['id']}").status_code == 200
+    assert not Note.objects.using("other").exists()
+
+
+@pytest.mark.django_db(databases=["default", "other"])
+def test_import_writes_to_the_model_database():
+    handler = SyncImportHandler(Note, generate_schema(Note, exclude=["id", "updated_at"]), using="other")
+    request = io.BytesIO(b'{"title": "bulk"}\n{"title": "load"}')
+
+    report = handler.run(request, "ndjson", None, None)
+
+    assert report.created == 2
+    assert Note.objects.using("other").count() == 2
+    assert not Note.objects.exists()
+
+
+@pytest.mark.django_db(databases=["default", "other"])
+def test_foreign_keys_are_resolved_on_the_model_database(build_api):
+    category = Category.objects.using("other").create(name="remote")
+    client = TestClient(build_api("database-fk", model=TestModel, base_url="/items", database="other"))
+
+    response = client.post("/items/", json={"title": "t", "category": category.pk})
+
+    assert response.status_code == 200
+    assert TestModel.objects.using("other").get().category_id == category.pk
+
+
+def test_unknown_database_alias_is_rejected(build_api):
+    with pytest.raises(ImproperlyConfigured, match="not in DATABASES"):
+        build_api("database-missing", database="missing")
+
+
+@pytest.mark.django_db(databases=["default", "other"])
+def test_existing_tables_cover_all_databases():
+    tables = DynamicAPI._get_existing_tables()
+    assert Note._meta.db_table in tables
@@ -1,14 +1,17 @@
 import asyncio
 import json
+import logging
 
 import pytest
 from django.core import exceptions
 from django.db import DatabaseError
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 
 from ninja.errors import HttpError
 
+from lazy_ninja import errors
 from lazy_ninja.errors import (
+    ErrorLogLimiter,
     handle_exception,
     handle_exception_async,
     LazyNinjaError,
@@ -34,7 +37,9 @@ def _extract_payload(response: JsonResponse) -> dict:
     [
         (TestModel.DoesNotExist("missing"), NotFoundError, 404),
         (exceptions.ObjectDoesNotExist("missing"), NotFoundError, 404),
+        (Http404("No TestModel matches the given query."), NotFoundError, 404),
         (PermissionError("denied"), PermissionDeniedError, 403),
+        (exceptions.PermissionDenied("denied"), PermissionDeniedError, 403),
         (exceptions.ValidationError("invalid"), ValidationError, 400),
         (ValueError("bad"), ValidationError, 400),
         (DatabaseError("db error"), DatabaseOperationError, 500),
@@ -59,14 +64,43 @@ def test_handle_exception_preserves_lazy_ninja_error():
     assert payload["type"] == "LazyNinjaError"
 
 
-def test_handle_exception_defaults_to_generic_error(settings, capsys):
-    settings.DEBUG = True
-    response = handle_exception(RuntimeError("crash"))
+def test_handle_exception_defaults_to_generic_error(caplog, capsys, monkeypatch):
+    monkeypatch.setattr(errors, "error_log_limiter", ErrorLogLimiter())
+    with caplog.at_level(logging.ERROR, logger="lazy_ninja.errors"):
+        response = handle_exception(RuntimeError("crash"))
     assert response.status_code == 500
     payload = _extract_payload(response)
     assert payload["type"] == "LazyNinjaError"
-    captured = capsys.readouterr().out
-    assert "LazyNinja" in captured
+    assert "crash" in caplog.text
+    assert caplog.records[0].exc_info is not None
+    assert capsys.readouterr().out == ""
+
+
+def test_error_classification_does_not_scan_messages():
+    response = handle_exception(RuntimeError("permission cache is cold"))
+    assert response.status_code == 500
+
+
+def test_repeated_errors_are_rate_limited(caplog, monkeypatch):
+    monkeypatch.setattr(errors, "error_log_limiter", ErrorLogLimiter(interval=60))
+    with caplog.at_level(logging.ERROR, logger="lazy_ninja.errors"):
+        for _ in range(5):
+            handle_exception(RuntimeError("crash"))
+    assert len(caplog.records) == 1
+
+    monkeypatch.setattr(errors.error_log_limiter, "interval", 0)
+    with caplog.at_level(logging.ERROR, logger="lazy_ninja.errors"):
+        handle_exception(RuntimeError("crash"))
+    assert "[4 similar suppressed]" in caplog.records[-1].getMessage()
+
+
+def test_client_errors_are_not_formatted_when_debug_logging_is_off(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("client errors must not be logged above DEBUG")
+
+    monkeypatch.setattr(errors.logger, "log", fail)
+    response = handle_exception(TestModel.DoesNotExist("missing"))
+    assert response.status_code == 404
 
 
 def test_handle_exception_async_delegates_to_sync():
@@ -0,0 +1,100 @@
+import asyncio
+import csv
+import io
+import json
+import logging
+
+import pytest
+
+from lazy_ninja.handlers.export import AsyncExportHandler, SyncExportHandler
+from lazy_ninja.utils import generate_schema
+
+from tests.models import Note, Product, TestModel
+
+
+def _body(response):
+    return b"".join(response.streaming_content).decode()
+
+
+def test_export_handler_uses_values_list_for_plain_columns():
+    handler = SyncExportHandler(TestModel, generate_schema(TestModel))
+    assert handler.columns == ["id", "title", "image", "category_id"]
+    assert handler.fields == ["id", "title", "image", "category"]
+
+
+@pytest.mark.django_db
+def test_export_ndjson_streams_all_rows(client, create_test_model):
+    create_test_model(title="First")
+    create_test_model(title="Second")
+
+    response = client.get("/api/test-models/export?sort=title&order=desc")
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in _body(response).splitlines()]
+    assert [row["title"] for row in rows] == ["Second", "First"]
+    assert set(rows[0]) == {"id", "title", "image", "category"}
+
+
+@pytest.mark.django_db
+def test_export_csv_honours_query_filter(client, create_test_model):
+    create_test_model(title="Keep me")
+    create_test_model(title="Other")
+
+    response = client.get("/api/test-models/export?format=csv&q=title=keep")
+    assert response.status_code == 200
+    assert response["Content-Disposition"] == 'attachment; filename="test-models.csv"'
+
+    rows = list(csv.DictReader(io.StringIO(_body(response))))
+    assert len(rows) == 1
+    assert rows[0]["title"] == "Keep me"
+
+
+@pytest.mark.django_db
+def test_export_chunks_large_results(client):
+    Note.objects.bulk_create([Note(title=f"note {i}") for i in range(5)])
+    handler = SyncExportHandler(Note, generate_schema(Note), chunk_size=2)
+
+    chunks = list(handler.stream(Note.objects.order_by("id"), "ndjson"))
+    assert len(chunks) == 3
+    assert json.loads(chunks[0].splitlines()[0])["updated_at"]
+
+
+@pytest.mark.django_db
+def test_export_rejects_unknown_format(client):
+    response = client.get("/api/test-models/export?format=xml")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_export_handler_streams_rows():
+    Note.objects.bulk_create([Note(title=f"note {i}") for i in range(3)])
+    handler = AsyncExportHandler(Note, generate_schema(Note), chunk_size=2)
+
+    async def collect():
+        return [chunk async for chunk in handler.stream(Note.objects.order_by("id"), "csv")]
+
+    chunks = asyncio.run(collect())
+    assert chunks[0].startswith("id,title,updated_at")
+    assert "".join(chunks[1:]).count("\n") == 3
+
+
+def _route_paths(api):
+    return [str(pattern.pattern) for pattern in api.urls[0]]
+
+
+def test_export_route_is_opt_in(build_api):
+    assert not any(path.endswith("export") for path in _route_paths(build_api("export-default")))
+    assert any(path.endswith("export") for path in _route_paths(build_api("export-on", export_routes=True)))
+
+
+def test_fixed_paths_warn_when_they_shadow_string_ids(build_api, caplog):
+    with caplog.at_level(logging.WARNING, logger="lazy_ninja.router.base"):
+        build_api("export-shadow", model=Product, base_url="/products", export_routes=True, lookup_field="sku")
+    assert "'/export' shadows objects whose sku is 'export'" in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="lazy_ninja.router.base"):
+        build_api("export-int-pk", export_routes=True)
+    assert caplog.text == ""
@@ -1,25 +1,34 @@
 import asyncio
 import asyncio
 import uuid
+from decimal import Decimal
 from types import SimpleNamespace
 
 import pytest
 from asgiref.sync import sync_to_async
-from django.db import models
+from django.db import connections, models
+from django.db.models import Q
+from django.test.utils import isolate_apps
 from ninja import Schema
 
+from lazy_ninja.errors import BadRequestError
 from lazy_ninja.helpers import (
+    INVALID_ID,
+    FieldIndex,
+    ModelIdParser,
     to_kebab_case,
     parse_model_id,
     get_hook,
     execute_hook,
     handle_response,
     parse_query_param,
+    compile_filter_expression,
+    compile_ordering,
     apply_filters,
     apply_filters_async,
 )
 
-from tests.models import TestModel
+from tests.models import Order, Product, TestModel
 
 @pytest.mark.parametrize("input_str,expected", [
     ("PostComments", "post-comments"),
@@ -60,6 +69,35 @@ def test_parse_model_id_with_uuid_field_returns_original_value():
     assert parse_model_id(StubModel, item_id) == item_id
 
 
+def test_model_id_parser_for_integer_keys():
+    parser = ModelIdParser(TestModel)
+    assert parser.path_type is int
+    assert parser.parse(42) == 42
+    assert parser.parse("42") == 42
+    assert parser.parse("4_2") is INVALID_ID
+    assert parser.parse(2 ** 70) is INVALID_ID
+
+
+def test_model_id_parser_uses_range_of_the_models_database(monkeypatch):
+    monkeypatch.setattr(connections["other"].ops, "integer_field_range", lambda internal_type: (0, 999))
+    assert ModelIdParser(TestModel, using="other").parse(1000) is INVALID_ID
+    assert ModelIdParser(TestModel).parse(1000) == 1000
+
+
+def test_model_id_parser_for_uuid_and_char_keys():
+    item_id = uuid.uuid4()
+    uuid_parser = ModelIdParser(TestModel, models.UUIDField(primary_key=True))
+    assert uuid_parser.path_type is uuid.UUID
+    assert uuid_parser.parse(item_id) == item_id
+    assert uuid_parser.parse("not-a-uuid") is INVALID_ID
+
+    slug_parser = ModelIdParser(TestModel, models.SlugField(max_length=5, primary_key=True))
+    assert slug_parser.path_type is str
+    assert slug_parser.parse("ab-1") == "ab-1"
+    assert slug_parser.parse("too-long") is INVALID_ID
+    assert slug_parser.parse("a b") is INVALID_ID
+
+
 def test_get_hook_returns_defined_method():
     class Controller:
         def before_create(self, request, payload, schema):
@@ -131,6 +169,108 @@ def test_parse_query_param_supports_multiple_operators():
     assert parse_query_param("views>10") == {"views__gt": 10}
     assert parse_query_param("score<20") == {"score__lt": 20}
     assert parse_query_param("invalid") == {}
+    assert parse_query_param("views>=10") == {"views__gte": 10}
+    assert parse_query_param("views<=10") == {"views__lte": 10}
+
+
+def test_compile_filter_expression_builds_one_q_object():
+    compiled = compile_filter_expression(Order, "status:open,quantity>=3|id__in=1,2,3")
+
+    assert compiled == (
+        (Q(status__icontains="open") & Q(quantity__gte=3)) | Q(id__in=[1, 2, 3])
+    )
+    assert compile_filter_expression(Order, "status:open,quantity>=3|id__in=1,2,3") is compiled
+    assert compile_filter_expression(Order, "amount__range=1,5.5") == Q(
+        amount__range=[Decimal("1"), Decimal("5.5")]
+    )
+    assert compile_filter_expression(Order, "status!=paid") == ~Q(status__icontains="paid")
+
+
+def test_compile_filter_expression_accepts_quoted_and_escaped_separators():
+    expected = Q(status__icontains="hello, world")
+    assert compile_filter_expression(Order, 'status:"hello, world"') == expected
+    assert compile_filter_expression(Order, "status:hello\\, world") == expected
+    assert compile_filter_expression(Order, 'status:"a|b",quantity>1|status:c\\|d') == (
+        (Q(status__icontains="a|b") & Q(quantity__gt=1)) | Q(status__icontains="c|d")
+    )
+    assert compile_filter_expression(Order, 'status:"say \\"hi\\""') == Q(status__icontains='say "hi"')
+    assert compile_filter_expression(Order, 'id__in="1",2') == Q(id__in=[1, 2])
+
+
+@pytest.mark.parametrize("expression", [
+    "missing=1",
+    "quantity>many",
+    "status__regex=.*",
+    "quantity__gt>1",
+    "amount__range=1",
+    "invalid",
+    "status=open,stray",
+    "status=hello, world",
+    'status="open',
+])
+def test_compile_filter_expression_rejects_invalid_input(expression):
+    with pytest.raises(BadRequestError):
+        compile_filter_expression(Order, expression)
+
+
+def test_compile_ordering_supports_multiple_keys_with_pk_tiebreaker():
+    assert compile_ordering(Order, "-amount,status") == ("-amount", "status", "pk")
+    assert compile_ordering(Order, "status", "desc") == ("-status", "-pk")
+    assert compile_ordering(Order, "-amount", "desc") == ("-amount", "-pk")
+    assert compile_ordering(Order, "-amount,status", "desc") == ("-amount", "-status", "-pk")
+    assert compile_ordering(TestModel, "category,-id") == ("category_id", "-id")
+    assert compile_ordering(Product, "sku") == ("sku",)
+
+
+def test_compile_ordering_validates_fields():
+    with pytest.raises(BadRequestError):
+        compile_ordering(Order, "missing")
+    with pytest.raises(BadRequestError):
+        compile_ordering(Order, "status", indexed_only=True)
+    assert compile_ordering(Product, "-sku,id", indexed_only=True) == ("-sku", "id")
+
+
+@isolate_apps("tests")
+def test_field_index_finds_indexed_fields():
+    class IndexedModel(models.Model):
+        code = models.CharField(max_length=10, unique=True)
+        owner = models.ForeignKey(Product, on_delete=models.CASCADE)
+        created = models.DateTimeField()
+        status = models.CharField(max_length=10)
+        note = models.TextField()
+
+        class Meta:
+            app_label = "tests"
+            indexes = [models.Index(fields=["-created", "status"])]
+
+    assert FieldIndex(IndexedModel).indexed == {"id", "code", "owner", "created"}
+
+
+@pytest.mark.django_db
+def test_apply_filters_combines_and_or_groups():
+    Order.objects.bulk_create([
+        Order(status="open", amount=Decimal("5"), quantity=1),
+        Order(status="open", amount=Decimal("5"), quantity=4),
+        Order(status="paid", amount=Decimal("50"), quantity=1),
+        Order(status="void", amount=Decimal("1"), quantity=1),
+    ])
+
+    filtered = apply_filters(
+        Order.objects.all(), Order, q="status=open,quantity>=3|amount>10", sort="amount", order="asc", kwargs={}
+    )
+
+    assert [(order.status, order.quantity) for order in filtered] == [("open", 4), ("paid", 1)]
+
+
+@pytest.mark.django_db
+def test_list_filter_matches_values_with_commas(client, create_test_model):
+    create_test_model(title="hello, world")
+    create_test_model(title="hello")
+
+    for q in ('title:"hello, world"', "title:hello\\, world"):
+        response = client.get("/api/test-models/", {"q": q})
+        assert response.status_code == 200
+        assert [item["title"] for item in response.json()["items"]] == ["hello, world"]
 
 
 @pytest.mark.django_db
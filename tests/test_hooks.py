@@ -2,9 +2,13 @@ import asyncio
 
 import pytest
 
+from lazy_ninja.base import BaseModelController
 from lazy_ninja.utils.hooks import (
+    BaseHookExecutor,
+    HookChain,
     SyncHookExecutor,
     AsyncHookExecutor,
+    compile_hook,
     execute_hook,
     execute_hook_async,
     get_hook,
@@ -61,3 +65,81 @@ def test_get_hook_falls_back_to_passed_hook():
     Controller.before_create.__is_default_hook__ = True
     hook = get_hook(controller, "before_create", passed_hook=fallback)
     assert hook is fallback
+
+
+def test_async_executor_awaits_coroutine_hooks_on_the_loop():
+    class Controller:
+        @classmethod
+        async def after_create(cls, request, instance):
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop()
+
+    executor = AsyncHookExecutor()
+
+    async def run():
+        return asyncio.get_running_loop(), await executor.execute(Controller.after_create, None, "obj")
+
+    loop, hook_loop = asyncio.run(run())
+    assert hook_loop is loop
+
+
+def test_executors_cache_the_resolved_dispatch():
+    async def hook(value):
+        return value * 2
+
+    sync_executor = SyncHookExecutor()
+    assert sync_executor.execute(hook, 2) == 4
+    assert sync_executor.execute(hook, 3) == 6
+    assert list(sync_executor._dispatch_cache) == [hook]
+
+    async_executor = AsyncHookExecutor()
+    assert asyncio.run(async_executor.execute(hook, 5)) == 10
+    assert async_executor._dispatch_cache[hook] == ("inline", hook)
+
+
+def test_hook_chain_reuses_its_executor_dispatch():
+    def first(request, payload, schema):
+        return payload + ["first"]
+
+    chain = compile_hook("before_create", [first, first])
+    executor = chain._executor
+    assert chain(None, [], None) == ["first", "first"]
+    dispatch = executor._dispatch_cache[chain]
+    assert chain(None, [], None) == ["first", "first"]
+    assert chain._executor is executor and executor._dispatch_cache[chain] is dispatch
+
+
+def test_base_hook_executor_is_abstract():
+    with pytest.raises(TypeError):
+        BaseHookExecutor()
+
+
+def test_compile_hook_drops_defaults_and_chains_the_rest():
+    def first(request, payload, schema):
+        return payload + ["first"]
+
+    def second(request, payload, schema):
+        return None  # keeps the payload
+
+    assert compile_hook("before_create", BaseModelController.before_create) is None
+    assert compile_hook("before_create", [None, first]) is first
+
+    chain = compile_hook("before_create", [first, BaseModelController.before_create, second, first])
+    assert isinstance(chain, HookChain) and chain.hooks == (first, second, first)
+
+    assert SyncHookExecutor().execute(chain, None, [], None) == ["first", "first"]
+    assert chain(None, ["direct"], None) == ["direct", "first", "first"]
+
+
+def test_async_executor_runs_mixed_hook_chains():
+    seen = []
+
+    async def audit(instance):
+        seen.append(("audit", instance))
+
+    def index(instance):
+        seen.append(("index", instance))
+
+    chain = compile_hook("after_delete", [audit, index])
+    assert asyncio.run(AsyncHookExecutor().execute(chain, "obj")) is None
+    assert seen == [("audit", "obj"), ("index", "obj")]
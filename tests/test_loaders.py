@@ -0,0 +1,94 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from lazy_ninja.loaders import BatchLoader, loader_for, use_read_alias
+
+from .models import Category, Product
+
+
+@pytest.fixture
+def categories(db):
+    return Category.objects.bulk_create([Category(name="books"), Category(name="games")])
+
+
+@pytest.mark.django_db
+def test_load_batches_keys_into_one_query(categories, django_assert_num_queries):
+    books, games = categories
+    request = SimpleNamespace()
+    loader = loader_for(request, Category)
+
+    refs = [loader.load(key) for key in (books.pk, games.pk, books.pk, 0)]
+    with django_assert_num_queries(1):
+        assert [ref.value for ref in refs] == [books, games, books, None]
+
+    # Memoized for the request, misses included.
+    assert loader_for(request, Category) is loader
+    with django_assert_num_queries(0):
+        assert loader.load_many([games.pk, 0]) == {games.pk: games, 0: None}
+
+
+@pytest.mark.django_db
+def test_loader_by_unique_field(django_assert_num_queries):
+    Product.objects.create(sku="a-1", name="A")
+    loader = BatchLoader(Product, "sku")
+
+    with django_assert_num_queries(1):
+        assert loader.load_many(["a-1", "b-2"])["a-1"].name == "A"
+
+    with pytest.raises(ImproperlyConfigured):
+        BatchLoader(Product, "name")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_aload_batches_concurrent_calls(monkeypatch):
+    books, games = Category.objects.bulk_create([Category(name="books"), Category(name="games")])
+    loader = BatchLoader(Category)
+    batches = []
+    fetch = loader._fetch
+    monkeypatch.setattr(loader, "_fetch", lambda keys: batches.append(set(keys)) or fetch(keys))
+
+    async def run():
+        return await asyncio.gather(*(loader.aload(key) for key in (books.pk, games.pk, 0)))
+
+    results = asyncio.run(run())
+    assert [getattr(result, "name", None) for result in results] == ["books", "games", None]
+    assert batches == [{books.pk, games.pk, 0}]
+
+    assert asyncio.run(loader.aload(books.pk)).name == "books"
+    assert len(batches) == 1
+
+
+@pytest.mark.django_db
+def test_load_normalizes_keys_with_the_field(categories, django_assert_num_queries):
+    books, games = categories
+    loader = BatchLoader(Category)
+
+    with django_assert_num_queries(1):
+        assert loader.load_many([str(books.pk), games.pk, "not-a-pk"]) == {
+            str(books.pk): books,
+            games.pk: games,
+            "not-a-pk": None,
+        }
+    with django_assert_num_queries(0):
+        assert loader.load(books.pk).value == books
+
+
+def test_loader_for_uses_the_routes_read_alias():
+    request = SimpleNamespace()
+    assert loader_for(request, Category).using is None
+
+    use_read_alias(request, "replica")
+    assert loader_for(request, Category).using == "replica"
+    assert loader_for(request, Category, using="default").using == "default"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_aload_keeps_dispatch_task_until_done():
+    books = Category.objects.create(name="books")
+    loader = BatchLoader(Category)
+
+    assert asyncio.run(loader.aload(str(books.pk))) == books
+    assert not loader._tasks
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+from django.db.models import Count
+from ninja import Schema
+from ninja.testing import TestAsyncClient, TestClient
+
+from .models import Category, TestModel
+
+
+class CategoryOut(Schema):
+    id: int
+    name: str
+    item_count: int = 0
+
+
+calls = []
+
+
+def count_items(request, rows):
+    calls.append(len(rows))
+    counts = dict(
+        TestModel.objects.filter(category__in=rows)
+        .values_list("category")
+        .annotate(n=Count("id"))
+    )
+    for category in rows:
+        category.item_count = counts.get(category.pk, 0)
+
+
+CATEGORY_ROUTES = {"model": Category, "base_url": "/categories", "list_schema": CategoryOut}
+
+
+@pytest.fixture
+def categories(db):
+    books, games, empty = Category.objects.bulk_create(
+        [Category(name="books"), Category(name="games"), Category(name="empty")]
+    )
+    TestModel.objects.bulk_create(
+        [TestModel(title="a", category=books), TestModel(title="b", category=books), TestModel(title="c", category=games)]
+    )
+    calls.clear()
+    return books, games, empty
+
+
+@pytest.mark.django_db
+def test_post_list_runs_once_per_page(build_api, categories, django_assert_num_queries):
+    client = TestClient(build_api(
+        "post-list-sync", **CATEGORY_ROUTES, conditional_requests=False, post_list=count_items
+    ))
+
+    # count, page, one enrichment query
+    with django_assert_num_queries(3):
+        response = client.get("/categories/?limit=2")
+
+    assert response.status_code == 200
+    assert [(row["name"], row["item_count"]) for row in response.json()["items"]] == [("books", 2), ("games", 1)]
+    assert calls == [2]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_post_list_runs_once_per_page(build_api, categories):
+    client = TestAsyncClient(build_api(
+        "post-list-async", **CATEGORY_ROUTES, is_async=True, conditional_requests=False, post_list=count_items
+    ))
+
+    response = asyncio.run(client.get("/categories/"))
+
+    assert response.status_code == 200
+    assert [row["item_count"] for row in response.json()["items"]] == [2, 1, 0]
+    assert calls == [3]
+
+
+@pytest.mark.django_db
+def test_post_list_return_value_replaces_the_rows(build_api, categories):
+    def names_only(request, rows):
+        return [{"id": row.pk, "name": row.name.upper()} for row in rows]
+
+    api = build_api("post-list-replace", **CATEGORY_ROUTES, post_list=names_only)
+
+    response = TestClient(api).get("/categories/?limit=1")
+    books = categories[0]
+    assert response.json()["items"] == [{"id": books.pk, "name": "BOOKS", "item_count": 0}]
@@ -0,0 +1,37 @@
+import pytest
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from ninja.testing import TestClient
+
+from lazy_ninja.handlers.read_routing import PRIMARY_COOKIE
+
+from .models import Note
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+def test_reads_use_replica_and_writes_pin_the_client_to_primary(build_api):
+    note = Note.objects.create(title="first")
+    client = TestClient(build_api("read-replica", read_db="replica"))
+
+    with CaptureQueriesContext(connections["replica"]) as replica:
+        assert client.get("/notes/").status_code == 200
+        assert client.get(f"/notes/{note.pk}").status_code == 200
+    assert len(replica.captured_queries) == 3
+
+    response = client.post("/notes/", json={"title": "second"})
+    assert response.status_code == 200
+    assert response.cookies[PRIMARY_COOKIE]["max-age"] == 5
+
+    with CaptureQueriesContext(connections["replica"]) as replica:
+        client.get("/notes/", COOKIES={PRIMARY_COOKIE: "1"})
+        client.get(f"/notes/{note.pk}", headers={"X-Read-Primary": "1"})
+    assert replica.captured_queries == []
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+def test_read_your_writes_can_be_disabled(build_api):
+    client = TestClient(build_api("read-replica-nosticky", read_db="replica", read_your_writes=0))
+    response = client.post("/notes/", json={"title": "x"})
+
+    assert response.status_code == 200
+    assert PRIMARY_COOKIE not in response.cookies
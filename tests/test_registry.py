@@ -2,7 +2,8 @@ import sys
 
 from django.apps import apps
 
-from lazy_ninja.registry import ModelRegistry, controller_for
+from lazy_ninja.base import BaseModelController
+from lazy_ninja.registry import ControllerStack, ModelRegistry, controller_for
 
 
 def reset_registry(monkeypatch):
@@ -31,6 +32,36 @@ def test_controller_for_decorator_registers(monkeypatch):
     assert ModelRegistry.get_controller("Widget") is WidgetController
 
 
+def test_controller_for_stacks_controllers(monkeypatch):
+    reset_registry(monkeypatch)
+
+    @controller_for("Widget")
+    class AuditController(BaseModelController):
+        @classmethod
+        def after_create(cls, request, instance):
+            instance.append("audit")
+
+    @controller_for("Widget", stack=True)
+    class IndexController(BaseModelController):
+        @classmethod
+        def after_create(cls, request, instance):
+            instance.append("index")
+
+        @classmethod
+        def pre_list(cls, request, queryset):
+            return queryset
+
+    stacked = ModelRegistry.get_controller("Widget")
+    assert isinstance(stacked, ControllerStack)
+    assert stacked.controllers == [AuditController, IndexController]
+    assert stacked.pre_list.__func__ is IndexController.pre_list.__func__
+    assert stacked.before_delete is None
+
+    calls = []
+    stacked.after_create(None, calls)
+    assert calls == ["audit", "index"]
+
+
 def test_discover_controllers_imports_modules(tmp_path, monkeypatch):
     reset_registry(monkeypatch)
     monkeypatch.setattr(ModelRegistry, "_discovered", False)
@@ -0,0 +1,77 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from ninja import NinjaAPI, Schema
+
+from lazy_ninja import renderers
+from lazy_ninja.builder import DynamicAPI
+from lazy_ninja.renderers import LazyNinjaJSONRenderer, resolve_json_backend
+
+
+class Item(Schema):
+    name: str
+
+
+PAYLOAD = {
+    "when": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+    "day": datetime.date(2024, 5, 1),
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "price": Decimal("9.90"),
+    "item": Item(name="widget"),
+}
+
+
+def _backend_param(name):
+    # The fast backends are optional; their cases skip when not installed.
+    missing = name != "json" and getattr(renderers, name) is None
+    return pytest.param(
+        name,
+        marks=pytest.mark.skipif(missing, reason=f"{name} is not installed"),
+    )
+
+
+@pytest.mark.parametrize("backend", [_backend_param(name) for name in ("orjson", "msgspec", "json")])
+def test_renderer_encodes_common_types(backend):
+    body = json.loads(LazyNinjaJSONRenderer(backend).render(None, PAYLOAD, response_status=200))
+
+    assert body["when"].startswith("2024-05-01T12:30:15.123")
+    assert body["when"].endswith("Z")
+    assert body["day"] == "2024-05-01"
+    assert body["id"] == "12345678-1234-5678-1234-567812345678"
+    assert body["price"] == "9.90"
+    assert body["item"] == {"name": "widget"}
+
+
+def test_auto_backend_falls_back_when_libraries_are_missing(monkeypatch):
+    monkeypatch.setattr(renderers, "orjson", None)
+    monkeypatch.setattr(renderers, "msgspec", None)
+    assert resolve_json_backend("auto") == "json"
+
+    with pytest.raises(ImproperlyConfigured):
+        resolve_json_backend("orjson")
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ImproperlyConfigured):
+        resolve_json_backend("yaml")
+
+
+def test_dynamic_api_installs_renderer_only_when_enabled():
+    api = NinjaAPI(urls_namespace="renderer-default")
+    DynamicAPI(api)
+    assert not isinstance(api.renderer, LazyNinjaJSONRenderer)
+
+    api = NinjaAPI(urls_namespace="renderer-fast")
+    DynamicAPI(api, json_backend="auto")
+    assert isinstance(api.renderer, LazyNinjaJSONRenderer)
+    assert api.renderer.backend == resolve_json_backend("auto")
+
+
+def test_auto_backend_prefers_installed_fast_library(monkeypatch):
+    pytest.importorskip("msgspec")
+    monkeypatch.setattr(renderers, "orjson", None)
+    assert resolve_json_backend("auto") == "msgspec"
@@ -1,6 +1,10 @@
 import pytest
+from django.core.exceptions import ImproperlyConfigured
+from ninja import NinjaAPI
 
-from tests.models import TestModel
+from lazy_ninja.router.sync_router import SyncModelRouter
+from lazy_ninja.utils import generate_schema
+from tests.models import Country, Product, TestModel
 
 @pytest.mark.django_db
 def test_list_items(client, create_test_model):
@@ -75,4 +79,75 @@ def test_delete_item(client, create_test_model):
     url = f"/api/test-models/{model.id}"
     response = client.delete(url)
     assert response.status_code == 200
-    assert TestModel.objects.count() == 0
\ No newline at end of file
+    assert TestModel.objects.count() == 0
+
+@pytest.mark.django_db
+def test_missing_item_returns_404_without_raising(client, monkeypatch):
+    """Tests that missing ids get the prebuilt 404 instead of going through handle_exception"""
+    def fail(exc):
+        raise AssertionError(f"unexpected exception path: {exc!r}")
+
+    monkeypatch.setattr("lazy_ninja.router.sync_router.handle_exception", fail)
+    url = "/api/test-models/999"
+    for response in (
+        client.get(url),
+        client.patch(url, {"title": "x"}, content_type="application/json"),
+        client.delete(url),
+    ):
+        assert response.status_code == 404
+        assert response.json() == {
+            "error": {
+                "status_code": 404,
+                "message": "No TestModel matches the given query.",
+                "type": "NotFoundError",
+            }
+        }
+
+
+@pytest.mark.django_db
+def test_invalid_ids_are_rejected_before_querying(client, django_assert_num_queries):
+    """Tests that malformed ids fail path validation and out-of-range ids get 404 without a query"""
+    with django_assert_num_queries(0):
+        assert client.get("/api/test-models/abc").status_code == 422
+        assert client.get(f"/api/test-models/{2 ** 70}").status_code == 404
+
+
+@pytest.mark.django_db
+def test_lookup_field_routes(client, django_assert_num_queries):
+    """Tests detail, update and delete routes addressed by a unique lookup field"""
+    product = Product.objects.create(sku="desk-01", name="Desk")
+
+    with django_assert_num_queries(1):
+        response = client.get("/api/products/desk-01")
+    assert response.status_code == 200
+    assert response.json()["id"] == product.id
+
+    response = client.patch("/api/products/desk-01", {"name": "Standing desk"}, content_type="application/json")
+    assert response.status_code == 200
+    assert Product.objects.get(pk=product.pk).name == "Standing desk"
+
+    assert client.get(f"/api/products/{product.id}").status_code == 404
+    assert client.delete("/api/products/desk-01").status_code == 200
+    assert not Product.objects.exists()
+
+
+def test_lookup_field_must_be_unique():
+    """Tests that a non-unique lookup field is rejected at registration"""
+    schema = generate_schema(Country)
+    with pytest.raises(ImproperlyConfigured):
+        SyncModelRouter(NinjaAPI(), Country, "/countries", schema, schema, lookup_field="name")
+
+
+@pytest.mark.django_db
+def test_list_filter_expression(client):
+    """Tests OR filters on the list route and the 400 returned for invalid ones"""
+    Product.objects.bulk_create([
+        Product(sku="a", name="Lamp"), Product(sku="b", name="Desk"), Product(sku="c", name="Chair"),
+    ])
+
+    response = client.get("/api/products/", {"q": "name:lamp|sku__in=b,x", "sort": "sku"})
+    assert response.status_code == 200
+    assert [item["sku"] for item in response.json()["items"]] == ["a", "b"]
+
+    response = client.get("/api/products/", {"q": "price>10"})
+    assert response.status_code == 400
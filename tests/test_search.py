@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from ninja import NinjaAPI
+from ninja.testing import TestAsyncClient
+
+from lazy_ninja.core import register_model_routes
+from lazy_ninja.handlers.search import SearchHandler, _fts5_query
+from lazy_ninja.helpers import FieldIndex
+from lazy_ninja.pagination import get_pagination_strategy
+from lazy_ninja.utils import generate_schema
+
+from .models import Note, Product
+
+
+@pytest.fixture
+def products(db):
+    return Product.objects.bulk_create([
+        Product(sku="red-chair", name="Red wooden chair"),
+        Product(sku="blue-chair", name="Blue metal chair"),
+        Product(sku="red-table", name="Red table"),
+    ])
+
+
+@pytest.mark.django_db
+def test_search_falls_back_to_icontains_on_every_word(client, products):
+    response = client.get("/api/products/?search=red chair")
+
+    assert response.status_code == 200
+    assert [item["sku"] for item in response.json()["items"]] == ["red-chair"]
+
+    response = client.get("/api/products/?search=CHAIR&sort=sku")
+    assert [item["sku"] for item in response.json()["items"]] == ["blue-chair", "red-chair"]
+
+
+@pytest.mark.django_db
+def test_search_without_configuration_is_rejected(client):
+    response = client.get("/api/notes/?search=anything")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_search_uses_sqlite_fts5_table_when_present():
+    Note.objects.bulk_create([Note(title="quarterly report"), Note(title="weekly summary")])
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE VIRTUAL TABLE tests_note_fts USING fts5(title)")
+        cursor.execute("INSERT INTO tests_note_fts(rowid, title) SELECT id, title FROM tests_note")
+
+    handler = SearchHandler(Note, FieldIndex(Note), ["title"])
+    matches = handler.apply(Note.objects.all(), "quart")
+
+    assert handler.backend_for("default") == "fts5"
+    assert [note.title for note in matches] == ["quarterly report"]
+
+
+def test_fts5_query_quotes_words_and_prefixes_the_last():
+    assert _fts5_query('say "hi" the') == '"say" """hi""" "the"*'
+
+
+@pytest.mark.parametrize("config", [["updated_at"], ["missing"], [], {"fields": ["title"], "mode": "fuzzy"}])
+def test_search_config_is_validated(config):
+    with pytest.raises(ImproperlyConfigured):
+        SearchHandler(Note, FieldIndex(Note), config)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_list_applies_search():
+    Note.objects.bulk_create([Note(title="alpha"), Note(title="beta")])
+    api = NinjaAPI(urls_namespace="search-async")
+    schema = generate_schema(Note)
+    register_model_routes(
+        api=api,
+        model=Note,
+        base_url="/notes",
+        list_schema=schema,
+        detail_schema=schema,
+        pagination_strategy=get_pagination_strategy("limit-offset"),
+        is_async=True,
+        search_fields=["title"],
+    )
+
+    response = asyncio.run(TestAsyncClient(api).get("/notes/?search=alp"))
+
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["items"]] == ["alpha"]
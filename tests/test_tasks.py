@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+from ninja.testing import TestClient
+
+from lazy_ninja.tasks import ImmediateTaskRunner, TaskRunner, ThreadPoolTaskRunner, set_task_runner
+from lazy_ninja.utils import background
+
+from .models import Note
+
+
+class RecordingRunner(TaskRunner):
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, func, *args, **kwargs):
+        self.jobs.append((func, args, kwargs))
+
+
+@pytest.fixture
+def runner():
+    runner = RecordingRunner()
+    previous = set_task_runner(runner)
+    yield runner
+    set_task_runner(previous)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_background_hooks_are_submitted_after_commit(runner, build_api):
+    @background
+    def after_create(request, instance):
+        return "ignored"
+
+    client = TestClient(build_api("tasks-submit", atomic_writes=True, after_create=after_create))
+    response = client.post("/notes/", json={"title": "queued"})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "queued"
+    [(func, args, kwargs)] = runner.jobs
+    assert func is after_create and args[1].title == "queued" and kwargs == {}
+
+
+@pytest.mark.django_db
+def test_background_hooks_are_dropped_on_rollback(runner, build_api):
+    @background
+    def after_update(request, instance):
+        pass
+
+    client = TestClient(build_api("tasks-rollback", atomic_writes=True, after_update=after_update))
+    note = Note.objects.create(title="before")
+
+    # The test transaction never commits, so nothing is submitted.
+    assert client.patch(f"/notes/{note.pk}", json={"title": "after"}).status_code == 200
+    assert runner.jobs == []
+
+
+def test_immediate_runner_runs_inline():
+    seen = []
+    ImmediateTaskRunner().submit(seen.append, "done")
+    assert seen == ["done"]
+
+
+def test_thread_pool_runner_logs_failures(caplog):
+    ran = threading.Event()
+
+    def fails():
+        ran.set()
+        raise ValueError("boom")
+
+    pool = ThreadPoolTaskRunner(max_workers=1)
+    pool.submit(fails)
+    pool.shutdown()
+
+    assert ran.is_set()
+    assert "Background hook" in caplog.text
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from ninja import NinjaAPI, Schema
+from ninja.operation import Operation
+from ninja.testing import TestAsyncClient, TestClient
+
+from lazy_ninja.router import base as router_base
+from lazy_ninja.router.sync_router import SyncModelRouter
+from lazy_ninja.utils import generate_schema
+
+from .models import Note
+
+NoteSchema = generate_schema(Note)
+
+
+@pytest.fixture
+def rendered_results(monkeypatch):
+    """Record whether each view result was already a rendered response when it reached ninja."""
+    seen = []
+    original = Operation._result_to_response
+
+    def spy(self, request, result, temporal_response):
+        seen.append(hasattr(result, "status_code"))
+        return original(self, request, result, temporal_response)
+
+    monkeypatch.setattr(Operation, "_result_to_response", spy)
+    return seen
+
+
+@pytest.mark.django_db
+def test_trusted_routes_match_validated_output(build_api, rendered_results):
+    note = Note.objects.create(title="first")
+    trusted = TestClient(build_api("trusted-sync", trusted_output=True))
+    validated = TestClient(build_api("validated-sync"))
+
+    for path in ("/notes/", f"/notes/{note.pk}"):
+        expected = validated.get(path)
+        rendered_results.clear()
+        response = trusted.get(path)
+
+        assert response.status_code == 200
+        assert response.json() == expected.json()
+        assert response["ETag"] == expected["ETag"]
+        assert rendered_results == [True]
+
+
+@pytest.mark.django_db
+def test_trusted_create_renders_serializer_output(build_api, rendered_results):
+    response = TestClient(build_api("trusted-create", trusted_output=True)).post("/notes/", json={"title": "new"})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "new"
+    assert rendered_results == [True]
+
+
+def test_trusted_output_keeps_openapi_schema(build_api):
+    schema = build_api("trusted-openapi", trusted_output=True).get_openapi_schema(path_prefix="")
+    detail = schema["paths"]["/notes/{item_id}"]["get"]["responses"][200]
+
+    assert detail["content"]["application/json"]["schema"]["$ref"].endswith("/NoteSchema")
+
+
+def test_trusted_output_requires_matching_schema_and_default_response():
+    def router(**kwargs):
+        options = {"list_schema": NoteSchema, "detail_schema": NoteSchema, **kwargs}
+        return SyncModelRouter(NinjaAPI(), Note, "/notes", trusted_output=True, **options)
+
+    class CustomSchema(Schema):
+        id: int
+        title: str
+        updated_at: str
+
+    assert router().trusted_list and router().trusted_detail
+    assert not router(list_schema=CustomSchema).trusted_list
+    assert not router(detail_schema=generate_schema(Note, exclude=["title"])).trusted_detail
+    assert not router(custom_response=lambda request, data: data).trusted_detail
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_list_serializes_only_the_requested_page(build_api, monkeypatch):
+    Note.objects.bulk_create([Note(title=f"note {i}") for i in range(5)])
+    calls = []
+    original = router_base.serialize_model_instance
+
+    def counting(instance):
+        calls.append(instance.pk)
+        return original(instance)
+
+    monkeypatch.setattr(router_base, "serialize_model_instance", counting)
+    client = TestAsyncClient(build_api("trusted-async", is_async=True, trusted_output=True))
+
+    response = asyncio.run(client.get("/notes/?limit=2&sort=id"))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 5
+    assert [item["title"] for item in body["items"]] == ["note 0", "note 1"]
+    assert len(calls) == 2
@@ -6,7 +6,17 @@ from ninja import NinjaAPI
 api = NinjaAPI()
 register_auth_routes(api)
 
-dynamic_api = DynamicAPI(api, is_async=False)  
+dynamic_api = DynamicAPI(
+    api,
+    is_async=False,
+    cache_config={"Country": {"backend": "local"}},
+    json_backend="auto",
+    export_routes=True,
+    aggregate_routes=True,
+    import_routes=True,
+    lookup_field={"Product": "sku"},
+    search_fields={"Product": ["name", "sku"]},
+)
 dynamic_api.register_all_models()
 
 urlpatterns = [